@@ -0,0 +1,115 @@
+from datetime import timedelta
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count, JSONField, Max, OuterRef, Q, Subquery
+from django.db.models.functions import JSONObject
+from django.utils import timezone
+
+from estate.serializers import EstateSerializer
+from habit_tracker_rpg.fast_list import fast_list_data
+from inventory.models import UserItem
+from tasks.enums import HabitType, TasksStatus
+from tasks.models import Daily, Habit, Todo
+from tasks.pagination import KeysetPagination
+from tasks.serializers import DailySerializer, TodoSerializer
+from users.models import User
+from users.serializers import UserReadSerializer
+
+# Same first page as /api/tasks/todos/?filter=active
+DASHBOARD_TODO_LIMIT = KeysetPagination.page_size
+EMPTY_HABIT_SUMMARY = {"total": 0, "good": 0, "bad": 0, "completed_today": 0, "best_streak": 0}
+
+# Building a ModelSerializer's fields costs more than rendering a few rows, so the
+# context-free serializers are built once and reused for every request.
+ESTATE_SERIALIZER = EstateSerializer()
+DAILY_SERIALIZER = DailySerializer()
+TODO_SERIALIZER = TodoSerializer()
+
+
+def _habit_summary(today):
+    """One-row aggregate over the user's habits, as a JSON object."""
+    return (
+        Habit.objects.filter(user=OuterRef("pk"))
+        .order_by()
+        .values("user")
+        .annotate(
+            summary=JSONObject(
+                total=Count("pk"),
+                good=Count("pk", filter=Q(type=HabitType.GOOD)),
+                bad=Count("pk", filter=Q(type=HabitType.BAD)),
+                completed_today=Count("pk", filter=Q(last_completed_on=today)),
+                # streaks are only current if the habit was completed today or yesterday
+                best_streak=Max(
+                    "current_streak", filter=Q(last_completed_on__gte=today - timedelta(days=1))
+                ),
+            )
+        )
+        .values("summary")
+    )
+
+
+def _equipped_items():
+    return ArraySubquery(
+        UserItem.objects.filter(user=OuterRef("pk"), is_equipped=True)
+        .order_by("id")
+        .values(
+            json=JSONObject(
+                id="id",
+                quantity="quantity",
+                item=JSONObject(
+                    id="item_id",
+                    name="item__name",
+                    type="item__type",
+                    rarity="item__rarity",
+                    level="item__level",
+                    bonuses="item__bonuses",
+                ),
+            )
+        )
+    )
+
+
+def _related(obj, name):
+    """A reverse one-to-one loaded by select_related, or None if the row is missing."""
+    try:
+        return getattr(obj, name)
+    except ObjectDoesNotExist:
+        return None
+
+
+def build_dashboard(user, request=None):
+    """
+    Everything the home screen shows, in three queries:
+
+    1. the user with their character and estate (joined), the habit summary
+       (an aggregate subquery) and the equipped items (an array subquery),
+    2. the dailies still to do in their current period (status "active"),
+    3. the first DASHBOARD_TODO_LIMIT active todos, in the todo list's order.
+    """
+    today = timezone.localdate()
+    profile = (
+        User.objects.select_related("character", "estate")
+        .annotate(
+            habit_summary=Subquery(_habit_summary(today), output_field=JSONField()),
+            equipped_items=_equipped_items(),
+        )
+        .get(pk=user.pk)
+    )
+    estate = _related(profile, "estate")
+
+    dailies = Daily.objects.filter(user=user, status=TasksStatus.ACTIVE).order_by(
+        "-created_at", "-id"
+    )
+    todos = Todo.objects.filter(user=user, is_completed=False).order_by(
+        "due_date", "-created_at", "-id"
+    )
+    habit_summary = profile.habit_summary or EMPTY_HABIT_SUMMARY
+    return {
+        "profile": UserReadSerializer(profile, context={"request": request}).data,
+        "estate": ESTATE_SERIALIZER.to_representation(estate) if estate is not None else None,
+        "equipped_items": profile.equipped_items,
+        "habits": {**habit_summary, "best_streak": habit_summary["best_streak"] or 0},
+        "dailies": fast_list_data(DAILY_SERIALIZER, dailies),
+        "todos": fast_list_data(TODO_SERIALIZER, todos[:DASHBOARD_TODO_LIMIT]),
+    }
@@ -0,0 +1,26 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api_client():
+    """Returns an unauthenticated API client"""
+    return APIClient()
+
+
+@pytest.fixture
+def user(db):
+    """Creates and returns a test user"""
+    return User.objects.create_user(
+        username="testuser", email="test@example.com", password="TestPass123!"
+    )
+
+
+@pytest.fixture
+def authenticated_client(user, api_client):
+    """Returns an API client authenticated as the test user"""
+    api_client.force_authenticate(user=user)
+    return api_client
@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from estate.models import Estate
+from inventory.models import Item, UserItem
+from tasks.enums import HabitType, TasksStatus
+from tasks.models import Daily, Habit, Todo
+from users.models import Character
+
+
+@pytest.fixture
+def home(user):
+    """A user with a character, estate, items and tasks of every kind"""
+    today = timezone.localdate()
+    Character.objects.create(user=user, current_hp=7)
+    Estate.objects.create(user=user, wood=12)
+    sword = Item.objects.create(name="Sword", description="Sharp", value=10, type="weapon")
+    shield = Item.objects.create(name="Shield", description="Round", value=5, type="armor")
+    UserItem.objects.create(user=user, item=sword, is_equipped=True)
+    UserItem.objects.create(user=user, item=shield)
+
+    Habit.objects.create(
+        user=user, name="Read", type=HabitType.GOOD, current_streak=3, last_completed_on=today
+    )
+    Habit.objects.create(
+        user=user,
+        name="Run",
+        type=HabitType.GOOD,
+        current_streak=9,
+        last_completed_on=today - timedelta(days=5),
+    )
+    Habit.objects.create(user=user, name="Smoke", type=HabitType.BAD)
+
+    Daily.objects.create(user=user, name="Stretch")
+    Daily.objects.create(user=user, name="Done", status=TasksStatus.COMPLETED)
+    Daily.objects.create(user=user, name="Paused", status=TasksStatus.INACTIVE)
+
+    Todo.objects.create(user=user, name="Later", due_date=today + timedelta(days=9))
+    Todo.objects.create(user=user, name="Soon", due_date=today + timedelta(days=1))
+    Todo.objects.create(
+        user=user, name="Finished", due_date=today + timedelta(days=1), is_completed=True
+    )
+    return user
+
+
+@pytest.mark.django_db
+def test_dashboard_in_three_queries(authenticated_client, home):
+    with CaptureQueriesContext(connection) as context:
+        response = authenticated_client.get(reverse("core-dashboard"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(context.captured_queries) == 3
+
+    data = response.data
+    assert data["profile"]["username"] == "testuser"
+    assert data["profile"]["character"]["current_hp"] == 7
+    assert data["estate"]["wood"] == 12
+    assert [entry["item"]["name"] for entry in data["equipped_items"]] == ["Sword"]
+    assert data["habits"] == {
+        "total": 3,
+        "good": 2,
+        "bad": 1,
+        "completed_today": 1,
+        "best_streak": 3,
+    }
+    assert [daily["name"] for daily in data["dailies"]] == ["Stretch"]
+    assert [todo["name"] for todo in data["todos"]] == ["Soon", "Later"]
+
+
+@pytest.mark.django_db
+def test_dashboard_for_new_user(authenticated_client):
+    response = authenticated_client.get(reverse("core-dashboard"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["profile"]["character"] is None
+    assert response.data["estate"] is None
+    assert response.data["equipped_items"] == []
+    assert response.data["habits"]["total"] == 0
+    assert response.data["habits"]["best_streak"] == 0
+    assert response.data["dailies"] == [] and response.data["todos"] == []
+
+
+@pytest.mark.django_db
+def test_dashboard_requires_auth(api_client):
+    response = api_client.get(reverse("core-dashboard"))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
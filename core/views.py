@@ -0,0 +1,17 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.dashboard import build_dashboard
+
+
+class DashboardView(APIView):
+    """
+    Home screen data in one request: profile and character, estate, equipped items,
+    habit summary, dailies to do and active todos (three queries in total).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(build_dashboard(request.user, request))
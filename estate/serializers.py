@@ -1,8 +1,9 @@
 from rest_framework import serializers
+from habit_tracker_rpg.sparse_fields import SparseFieldsetMixin
 from estate.models import Estate
 
 
-class EstateSerializer(serializers.ModelSerializer):
+class EstateSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for estate data. Ensures user linkage and safe updates."""
 
     class Meta:
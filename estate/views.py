@@ -1,9 +1,10 @@
 from rest_framework import permissions, viewsets
+from habit_tracker_rpg.sparse_fields import SparseFieldsetViewMixin
 from estate.models import Estate
 from estate.serializers import EstateSerializer
 
 
-class EstateViewSet(viewsets.ModelViewSet):
+class EstateViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """ViewSet for managing user estate."""
 
     serializer_class = EstateSerializer
@@ -0,0 +1,13 @@
+from django.conf import settings
+
+# Cache backends that live inside one process: entries written by one worker are
+# invisible to the others.
+PROCESS_LOCAL_CACHES = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+def is_shared_cache(alias="default"):
+    """True if the cache `alias` is shared by all processes (e.g. Redis, Memcached)."""
+    return settings.CACHES[alias]["BACKEND"] not in PROCESS_LOCAL_CACHES
@@ -0,0 +1,167 @@
+"""
+Fast path for list endpoints: rows are read with `values()` and turned into the
+serializer's output by converters compiled once per request from the serializer's
+fields, instead of instantiating model objects and running every field's
+get_attribute/to_representation through the serializer. The output is identical:
+fields whose representation is not a plain copy of the column value still use the
+DRF field's own to_representation.
+"""
+
+from operator import itemgetter
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.response import Response
+
+# Fields whose to_representation returns the database value unchanged
+IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+)
+
+
+def _model_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _converted(column, convert):
+    def get(row):
+        value = row[column]
+        return None if value is None else convert(value)
+
+    return get
+
+
+def _computed(columns, convert):
+    def get(row):
+        return convert(*(row[column] for column in columns))
+
+    return get
+
+
+def _nested(pk_column, build):
+    def get(row):
+        return None if row[pk_column] is None else build(row)
+
+    return get
+
+
+def _builder(parts):
+    def build(row):
+        return {key: get(row) for key, get in parts}
+
+    return build
+
+
+def compile_row_builder(serializer, prefix=""):
+    """
+    Compile `serializer` into (values() column names, build(row) -> dict), or None if
+    one of its fields can't be represented from plain column values (model
+    properties, reverse relations, files, method fields without a converter).
+
+    SerializerMethodFields are supported when the serializer lists their columns in
+    `Meta.field_sources` and has a `get_<field>_converter()` method returning a
+    function of those column values. Nested serializers on forward foreign keys are
+    compiled recursively.
+    """
+    model = serializer.Meta.model
+    sources = getattr(serializer.Meta, "field_sources", {})
+    columns, parts = [], []
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        if isinstance(field, serializers.SerializerMethodField):
+            make_converter = getattr(serializer, f"get_{name}_converter", None)
+            if make_converter is None or name not in sources:
+                return None
+            field_columns = [prefix + column for column in sources[name]]
+            columns.extend(field_columns)
+            parts.append((name, _computed(field_columns, make_converter())))
+            continue
+
+        if field.source == "*" or "." in field.source:
+            return None
+        model_field = _model_field(model, field.source)
+        if model_field is None or not model_field.concrete:
+            return None
+        column = prefix + field.source
+
+        if isinstance(field, serializers.ListSerializer):
+            return None
+        if isinstance(field, serializers.BaseSerializer):
+            if not model_field.many_to_one and not model_field.one_to_one:
+                return None
+            nested = compile_row_builder(field, f"{column}__")
+            if nested is None:
+                return None
+            nested_columns, nested_build = nested
+            columns.append(column)
+            columns.extend(nested_columns)
+            parts.append((name, _nested(column, nested_build)))
+            continue
+
+        columns.append(column)
+        if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+            parts.append((name, itemgetter(column)))
+        elif isinstance(field, serializers.RelatedField):
+            return None
+        elif isinstance(field, IDENTITY_FIELDS):
+            parts.append((name, itemgetter(column)))
+        elif isinstance(field, serializers.FileField):
+            return None
+        else:
+            parts.append((name, _converted(column, field.to_representation)))
+
+    return list(dict.fromkeys(columns)), _builder(parts)
+
+
+def fast_list_data(serializer, queryset):
+    """
+    Serialize `queryset` like `serializer` (e.g. `HabitSerializer()`) would with
+    many=True, through the compiled fast path. Returns None if it can't be compiled.
+    """
+    compiled = compile_row_builder(serializer)
+    if compiled is None:
+        return None
+    columns, build = compiled
+    return [build(row) for row in queryset.values(*columns)]
+
+
+class FastListMixin:
+    """
+    Opt-in ViewSet mixin that renders `list` through the compiled values() fast
+    path, falling back to the regular serializer when it can't be compiled. Works
+    with KeysetPagination and ?fields= (only the requested fields are compiled).
+    """
+
+    def list(self, request, *args, **kwargs):
+        compiled = compile_row_builder(self.get_serializer())
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+        columns, build = compiled
+
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*dict.fromkeys([*columns, *self._paginator_columns(queryset)]))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response([build(row) for row in page])
+        return Response([build(row) for row in rows])
+
+    def _paginator_columns(self, queryset):
+        """Ordering columns and annotations the paginator reads from each row."""
+        model = queryset.model
+        names = [model._meta.pk.name]
+        for name in [*queryset.query.order_by, *(getattr(self, "ordering", None) or [])]:
+            if not isinstance(name, str):
+                continue
+            name = name.lstrip("-")
+            if name in queryset.query.annotations or _model_field(model, name) is not None:
+                names.append(name)
+        return names
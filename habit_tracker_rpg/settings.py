@@ -25,6 +25,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 
     "rest_framework",
     "django_filters",
@@ -34,6 +35,7 @@ INSTALLED_APPS = [
     "tasks.apps.TasksConfig",
     "inventory.apps.InventoryConfig",
     "estate.apps.EstateConfig",
+    "core.apps.CoreConfig",
 ]
 
 # --- MIDDLEWARE ---
@@ -111,7 +113,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # --- REST FRAMEWORK ---
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -140,8 +142,46 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
 }
 
+# --- AUTH USER CACHE ---
+# CachedJWTAuthentication resolves users from a per-process LRU, then the shared cache
+# (skipped when the cache backend is per-process, e.g. LocMem).
+# The local TTL bounds how long other processes may serve a changed or deactivated user.
+AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", "1024"))
+AUTH_USER_CACHE_LOCAL_TTL = float(os.getenv("AUTH_USER_CACHE_LOCAL_TTL", "30"))
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "300"))
+
+# --- TOKEN BLACKLIST FILTER ---
+# Refresh and logout check a per-process Bloom filter of blacklisted JTIs first and only
+# query BlacklistedToken on a possible hit. The filter is rebuilt from the table every
+# REBUILD_INTERVAL seconds; capacity grows to twice the blacklist size on rebuild.
+# Other processes learn about new revocations through the cache, so the filter is only
+# used with a cache shared by all processes (e.g. Redis), never with LocMem or dummy.
+TOKEN_BLACKLIST_FILTER = os.getenv("TOKEN_BLACKLIST_FILTER", "false").lower() == "true"
+TOKEN_BLACKLIST_FILTER_CAPACITY = int(os.getenv("TOKEN_BLACKLIST_FILTER_CAPACITY", "100000"))
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = float(os.getenv("TOKEN_BLACKLIST_FILTER_ERROR_RATE", "0.01"))
+TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL = float(
+    os.getenv("TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL", "300")
+)
+
 # --- STATICFILES FINDERS ---
 STATICFILES_FINDERS = [
     "django.contrib.staticfiles.finders.FileSystemFinder",
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
 ]
+
+# --- TASK HISTORY ---
+# Completions are buffered in memory and written with bulk_create (write-behind).
+TASK_COMPLETION_BUFFER_SIZE = int(os.getenv("TASK_COMPLETION_BUFFER_SIZE", "500"))
+TASK_COMPLETION_BUFFER_MAX_AGE = float(os.getenv("TASK_COMPLETION_BUFFER_MAX_AGE", "5"))
+# Failed writes are logged and retried; rows are dropped after this many failed flushes.
+TASK_COMPLETION_BUFFER_MAX_RETRIES = int(os.getenv("TASK_COMPLETION_BUFFER_MAX_RETRIES", "3"))
+
+# --- TASK JOBS ---
+# Good habits not completed for this many days lose one strength level each night.
+HABIT_DECAY_AFTER_DAYS = int(os.getenv("HABIT_DECAY_AFTER_DAYS", "3"))
+# Responses of completion requests sent with an Idempotency-Key are replayed for this long.
+IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", str(24 * 60 * 60)))
+# Completed todos older than this are moved to the ArchivedTodo table.
+TODO_ARCHIVE_AFTER_DAYS = int(os.getenv("TODO_ARCHIVE_AFTER_DAYS", "30"))
+# Tombstones of deleted tasks are kept this long; older sync tokens get a full snapshot.
+TASK_SYNC_TOMBSTONE_DAYS = int(os.getenv("TASK_SYNC_TOMBSTONE_DAYS", "30"))
@@ -0,0 +1,107 @@
+"""
+Sparse fieldsets: `?fields=id,name,status` on any GET endpoint whose serializer uses
+SparseFieldsetMixin returns only those fields. Views that also use
+SparseFieldsetViewMixin load only the columns those fields need (`.only()`), so
+large text columns such as task notes or item descriptions are not fetched when
+they are not rendered.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = "fields"
+
+
+def requested_fields(request):
+    """Field names from `?fields=` on a GET/HEAD request, or None if not given."""
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    value = request.query_params.get(FIELDS_PARAM)
+    if value is None:
+        return None
+    return [name for name in (part.strip() for part in value.split(",")) if name]
+
+
+class SparseFieldsetMixin:
+    """
+    ModelSerializer mixin that drops the fields not listed in `?fields=`.
+
+    Only the top-level serializer of a view is trimmed; nested serializers render in
+    full. Unknown names are rejected with 400. Fields computed from several columns
+    (SerializerMethodField) list them in `Meta.field_sources` so projections can
+    include them; without an entry the view falls back to loading every column.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        names = requested_fields(self.context.get("request"))
+        if names is None or "view" not in self.context:
+            return
+
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise ValidationError({FIELDS_PARAM: [f"Unknown field(s): {', '.join(unknown)}."]})
+        for name in set(self.fields) - set(names):
+            self.fields.pop(name)
+
+    def get_only_fields(self):
+        """
+        Model fields needed to render the remaining fields, or None if that can't
+        be worked out (e.g. a field reads a model property).
+        """
+        model = self.Meta.model
+        sources = getattr(self.Meta, "field_sources", {})
+        needed = set()
+        for name, field in self.fields.items():
+            if field.write_only:
+                continue
+            if name in sources:
+                needed.update(sources[name])
+                continue
+            if field.source == "*":
+                return None
+            try:
+                model_field = model._meta.get_field(field.source_attrs[0])
+            except FieldDoesNotExist:
+                return None
+            if model_field.concrete:
+                needed.add(model_field.name)
+        return needed
+
+
+class SparseFieldsetViewMixin:
+    """
+    Generic view mixin that applies `.only()` for `?fields=` requests.
+
+    The primary key and the ordering columns (read by the keyset paginator) are
+    always loaded; select_related joins whose field is not requested are dropped.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if requested_fields(self.request) is None:
+            return queryset
+
+        serializer = self.get_serializer()
+        only = serializer.get_only_fields() if hasattr(serializer, "get_only_fields") else None
+        related = queryset.query.select_related
+        if only is None or related is True:
+            return queryset
+
+        model = queryset.model
+        ordering = [*queryset.query.order_by, *(getattr(self, "ordering", None) or [])]
+        for name in ordering:
+            if isinstance(name, str):
+                try:
+                    only.add(model._meta.get_field(name.lstrip("-")).name)
+                except FieldDoesNotExist:
+                    pass  # annotations (e.g. a search rank) are not affected by only()
+        only.add(model._meta.pk.name)
+
+        if related:
+            kept = [name for name in related if name in only]
+            queryset = queryset.select_related(None)
+            if kept:
+                queryset = queryset.select_related(*kept)
+        return queryset.only(*only)
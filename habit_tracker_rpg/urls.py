@@ -9,6 +9,7 @@ urlpatterns = [
     path("api/tasks/", include("tasks.urls")),
     path("api/inventory/", include("inventory.urls")),
     path("api/estate/", include("estate.urls")),
+    path("api/core/", include("core.urls")),
 ]
 
 if settings.DEBUG:
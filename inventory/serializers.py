@@ -1,16 +1,17 @@
 from rest_framework import serializers
+from habit_tracker_rpg.sparse_fields import SparseFieldsetMixin
 from inventory.models import Item, UserItem, EquipmentSlots
 from users.models import Character
 
 # --- ITEM SERIALIZER ---
-class ItemSerializer(serializers.ModelSerializer):
+class ItemSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Item
         fields = '__all__'
 
 
 # --- USER ITEM SERIALIZER ---
-class UserItemSerializer(serializers.ModelSerializer):
+class UserItemSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     item = ItemSerializer(read_only=True)
     item_id = serializers.PrimaryKeyRelatedField(
         queryset=Item.objects.all(), source='item', write_only=True
@@ -22,7 +23,7 @@ class UserItemSerializer(serializers.ModelSerializer):
 
 
 # --- EQUIPMENT SLOTS SERIALIZER ---
-class EquipmentSlotsSerializer(serializers.ModelSerializer):
+class EquipmentSlotsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     weapon = ItemSerializer(read_only=True)
     armor = ItemSerializer(read_only=True)
     accessory = ItemSerializer(read_only=True)
@@ -33,7 +34,7 @@ class EquipmentSlotsSerializer(serializers.ModelSerializer):
 
 
 # --- CHARACTER SERIALIZER ---
-class CharacterSerializer(serializers.ModelSerializer):
+class CharacterSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     items = UserItemSerializer(many=True, read_only=True, source='useritem_set')
     equipment = EquipmentSlotsSerializer(read_only=True)
 
@@ -61,6 +62,10 @@ class CharacterSerializer(serializers.ModelSerializer):
             'items',
             'equipment',
         ]
+        field_sources = {
+            'current_hp_percent': ['current_hp', 'max_hp'],
+            'current_mana_percent': ['current_mana', 'max_mana'],
+        }
 
     def get_current_hp_percent(self, obj):
         if obj.max_hp > 0:
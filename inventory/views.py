@@ -1,4 +1,6 @@
 from rest_framework import viewsets, permissions
+from habit_tracker_rpg.fast_list import FastListMixin
+from habit_tracker_rpg.sparse_fields import SparseFieldsetViewMixin
 from inventory.models import Item, UserItem, EquipmentSlots
 from inventory.serializers import (
     ItemSerializer,
@@ -7,7 +9,7 @@ from inventory.serializers import (
 )
 
 
-class ItemViewSet(viewsets.ModelViewSet):
+class ItemViewSet(FastListMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """ViewSet for browsing all available items (shop or database)."""
 
     queryset = Item.objects.all()
@@ -15,7 +17,7 @@ class ItemViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
 
-class UserItemViewSet(viewsets.ModelViewSet):
+class UserItemViewSet(FastListMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """ViewSet for user's inventory (items owned by the logged-in user)."""
 
     serializer_class = UserItemSerializer
@@ -23,14 +25,14 @@ class UserItemViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filter only items belonging to the logged-in user."""
-        return UserItem.objects.filter(user=self.request.user)
+        return UserItem.objects.filter(user=self.request.user).select_related("item")
 
     def perform_create(self, serializer):
         """Automatically assign the logged-in user when creating an item."""
         serializer.save(user=self.request.user)
 
 
-class EquipmentSlotsViewSet(viewsets.ModelViewSet):
+class EquipmentSlotsViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """ViewSet for managing equipment slots (equipped items)."""
 
     serializer_class = EquipmentSlotsSerializer
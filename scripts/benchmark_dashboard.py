@@ -0,0 +1,118 @@
+"""
+Benchmark for the home screen: the six requests it used to make versus the single
+/api/core/dashboard/ request.
+
+Seeds one user in a throwaway test database and sends the requests through the
+full Django stack (JWT authentication, throttling, middleware), reporting the
+server time and the number of queries of each variant. In-process requests have
+no network cost, so the latency a client sees is also estimated for a network
+round trip of RTT_MS per request (requests sent one after another).
+
+Usage:
+    python scripts/benchmark_dashboard.py [TASKS_PER_TYPE] [RTT_MS]
+"""
+
+import sys
+
+from benchmark_utils import best_of, setup_django, test_database
+
+DEFAULT_TASKS = 20
+DEFAULT_RTT_MS = 30
+HOME_SCREEN_URLS = [
+    "/api/users/profile/",
+    "/api/tasks/habits/",
+    "/api/tasks/dailies/",
+    "/api/tasks/todos/?filter=active",
+    "/api/estate/estate/",
+    "/api/inventory/useritems/",
+]
+DASHBOARD_URL = "/api/core/dashboard/"
+
+
+def seed(user, count):
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from estate.models import Estate
+    from inventory.models import Item, UserItem
+    from tasks.models import Daily, Habit, Todo
+    from users.models import Character
+
+    due = timezone.localdate() + timedelta(days=7)
+    Character.objects.create(user=user)
+    Estate.objects.create(user=user)
+    items = Item.objects.bulk_create(
+        [Item(name=f"Item {i}", description="A thing", value=i) for i in range(10)]
+    )
+    UserItem.objects.bulk_create(
+        [UserItem(user=user, item=item, is_equipped=i < 3) for i, item in enumerate(items)]
+    )
+    Habit.objects.bulk_create(
+        [Habit(user=user, name=f"Habit {i}", type="good") for i in range(count)]
+    )
+    Daily.objects.bulk_create([Daily(user=user, name=f"Daily {i}") for i in range(count)])
+    Todo.objects.bulk_create(
+        [Todo(user=user, name=f"Todo {i}", due_date=due) for i in range(count)]
+    )
+
+
+def fetch(client, urls):
+    from django.core.cache import cache
+
+    cache.clear()  # stay under the user throttle; also means no warm data-version keys
+    for url in urls:
+        response = client.get(url)
+        assert response.status_code == 200, (url, response.status_code)
+
+
+def count_queries(func):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as context:
+        func()
+    return len(context.captured_queries)
+
+
+def main(count, rtt_ms):
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from users.models import User
+
+    user = User.objects.create_user(
+        username="benchmark", email="benchmark@example.com", password="benchmark-pass-123"
+    )
+    seed(user, count)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+    variants = [
+        ("6 requests", HOME_SCREEN_URLS),
+        ("dashboard", [DASHBOARD_URL]),
+    ]
+    print(f"{count} habits, dailies and todos, {rtt_ms} ms RTT")
+    print(f"{'variant':>12} {'server ms':>10} {'queries':>8} {'client ms':>10}")
+    server, client_side = {}, {}
+    for name, urls in variants:
+        func = lambda: fetch(client, urls)  # noqa: E731
+        func()  # warm up
+        server[name] = best_of(func, repeat=20) * 1000
+        client_side[name] = server[name] + len(urls) * rtt_ms
+        print(
+            f"{name:>12} {server[name]:>10.1f} {count_queries(func):>8} "
+            f"{client_side[name]:>10.1f}"
+        )
+    print(
+        f"speedup: {server['6 requests'] / server['dashboard']:.1f}x server, "
+        f"{client_side['6 requests'] / client_side['dashboard']:.1f}x client"
+    )
+
+
+if __name__ == "__main__":
+    setup_django()
+    with test_database():
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TASKS
+        rtt_ms = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RTT_MS
+        main(count, rtt_ms)
@@ -0,0 +1,89 @@
+"""
+Benchmark for the streaming task export (/api/tasks/export/).
+
+Creates a user with N habits, dailies and todos in a throwaway test database and
+streams the NDJSON and CSV exports through the view, reporting throughput and
+the peak Python memory allocated while streaming. Peak memory should stay flat
+as N grows.
+
+Usage:
+    python scripts/benchmark_export.py [N ...]
+"""
+
+import sys
+import tracemalloc
+
+from benchmark_utils import best_of, setup_django, test_database
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def seed(user, count):
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from tasks.models import Daily, Habit, Todo
+
+    due = timezone.localdate() + timedelta(days=7)
+    per_type = count // 3
+    Habit.objects.filter(user=user).delete()
+    Daily.objects.filter(user=user).delete()
+    Todo.objects.filter(user=user).delete()
+    Habit.objects.bulk_create(
+        [Habit(user=user, name=f"Habit {i}", type="good") for i in range(per_type)],
+        batch_size=2000,
+    )
+    Daily.objects.bulk_create(
+        [Daily(user=user, name=f"Daily {i}") for i in range(per_type)], batch_size=2000
+    )
+    Todo.objects.bulk_create(
+        [Todo(user=user, name=f"Todo {i}", due_date=due) for i in range(count - 2 * per_type)],
+        batch_size=2000,
+    )
+
+
+def export(user, export_format):
+    """Stream one export through the view and return the number of bytes sent."""
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from tasks.views import TaskExportView
+
+    request = APIRequestFactory().get("/api/tasks/export/", {"format": export_format})
+    force_authenticate(request, user=user)
+    response = TaskExportView.as_view()(request)
+    return sum(len(chunk) for chunk in response.streaming_content)
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(sizes):
+    from users.models import User
+
+    user = User.objects.create_user(
+        username="benchmark", email="benchmark@example.com", password="benchmark-pass-123"
+    )
+    print(f"{'rows':>8} {'format':>7} {'seconds':>8} {'rows/s':>10} {'MB':>7} {'peak KiB':>9}")
+    for count in sizes:
+        seed(user, count)
+        for export_format in ("ndjson", "csv"):
+            size = export(user, export_format)
+            seconds = best_of(lambda: export(user, export_format))
+            peak = peak_memory(lambda: export(user, export_format))
+            print(
+                f"{count:>8} {export_format:>7} {seconds:>8.3f} {count / seconds:>10.0f} "
+                f"{size / 1e6:>7.1f} {peak / 1024:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    setup_django()
+    with test_database():
+        main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
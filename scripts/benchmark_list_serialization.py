@@ -0,0 +1,103 @@
+"""
+Benchmark for the values() fast list path (habit_tracker_rpg.fast_list).
+
+Seeds N habits, todos, items and user items in a throwaway test database and
+serializes each list both ways: the regular `Serializer(queryset, many=True).data`
+path and `fast_list_data()`, which reads values() rows through compiled field
+converters. Both include the query; the outputs are checked to be identical.
+
+Usage:
+    python scripts/benchmark_list_serialization.py [N ...]
+"""
+
+import sys
+
+from benchmark_utils import best_of, setup_django, test_database
+
+DEFAULT_SIZES = [100, 1_000, 10_000]
+
+
+def seed(user, count):
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from inventory.models import Item, UserItem
+    from tasks.models import Habit, Todo
+
+    due = timezone.localdate() + timedelta(days=7)
+    UserItem.objects.all().delete()
+    Item.objects.all().delete()
+    Habit.objects.filter(user=user).delete()
+    Todo.objects.filter(user=user).delete()
+    Habit.objects.bulk_create(
+        [
+            Habit(user=user, name=f"Habit {i}", notes="Some notes", type="good", current_streak=i)
+            for i in range(count)
+        ],
+        batch_size=2000,
+    )
+    Todo.objects.bulk_create(
+        [Todo(user=user, name=f"Todo {i}", due_date=due) for i in range(count)], batch_size=2000
+    )
+    items = Item.objects.bulk_create(
+        [
+            Item(name=f"Item {i}", description="A thing", value=i, bonuses={"strength": 1})
+            for i in range(count)
+        ],
+        batch_size=2000,
+    )
+    UserItem.objects.bulk_create(
+        [UserItem(user=user, item=item) for item in items], batch_size=2000
+    )
+
+
+def sources(user):
+    from inventory.models import Item, UserItem
+    from inventory.serializers import ItemSerializer, UserItemSerializer
+    from tasks.models import Habit, Todo
+    from tasks.serializers import HabitSerializer, TodoSerializer
+
+    return [
+        ("habits", HabitSerializer, Habit.objects.filter(user=user).order_by("-created_at", "-id")),
+        ("todos", TodoSerializer, Todo.objects.filter(user=user).order_by("due_date", "-id")),
+        ("items", ItemSerializer, Item.objects.order_by("id")),
+        (
+            "user items",
+            UserItemSerializer,
+            UserItem.objects.filter(user=user).select_related("item").order_by("id"),
+        ),
+    ]
+
+
+def main(sizes):
+    import json
+
+    from rest_framework.utils.encoders import JSONEncoder
+
+    from habit_tracker_rpg.fast_list import fast_list_data
+    from users.models import User
+
+    user = User.objects.create_user(
+        username="benchmark", email="benchmark@example.com", password="benchmark-pass-123"
+    )
+    print(f"{'rows':>6} {'list':>10} {'serializer s':>12} {'fast s':>8} {'speedup':>8}")
+    for count in sizes:
+        seed(user, count)
+        for name, serializer_class, queryset in sources(user):
+            regular = lambda: serializer_class(queryset.all(), many=True).data  # noqa: E731
+            fast = lambda: fast_list_data(serializer_class(), queryset.all())  # noqa: E731
+            assert json.dumps(regular(), cls=JSONEncoder) == json.dumps(fast(), cls=JSONEncoder)
+
+            slow_seconds = best_of(regular)
+            fast_seconds = best_of(fast)
+            print(
+                f"{count:>6} {name:>10} {slow_seconds:>12.4f} {fast_seconds:>8.4f} "
+                f"{slow_seconds / fast_seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    setup_django()
+    with test_database():
+        main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,100 @@
+"""
+Benchmark for the blacklisted-JTI Bloom filter (users.blacklist_filter).
+
+Seeds N blacklisted refresh tokens in a throwaway test database, then refreshes
+fresh (never blacklisted) tokens with TOKEN_BLACKLIST_FILTER off and on. The
+filter needs a cache shared between processes, so the "on" runs use a file-based
+cache in a temporary directory as a stand-in for Redis.
+
+- "check": FilteredRefreshToken(token), i.e. decoding plus the blacklist check;
+- "refresh": RefreshSerializer.validate, the full rotating refresh (blacklists the
+  old token, outstands the new one).
+
+Usage:
+    python scripts/benchmark_token_refresh.py [N ...]
+"""
+
+import sys
+import time
+
+from benchmark_utils import setup_django, test_database
+
+DEFAULT_SIZES = [1_000, 100_000]
+REFRESHES = 500
+
+
+def seed(user, count):
+    from datetime import timedelta
+
+    from django.db import connection
+    from django.utils import timezone
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+    BlacklistedToken.objects.all().delete()
+    OutstandingToken.objects.all().delete()
+    expires_at = timezone.now() + timedelta(days=7)
+    tokens = OutstandingToken.objects.bulk_create(
+        [
+            OutstandingToken(user=user, jti=f"seed-{i}", token="x", expires_at=expires_at)
+            for i in range(count)
+        ],
+        batch_size=5000,
+    )
+    BlacklistedToken.objects.bulk_create(
+        [BlacklistedToken(token=token) for token in tokens], batch_size=5000
+    )
+    with connection.cursor() as cursor:  # fresh planner statistics, as autovacuum would
+        cursor.execute("ANALYZE token_blacklist_outstandingtoken, token_blacklist_blacklistedtoken")
+
+
+def per_second(func, user):
+    """Calls of `func(token)` per second over REFRESHES fresh refresh tokens."""
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    tokens = [str(RefreshToken.for_user(user)) for _ in range(REFRESHES)]
+    start = time.perf_counter()
+    for token in tokens:
+        func(token)
+    return REFRESHES / (time.perf_counter() - start)
+
+
+def main(sizes):
+    import tempfile
+
+    from django.test import override_settings
+
+    from users.blacklist_filter import blacklist_filter
+    from users.models import User
+    from users.serializers import RefreshSerializer
+    from users.tokens import FilteredRefreshToken
+
+    def refresh(token):
+        serializer = RefreshSerializer(data={"refresh": token})
+        serializer.is_valid(raise_exception=True)
+
+    user = User.objects.create_user(
+        username="benchmark", email="benchmark@example.com", password="benchmark-pass-123"
+    )
+    shared_cache = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": tempfile.mkdtemp(prefix="benchmark-cache-"),
+        }
+    }
+    filter_on = override_settings(CACHES=shared_cache, TOKEN_BLACKLIST_FILTER=True)
+    print(f"{'blacklist':>9} {'path':>8} {'off /s':>8} {'on /s':>8} {'speedup':>8}")
+    for count in sizes:
+        seed(user, count)
+        blacklist_filter.reset()
+        blacklist_filter.might_contain("warm-up")  # startup rebuild, not timed
+        for name, func in [("check", FilteredRefreshToken), ("refresh", refresh)]:
+            before = per_second(func, user)
+            with filter_on:
+                after = per_second(func, user)
+            print(f"{count:>9} {name:>8} {before:>8.0f} {after:>8.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    setup_django()
+    with test_database():
+        main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,51 @@
+"""
+Shared helpers for the benchmark scripts in this folder.
+
+Benchmarks run against a throwaway test database created from the project's
+settings (the same database server the test suite uses), so they never touch
+real data.
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """Make the project importable and configure Django."""
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "habit_tracker_rpg.settings")
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """Create the test database for the duration of the block, then drop it."""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def best_of(func, repeat=3):
+    """Best wall-clock time of `repeat` calls to `func`, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
@@ -1,19 +1,34 @@
 from django.contrib import admin
 
-from tasks.models import Daily, Habit, Todo
+from tasks.models import ArchivedTodo, Daily, Habit, ScheduledJobRun, Todo
+from tasks.sync import record_deletions
+
+
+class TaskAdmin(admin.ModelAdmin):
+    """Leaves sync tombstones for tasks deleted in the admin"""
+
+    def delete_model(self, request, obj):
+        pk = obj.pk
+        super().delete_model(request, obj)
+        record_deletions(type(obj), [(obj.user_id, pk)])
+
+    def delete_queryset(self, request, queryset):
+        deleted = list(queryset.values_list("user_id", "pk"))
+        super().delete_queryset(request, queryset)
+        record_deletions(queryset.model, deleted)
 
 
 @admin.register(Habit)
-class HabitAdmin(admin.ModelAdmin):
+class HabitAdmin(TaskAdmin):
     list_display = ["name", "user", "type", "status", "strength", "created_at"]
     list_filter = ["type", "status", "strength", "created_at"]
     search_fields = ["name", "notes", "user__username"]
     ordering = ["-created_at"]
-    readonly_fields = ["created_at"]
+    readonly_fields = ["created_at", "updated_at"]
 
 
 @admin.register(Daily)
-class DailyAdmin(admin.ModelAdmin):
+class DailyAdmin(TaskAdmin):
     list_display = [
         "name",
         "user",
@@ -26,11 +41,11 @@ class DailyAdmin(admin.ModelAdmin):
     list_filter = ["status", "strength", "repeats", "repeat_on", "created_at"]
     search_fields = ["name", "notes", "user__username"]
     ordering = ["-created_at"]
-    readonly_fields = ["created_at"]
+    readonly_fields = ["created_at", "updated_at"]
 
 
 @admin.register(Todo)
-class TodoAdmin(admin.ModelAdmin):
+class TodoAdmin(TaskAdmin):
     list_display = [
         "name",
         "user",
@@ -42,4 +57,21 @@ class TodoAdmin(admin.ModelAdmin):
     list_filter = ["is_completed", "strength", "due_date", "created_at"]
     search_fields = ["name", "notes", "user__username"]
     ordering = ["due_date", "-created_at"]
+    readonly_fields = ["created_at", "updated_at", "completed_at"]
+
+
+@admin.register(ArchivedTodo)
+class ArchivedTodoAdmin(admin.ModelAdmin):
+    list_display = ["name", "user", "due_date", "completed_at", "archived_at"]
+    list_filter = ["archived_at"]
+    search_fields = ["name", "notes", "user__username"]
+    ordering = ["-archived_at"]
+    readonly_fields = ["created_at", "completed_at", "archived_at"]
+
+
+@admin.register(ScheduledJobRun)
+class ScheduledJobRunAdmin(admin.ModelAdmin):
+    list_display = ["name", "run_date", "last_user_id", "rows_affected", "finished_at"]
+    list_filter = ["name", "run_date"]
+    ordering = ["-run_date", "name"]
     readonly_fields = ["created_at"]
@@ -0,0 +1,119 @@
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from users.data_version import bump_data_version
+
+MAX_BULK_SIZE = 1000
+
+
+def _item_id(item):
+    """The integer `id` of a bulk PATCH item, or None"""
+    pk = item.get("id") if isinstance(item, dict) else None
+    return pk if type(pk) is int else None
+
+
+class BulkCreateUpdateMixin:
+    """
+    List payloads for a task ModelViewSet.
+
+    POST a list to the list URL to create many tasks, PATCH a list of objects with
+    an `id` to partially update many. Every item is validated by the normal
+    serializer in one pass (no queries); valid items are written with a single
+    bulk_create/bulk_update, invalid ones are reported by index without failing
+    the batch:
+
+        {"results": [<serialized task>, ...], "errors": [{"index": 2, "errors": {...}}]}
+
+    The response is 201/200 when at least one item was written, otherwise 400.
+    Each list request runs in one transaction, so a failure in any batch or hook
+    writes nothing. Override perform_bulk_create/perform_bulk_update to hook into
+    the writes.
+    """
+
+    bulk_batch_size = 500
+
+    def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            return self.bulk_create(request)
+        return super().create(request, *args, **kwargs)
+
+    def _bulk_payload_error(self, request):
+        if not isinstance(request.data, list):
+            return "Expected a list of items."
+        if not request.data:
+            return "Expected a non-empty list of items."
+        if len(request.data) > MAX_BULK_SIZE:
+            return f"Cannot process more than {MAX_BULK_SIZE} items at once."
+        return None
+
+    def _bulk_response(self, instances, errors, success_status):
+        data = {"results": self.get_serializer(instances, many=True).data, "errors": errors}
+        return Response(data, status=success_status if instances else status.HTTP_400_BAD_REQUEST)
+
+    @transaction.atomic
+    def bulk_create(self, request):
+        detail = self._bulk_payload_error(request)
+        if detail:
+            return Response({"detail": detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        model = self.get_serializer_class().Meta.model
+        instances, errors = [], []
+        for index, item in enumerate(request.data):
+            serializer = self.get_serializer(data=item)
+            if serializer.is_valid():
+                instances.append(model(**serializer.validated_data, user=request.user))
+            else:
+                errors.append({"index": index, "errors": serializer.errors})
+
+        if instances:
+            instances = self.perform_bulk_create(instances)
+        return self._bulk_response(instances, errors, status.HTTP_201_CREATED)
+
+    @transaction.atomic
+    def bulk_partial_update(self, request, *args, **kwargs):
+        detail = self._bulk_payload_error(request)
+        if detail:
+            return Response({"detail": detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        ids = [_item_id(item) for item in request.data]
+        existing = self.get_queryset().in_bulk([pk for pk in ids if pk is not None])
+
+        instances, fields, errors = {}, set(), []
+        for index, (pk, item) in enumerate(zip(ids, request.data)):
+            instance = existing.get(pk)
+            if instance is None or pk in instances:
+                reason = "Duplicate id." if pk in instances else "Not found."
+                errors.append({"index": index, "errors": {"id": [reason]}})
+                continue
+            serializer = self.get_serializer(instance, data=item, partial=True)
+            if not serializer.is_valid():
+                errors.append({"index": index, "errors": serializer.errors})
+                continue
+            for field, value in serializer.validated_data.items():
+                setattr(instance, field, value)
+            fields.update(serializer.validated_data)
+            instances[pk] = instance
+
+        instances = list(instances.values())
+        if instances and fields:
+            self.perform_bulk_update(instances, sorted(fields))
+        return self._bulk_response(instances, errors, status.HTTP_200_OK)
+
+    def perform_bulk_create(self, instances):
+        """Insert validated, unsaved instances and return them with their ids"""
+        model = type(instances[0])
+        instances = model.objects.bulk_create(instances, batch_size=self.bulk_batch_size)
+        bump_data_version(self.request.user.pk)
+        return instances
+
+    def perform_bulk_update(self, instances, fields):
+        """Write `fields` of the modified instances, stamping auto_now fields like save()"""
+        model = type(instances[0])
+        stamped = [f for f in model._meta.concrete_fields if getattr(f, "auto_now", False)]
+        for field in stamped:
+            for instance in instances:
+                field.pre_save(instance, add=False)
+        fields = [*fields, *(f.name for f in stamped if f.name not in fields)]
+        model.objects.bulk_update(instances, fields, batch_size=self.bulk_batch_size)
+        bump_data_version(self.request.user.pk)
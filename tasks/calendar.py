@@ -0,0 +1,139 @@
+import time
+from datetime import timedelta
+
+import numpy as np
+from django.core.cache import cache
+from django.db.models.functions import TruncDate
+
+from tasks.enums import RepeatUnit, TasksRepeatOn, TasksRepeats, TasksStatus
+from tasks.models import Daily
+
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 366
+CALENDAR_CACHE_TIMEOUT = 60 * 60
+
+# Fields whose change moves a daily in the calendar. "status" is included because
+# inactive dailies are left out; completing a daily sets it too, so completions
+# invalidate the calendar, while strength and counter updates don't.
+CALENDAR_FIELDS = {"name", "status", "repeats", "repeat_on", "repeat_interval", "repeat_unit"}
+
+# repeat_on -> weekday number (Monday = 0); "everyday" maps to -1
+WEEKDAY_NUMBERS = {
+    TasksRepeatOn.MONDAY: 0,
+    TasksRepeatOn.TUESDAY: 1,
+    TasksRepeatOn.WEDNESDAY: 2,
+    TasksRepeatOn.THURSDAY: 3,
+    TasksRepeatOn.FRIDAY: 4,
+    TasksRepeatOn.SATURDAY: 5,
+    TasksRepeatOn.SUNDAY: 6,
+    TasksRepeatOn.EVERYDAY: -1,
+}
+
+
+def expand_schedules(schedules, start, end):
+    """
+    Expand daily schedules over the inclusive date range [start, end].
+
+    `schedules` holds (repeats, repeat_on, repeat_interval, repeat_unit, created_on)
+    tuples. Returns a boolean matrix (schedules x days) that is True where a daily
+    starts a new period, using the same rules as the reset_dailies job. All dailies
+    and days are evaluated at once with NumPy broadcasting; no day is before the
+    daily's creation date.
+    """
+    days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    if not schedules:
+        return np.zeros((0, len(days)), dtype=bool)
+
+    day_numbers = days.astype(np.int64)
+    weekdays = (day_numbers + 3) % 7  # 1970-01-01 was a Thursday
+    months = days.astype("datetime64[M]")
+    month_numbers = months.astype(np.int64)
+    day_of_month = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+    month_of_year = month_numbers % 12 + 1
+
+    repeats, repeat_on, intervals, units, created = zip(*schedules)
+    repeats = np.array(repeats)[:, None]
+    weekday = np.array([WEEKDAY_NUMBERS.get(value, -2) for value in repeat_on])[:, None]
+    everyday = weekday == -1
+    intervals = np.maximum(np.array(intervals, dtype=np.int64), 1)[:, None]
+    units = np.array(units)[:, None]
+    created = np.array(created, dtype="datetime64[D]")
+    created_days = created.astype(np.int64)[:, None]
+    created_months = created.astype("datetime64[M]").astype(np.int64)[:, None]
+
+    due = (repeats == TasksRepeats.DAILY) & (everyday | (weekday == weekdays))
+    due |= (repeats == TasksRepeats.WEEKLY) & ((weekday == weekdays) | everyday & (weekdays == 0))
+    due |= (repeats == TasksRepeats.MONTHLY) & (day_of_month == 1)
+    due |= (repeats == TasksRepeats.YEARLY) & (day_of_month == 1) & (month_of_year == 1)
+
+    days_since = day_numbers - created_days
+    months_since = month_numbers - created_months
+    on_interval = (
+        (intervals <= 1)
+        | (units == RepeatUnit.DAYS) & (days_since % intervals == 0)
+        | (units == RepeatUnit.WEEKS) & ((days_since // 7) % intervals == 0)
+        | (units == RepeatUnit.MONTHS) & (months_since % intervals == 0)
+    )
+    return due & on_interval & (days_since >= 0)
+
+
+def _version_key(user_id):
+    return f"tasks:daily-calendar-version:{user_id}"
+
+
+def invalidate_calendar(user_id):
+    """Drop every cached calendar of a user by bumping their cache version."""
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        pass  # nothing cached yet
+
+
+def _calendar_version(user_id):
+    """
+    The user's calendar cache version. It starts from the current time in nanoseconds,
+    so a version evicted from the cache never restarts at a value an old entry used.
+    """
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def build_calendar(user, start, end):
+    """
+    Dailies due on each day of [start, end] for `user`, excluding inactive ones:
+    {"from", "to", "dailies": [{"id", "name"}], "days": {date: [daily ids]}}.
+    Cached per user and range until one of the user's dailies changes.
+    """
+    version = _calendar_version(user.pk)
+    key = f"tasks:daily-calendar:{user.pk}:{version}:{start.isoformat()}:{end.isoformat()}"
+    calendar = cache.get(key)
+    if calendar is not None:
+        return calendar
+
+    rows = list(
+        Daily.objects.filter(user=user)
+        .exclude(status=TasksStatus.INACTIVE)
+        .annotate(created_on=TruncDate("created_at"))
+        .order_by("id")
+        .values_list(
+            "id", "name", "repeats", "repeat_on", "repeat_interval", "repeat_unit", "created_on"
+        )
+    )
+    due = expand_schedules([row[2:] for row in rows], start, end)
+    ids = np.array([row[0] for row in rows], dtype=np.int64)
+
+    calendar = {
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "dailies": [{"id": row[0], "name": row[1]} for row in rows],
+        "days": {
+            (start + timedelta(days=offset)).isoformat(): ids[due[:, offset]].tolist()
+            for offset in range(due.shape[1])
+        },
+    }
+    cache.set(key, calendar, CALENDAR_CACHE_TIMEOUT)
+    return calendar
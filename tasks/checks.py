@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from habit_tracker_rpg.caches import is_shared_cache
+
+
+@register(Tags.caches)
+def check_idempotency_cache(app_configs, **kwargs):
+    """
+    Idempotency keys live in the default cache. With a per-process backend a retry
+    that reaches another worker is not recognized and completes the task again.
+    """
+    if settings.DEBUG or is_shared_cache():
+        return []
+    return [
+        Warning(
+            "Idempotency-Key responses are stored in a per-process cache backend.",
+            hint=(
+                "Configure a shared CACHES['default'] backend (e.g. Redis) so retries that "
+                "reach another worker are replayed instead of completing the task again."
+            ),
+            id="tasks.W001",
+        )
+    ]
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from tasks.enums import HabitType, TasksStatus
+from tasks.models import Daily, Habit, Todo
+from users.data_version import get_data_version
+
+COUNTS_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _conditions(today):
+    """(response key, model, {count name: condition}) for every badge count."""
+    return [
+        (
+            "habits",
+            Habit,
+            {
+                "good": Q(type=HabitType.GOOD),
+                "bad": Q(type=HabitType.BAD),
+            },
+        ),
+        (
+            "dailies",
+            Daily,
+            {
+                "active": Q(status=TasksStatus.ACTIVE),
+                "completed": Q(status=TasksStatus.COMPLETED),
+                "inactive": Q(status=TasksStatus.INACTIVE),
+            },
+        ),
+        (
+            "todos",
+            Todo,
+            {
+                "active": Q(is_completed=False),
+                "planned": Q(is_completed=False, due_date__gt=today),
+                "completed": Q(is_completed=True),
+                "overdue": Q(is_completed=False, due_date__lt=today),
+            },
+        ),
+    ]
+
+
+def compute_task_counts(user, today=None):
+    """
+    Per-status task counts of `user`, one conditional aggregation per model:
+    `SELECT COUNT(user_id) FILTER (WHERE ...), ... WHERE user_id = %s`. Every column
+    involved is in a (user, type/status/is_completed, ...) index, so the planner can
+    answer it with an index-only scan.
+    """
+    today = today or timezone.localdate()
+    counts = {}
+    for key, model, conditions in _conditions(today):
+        counts[key] = model.objects.filter(user=user).aggregate(
+            total=Count("user"),
+            **{name: Count("user", filter=condition) for name, condition in conditions.items()},
+        )
+    return counts
+
+
+def get_task_counts(user):
+    """
+    compute_task_counts, cached per user. The key holds the user's data version,
+    which every task write bumps, and the date ("planned" and "overdue" move at
+    midnight), so a cached value is never stale.
+    """
+    today = timezone.localdate()
+    key = f"tasks:counts:{user.pk}:{get_data_version(user.pk)}:{today.isoformat()}"
+    counts = cache.get(key)
+    if counts is None:
+        counts = compute_task_counts(user, today)
+        cache.set(key, counts, COUNTS_CACHE_TIMEOUT)
+    return counts
@@ -42,3 +42,9 @@ class RepeatUnit(models.TextChoices):
     DAYS = "days", "Days"
     WEEKS = "weeks", "Weeks"
     MONTHS = "months", "Months"
+
+
+class TaskType(models.TextChoices):
+    HABIT = "habit", "Habit"
+    DAILY = "daily", "Daily"
+    TODO = "todo", "Todo"
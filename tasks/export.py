@@ -0,0 +1,145 @@
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+from tasks.enums import TaskType
+from tasks.models import ArchivedTodo, Daily, Habit, Todo
+from tasks.serializers import COUNTER_FIELDS
+
+EXPORT_CHUNK_SIZE = 2000
+COMMON_FIELDS = ["id", "name", "notes", "strength"]
+
+# (task_type, model, exported fields, constant columns); archived todos are exported as todos
+EXPORT_SOURCES = [
+    (
+        TaskType.HABIT,
+        Habit,
+        [*COMMON_FIELDS, "type", "status", *COUNTER_FIELDS, "created_at"],
+        {},
+    ),
+    (
+        TaskType.DAILY,
+        Daily,
+        [
+            *COMMON_FIELDS,
+            "status",
+            "repeats",
+            "repeat_on",
+            "repeat_interval",
+            "repeat_unit",
+            *COUNTER_FIELDS,
+            "created_at",
+        ],
+        {},
+    ),
+    (
+        TaskType.TODO,
+        Todo,
+        [*COMMON_FIELDS, "due_date", "is_completed", "completed_at", "created_at"],
+        {"archived": False},
+    ),
+    (
+        TaskType.TODO,
+        ArchivedTodo,
+        [*COMMON_FIELDS, "due_date", "is_completed", "completed_at", "created_at"],
+        {"archived": True},
+    ),
+]
+
+
+def _export_columns():
+    columns = ["task_type"]
+    for _, _, fields, constants in EXPORT_SOURCES:
+        for name in [*fields, *constants]:
+            if name not in columns:
+                columns.append(name)
+    return columns
+
+
+EXPORT_COLUMNS = _export_columns()
+
+
+def export_rows(user, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield every habit, daily and todo (archived ones included) of `user` as a dict.
+
+    Each table is read in primary key order through a server-side cursor, fetching
+    `chunk_size` rows at a time as plain tuples, so memory use does not depend on
+    how many tasks the user has.
+    """
+    for task_type, model, fields, constants in EXPORT_SOURCES:
+        rows = model.objects.filter(user=user).order_by("pk").values_list(*fields)
+        for values in rows.iterator(chunk_size=chunk_size):
+            yield {"task_type": task_type, **dict(zip(fields, values)), **constants}
+
+
+def _batched(lines, size):
+    """Join lines into strings of `size` lines, so the response isn't sent line by line."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
+class _LineBuffer:
+    """File-like object for csv.writer that hands back each written line."""
+
+    def write(self, value):
+        return value
+
+
+class NDJSONRenderer(BaseRenderer):
+    """One JSON object per line (application/x-ndjson)."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return "".join(self.lines([data] if isinstance(data, dict) else data)).encode()
+
+    def lines(self, rows):
+        encoder = DjangoJSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        for row in rows:
+            yield encoder.encode(row) + "\n"
+
+    def stream(self, rows, chunk_size=EXPORT_CHUNK_SIZE):
+        return _batched(self.lines(rows), chunk_size)
+
+
+class CSVRenderer(BaseRenderer):
+    """Comma-separated values with a header row; missing columns are left empty."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = [data] if isinstance(data, dict) else data
+        columns = list(rows[0]) if rows else []
+        return "".join(self.lines(rows, columns)).encode()
+
+    def lines(self, rows, columns=EXPORT_COLUMNS):
+        encoder = DjangoJSONEncoder()
+        writer = csv.writer(_LineBuffer())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow([self._cell(encoder, row.get(name)) for name in columns])
+
+    def stream(self, rows, chunk_size=EXPORT_CHUNK_SIZE):
+        return _batched(self.lines(rows), chunk_size)
+
+    @staticmethod
+    def _cell(encoder, value):
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        return encoder.default(value)  # dates and datetimes as in the NDJSON export
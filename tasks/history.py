@@ -0,0 +1,125 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from tasks.models import TaskCompletion
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionBuffer:
+    """
+    Write-behind buffer for TaskCompletion rows.
+
+    Rows are queued in memory and written with one bulk_create once the buffer
+    holds `max_size` rows or its oldest row is `max_age` seconds old; a timer
+    started with the first queued row flushes a buffer that receives no more rows.
+    Whatever is still queued is flushed at interpreter exit.
+
+    A failed write is logged and its rows are kept for the next flush. After
+    `max_retries` failed flushes in a row the queued rows are dropped, so one bad
+    row can't block the history forever.
+    """
+
+    def __init__(self, max_size=500, max_age=5.0, max_retries=3):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.max_retries = max_retries
+        self._rows = []
+        self._oldest = None
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def add(self, completion):
+        """Queue a TaskCompletion instance, flushing if the buffer is full or stale."""
+        with self._lock:
+            first = not self._rows
+            if first:
+                self._oldest = time.monotonic()
+            self._rows.append(completion)
+            due = (
+                len(self._rows) >= self.max_size or time.monotonic() - self._oldest >= self.max_age
+            )
+        if due:
+            self.flush()
+        elif first:
+            self._start_timer()
+
+    def _start_timer(self):
+        timer = threading.Timer(self.max_age, self._flush_from_timer)
+        timer.daemon = True
+        timer.start()
+
+    def _flush_from_timer(self):
+        try:
+            self.flush()
+        finally:
+            connection.close()  # the timer thread's own connection
+
+    def flush(self) -> int:
+        """
+        Write all queued rows with bulk_create. Returns the number of rows written;
+        never raises, since it runs after the completion itself has committed.
+        """
+        with self._lock:
+            rows, self._rows = self._rows, []
+            self._oldest = None
+        if not rows:
+            return 0
+        try:
+            # A savepoint when called inside a transaction, so a failure doesn't break it
+            with transaction.atomic():
+                TaskCompletion.objects.bulk_create(rows, batch_size=self.max_size or None)
+        except Exception:
+            with self._lock:
+                self._failures += 1
+                if self._failures >= self.max_retries:
+                    self._failures = 0
+                    logger.exception(
+                        "Dropped %d task completion rows after failed writes", len(rows)
+                    )
+                    return 0
+                # Put the rows back so a later flush can retry them
+                first = not self._rows
+                self._rows[:0] = rows
+                self._oldest = time.monotonic()
+            logger.exception("Could not write %d task completion rows, will retry", len(rows))
+            if first:
+                self._start_timer()
+            return 0
+        self._failures = 0
+        return len(rows)
+
+
+completion_buffer = CompletionBuffer(
+    max_size=getattr(settings, "TASK_COMPLETION_BUFFER_SIZE", 500),
+    max_age=getattr(settings, "TASK_COMPLETION_BUFFER_MAX_AGE", 5.0),
+    max_retries=getattr(settings, "TASK_COMPLETION_BUFFER_MAX_RETRIES", 3),
+)
+atexit.register(completion_buffer.flush)
+
+
+def record_completion(user_id, task_type, task_id, exp_delta=0, hp_delta=0):
+    """
+    Append a completion to the history once the surrounding transaction commits.
+    The timestamp is taken now, not when the buffer is flushed. The callback is
+    robust: a history failure never turns a committed completion into an error
+    response (which would release its Idempotency-Key for a paying retry).
+    """
+    completion = TaskCompletion(
+        user_id=user_id,
+        task_type=task_type,
+        task_id=task_id,
+        completed_at=timezone.now(),
+        exp_delta=exp_delta,
+        hp_delta=hp_delta,
+    )
+    transaction.on_commit(lambda: completion_buffer.add(completion), robust=True)
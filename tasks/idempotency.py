@@ -0,0 +1,78 @@
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+IN_PROGRESS = "in-progress"
+# How long a crashed request can block its key before a retry is processed again
+IN_PROGRESS_TIMEOUT = 60
+
+
+def _cache_key(request, key):
+    """Fixed-size cache key, scoped to the user, method and path of the request."""
+    scope = f"{request.user.pk}:{request.method}:{request.path}:{key}"
+    return f"idempotency:{hashlib.sha256(scope.encode()).hexdigest()}"
+
+
+def idempotent(view_method):
+    """
+    Honor the Idempotency-Key header on a POST view method.
+
+    The first request with a key runs normally and its response (status and data) is
+    kept in the cache for IDEMPOTENCY_KEY_TTL seconds. Retries with the same key get
+    that response back, marked with an `Idempotent-Replayed: true` header, without
+    running the view (no transaction, no task or character queries). A retry that
+    arrives while the first request is still running gets 409 Conflict. Server errors
+    are not stored, so the client can retry them. Requests without the header are
+    not affected.
+
+    Apply it outside @transaction.atomic so replays never open a transaction. Retries
+    are only recognized across workers with a shared cache backend (see tasks.checks).
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"detail": f"{IDEMPOTENCY_HEADER} cannot be longer than {MAX_KEY_LENGTH}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cache_key = _cache_key(request, key)
+        if not cache.add(cache_key, IN_PROGRESS, IN_PROGRESS_TIMEOUT):
+            stored = cache.get(cache_key)
+            if stored == IN_PROGRESS:
+                return Response(
+                    {"detail": "A request with this Idempotency-Key is still in progress."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            if stored is not None:
+                status_code, data = stored
+                response = Response(data, status=status_code)
+                response[REPLAYED_HEADER] = "true"
+                return response
+            cache.set(cache_key, IN_PROGRESS, IN_PROGRESS_TIMEOUT)  # expired in between
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except Exception:
+            cache.delete(cache_key)
+            raise
+
+        if response.status_code >= 500:
+            cache.delete(cache_key)
+        else:
+            ttl = getattr(settings, "IDEMPOTENCY_KEY_TTL", 24 * 60 * 60)
+            cache.set(cache_key, (response.status_code, response.data), ttl)
+        return response
+
+    return wrapper
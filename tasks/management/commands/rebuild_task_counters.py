@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from tasks.enums import TaskType
+from tasks.models import CompletionCounters, Daily, Habit, TaskCompletion
+from users.data_version import bump_global_data_version
+
+COUNTED_MODELS = {TaskType.HABIT: Habit, TaskType.DAILY: Daily}
+
+
+def _rebuild_counters(task_type, model, batch_size):
+    """
+    Recompute streak counters for every task of `model` from TaskCompletion history.
+
+    Completion days are streamed in (task_id, day) order and folded into runs of
+    consecutive days, so memory stays bounded by `batch_size` tasks.
+    """
+    days = (
+        TaskCompletion.objects.filter(task_type=task_type)
+        .annotate(day=TruncDate("completed_at"))
+        .values_list("task_id", "day")
+        .order_by("task_id", "day")
+    )
+    pending = []
+    updated = 0
+
+    def flush():
+        nonlocal updated
+        if pending:
+            # History of deleted tasks simply matches no rows here
+            updated += model.objects.bulk_update(pending, CompletionCounters.COUNTER_FIELDS)
+            pending.clear()
+
+    current = None
+    previous_day = None
+    for task_id, day in days.iterator(chunk_size=batch_size):
+        if current is None or current.pk != task_id:
+            if current is not None:
+                pending.append(current)
+                if len(pending) >= batch_size:
+                    flush()
+            current = model(pk=task_id, current_streak=0, best_streak=0, total_completions=0)
+            previous_day = None
+
+        current.total_completions += 1
+        if day != previous_day:
+            if previous_day is not None and day == previous_day + timedelta(days=1):
+                current.current_streak += 1
+            else:
+                current.current_streak = 1
+            current.best_streak = max(current.best_streak, current.current_streak)
+            current.last_completed_on = previous_day = day
+
+    if current is not None:
+        pending.append(current)
+    flush()
+    return updated
+
+
+class Command(BaseCommand):
+    help = "Rebuild streak and completion counters on habits and dailies from completion history."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        for task_type, model in COUNTED_MODELS.items():
+            with transaction.atomic():
+                model.objects.update(
+                    current_streak=0,
+                    best_streak=0,
+                    total_completions=0,
+                    last_completed_on=None,
+                    updated_at=timezone.now(),
+                )
+                updated = _rebuild_counters(task_type, model, batch_size)
+            self.stdout.write(f"{model._meta.verbose_name_plural}: rebuilt {updated} counters")
+        bump_global_data_version()
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:21
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0002_scheduledjobrun"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskCompletion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "task_type",
+                    models.CharField(
+                        choices=[
+                            ("habit", "Habit"),
+                            ("daily", "Daily"),
+                            ("todo", "Todo"),
+                        ],
+                        max_length=5,
+                    ),
+                ),
+                ("task_id", models.BigIntegerField()),
+                (
+                    "completed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("exp_delta", models.SmallIntegerField(default=0)),
+                ("hp_delta", models.SmallIntegerField(default=0)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-completed_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["user", "completed_at"],
+                        name="taskcompletion_user_time_idx",
+                    ),
+                    models.Index(
+                        fields=["user", "task_type", "task_id", "completed_at"],
+                        name="taskcompletion_task_time_idx",
+                    ),
+                    django.contrib.postgres.indexes.BrinIndex(
+                        fields=["completed_at"], name="taskcompletion_time_brin"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0003_taskcompletion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="daily",
+            name="best_streak",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="daily",
+            name="current_streak",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="daily",
+            name="last_completed_on",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="daily",
+            name="total_completions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="habit",
+            name="best_streak",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="habit",
+            name="current_streak",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="habit",
+            name="last_completed_on",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="habit",
+            name="total_completions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0004_completion_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="daily",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"], name="daily_user_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="habit",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"], name="habit_user_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                fields=["user", "due_date", "-created_at", "-id"],
+                name="todo_user_due_created_idx",
+            ),
+        ),
+    ]
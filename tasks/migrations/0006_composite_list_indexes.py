@@ -0,0 +1,144 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0005_keyset_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="daily",
+            name="repeat_on",
+            field=models.CharField(
+                choices=[
+                    ("monday", "Monday"),
+                    ("tuesday", "Tuesday"),
+                    ("wednesday", "Wednesday"),
+                    ("thursday", "Thursday"),
+                    ("friday", "Friday"),
+                    ("saturday", "Saturday"),
+                    ("sunday", "Sunday"),
+                    ("everyday", "Everyday"),
+                ],
+                default="everyday",
+                max_length=15,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="daily",
+            name="repeats",
+            field=models.CharField(
+                choices=[
+                    ("daily", "Daily"),
+                    ("weekly", "Weekly"),
+                    ("monthly", "Monthly"),
+                    ("yearly", "Yearly"),
+                ],
+                default="daily",
+                max_length=15,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="daily",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("active", "Active"),
+                    ("inactive", "Inactive"),
+                    ("completed", "Completed"),
+                ],
+                default="active",
+                max_length=15,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="daily",
+            name="strength",
+            field=models.CharField(
+                choices=[
+                    ("fragile", "Fragile"),
+                    ("weak", "Weak"),
+                    ("stable", "Stable"),
+                    ("strong", "Strong"),
+                    ("unbreakable", "Unbreakable"),
+                ],
+                default="stable",
+                max_length=15,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="habit",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("active", "Active"),
+                    ("inactive", "Inactive"),
+                    ("completed", "Completed"),
+                ],
+                default="active",
+                max_length=15,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="habit",
+            name="strength",
+            field=models.CharField(
+                choices=[
+                    ("fragile", "Fragile"),
+                    ("weak", "Weak"),
+                    ("stable", "Stable"),
+                    ("strong", "Strong"),
+                    ("unbreakable", "Unbreakable"),
+                ],
+                default="stable",
+                max_length=15,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="habit",
+            name="type",
+            field=models.CharField(choices=[("good", "Good"), ("bad", "Bad")], max_length=15),
+        ),
+        migrations.AlterField(
+            model_name="todo",
+            name="strength",
+            field=models.CharField(
+                choices=[
+                    ("fragile", "Fragile"),
+                    ("weak", "Weak"),
+                    ("stable", "Stable"),
+                    ("strong", "Strong"),
+                    ("unbreakable", "Unbreakable"),
+                ],
+                default="stable",
+                max_length=15,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="daily",
+            index=models.Index(
+                fields=["user", "status", "-created_at", "-id"],
+                name="daily_user_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="habit",
+            index=models.Index(
+                fields=["user", "status", "-created_at", "-id"],
+                name="habit_user_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                fields=["user", "is_completed", "due_date", "-created_at", "-id"],
+                name="todo_user_completed_due_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:52
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_completed_at(apps, schema_editor):
+    """Completion time is unknown for todos completed before this migration; use created_at."""
+    Todo = apps.get_model("tasks", "Todo")
+    Todo.objects.filter(is_completed=True, completed_at__isnull=True).update(
+        completed_at=models.F("created_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_task_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedTodo",
+            fields=[
+                ("name", models.CharField(max_length=100)),
+                ("notes", models.TextField(blank=True)),
+                (
+                    "strength",
+                    models.CharField(
+                        choices=[
+                            ("fragile", "Fragile"),
+                            ("weak", "Weak"),
+                            ("stable", "Stable"),
+                            ("strong", "Strong"),
+                            ("unbreakable", "Unbreakable"),
+                        ],
+                        default="stable",
+                        max_length=15,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "search_vector",
+                    models.GeneratedField(
+                        db_persist=True,
+                        expression=django.contrib.postgres.search.CombinedSearchVector(
+                            django.contrib.postgres.search.SearchVector(
+                                "name", config="simple", weight="A"
+                            ),
+                            "||",
+                            django.contrib.postgres.search.SearchVector(
+                                "notes", config="simple", weight="B"
+                            ),
+                            django.contrib.postgres.search.SearchConfig("simple"),
+                        ),
+                        output_field=django.contrib.postgres.search.SearchVectorField(),
+                    ),
+                ),
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("due_date", models.DateField()),
+                ("is_completed", models.BooleanField(default=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "archived_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="todo",
+            name="completed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                condition=models.Q(("is_completed", True)),
+                fields=["completed_at", "id"],
+                name="todo_completed_at_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedtodo",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedtodo",
+            index=models.Index(
+                fields=["user", "due_date", "-created_at", "-id"],
+                name="archivedtodo_user_due_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedtodo",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="archivedtodo_search_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_completed_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:03
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0008_todo_archive"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "task_type",
+                    models.CharField(
+                        choices=[
+                            ("habit", "Habit"),
+                            ("daily", "Daily"),
+                            ("todo", "Todo"),
+                        ],
+                        max_length=5,
+                    ),
+                ),
+                ("task_id", models.BigIntegerField()),
+                ("deleted_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="archivedtodo",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="daily",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="habit",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="todo",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name="daily",
+            index=models.Index(fields=["user", "updated_at"], name="daily_user_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="habit",
+            index=models.Index(fields=["user", "updated_at"], name="habit_user_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(fields=["user", "updated_at"], name="todo_user_updated_idx"),
+        ),
+        migrations.AddField(
+            model_name="tasktombstone",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tasktombstone",
+            index=models.Index(fields=["user", "deleted_at"], name="tasktombstone_user_time_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tasktombstone",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["deleted_at"], name="tasktombstone_time_brin"
+            ),
+        ),
+    ]
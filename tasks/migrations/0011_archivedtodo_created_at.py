@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0010_habit_user_type_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedtodo",
+            name="created_at",
+            field=models.DateTimeField(),
+        ),
+    ]
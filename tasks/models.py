@@ -1,9 +1,21 @@
+from datetime import timedelta
+
 from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
 
-from .enums import HabitType, RepeatUnit, TasksRepeatOn, TasksRepeats, TasksStatus, TasksStrength
+from .enums import (
+    HabitType,
+    RepeatUnit,
+    TasksRepeatOn,
+    TasksRepeats,
+    TasksStatus,
+    TasksStrength,
+    TaskType,
+)
 
 
 class BaseTask(models.Model):
@@ -16,48 +28,107 @@ class BaseTask(models.Model):
         max_length=15,
         choices=TasksStrength.choices,
         default=TasksStrength.STABLE,
-        db_index=True,
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped on every write, including bulk and set-based updates, for delta sync
+    updated_at = models.DateTimeField(auto_now=True)
+    # Full-text document for ?search=, kept up to date by PostgreSQL itself.
+    # The "simple" config does no stemming, so names in any language match as typed.
+    search_vector = models.GeneratedField(
+        expression=SearchVector("name", weight="A", config="simple")
+        + SearchVector("notes", weight="B", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         abstract = True
         ordering = ["-created_at"]
 
 
-class Habit(BaseTask):
+class CompletionCounters(models.Model):
+    """
+    Abstract mixin with completion counters maintained incrementally on every
+    completion, so task lists can show streaks without aggregating history.
+    A streak is the number of consecutive calendar days with a completion.
+    """
+
+    current_streak = models.PositiveIntegerField(default=0)
+    best_streak = models.PositiveIntegerField(default=0)
+    total_completions = models.PositiveIntegerField(default=0)
+    last_completed_on = models.DateField(null=True, blank=True)
+
+    COUNTER_FIELDS = ["current_streak", "best_streak", "total_completions", "last_completed_on"]
+
+    class Meta:
+        abstract = True
+
+    def register_completion(self, day):
+        """Update the counters for a completion on `day` (in memory, not saved)."""
+        if self.last_completed_on != day:
+            if self.last_completed_on == day - timedelta(days=1):
+                self.current_streak += 1
+            else:
+                self.current_streak = 1
+            self.last_completed_on = day
+        self.best_streak = max(self.best_streak, self.current_streak)
+        self.total_completions += 1
+
+    def streak_as_of(self, day):
+        """Current streak, or 0 if the last completion was before yesterday."""
+        return self.streak_from(self.current_streak, self.last_completed_on, day)
+
+    @staticmethod
+    def streak_from(current_streak, last_completed_on, day):
+        """streak_as_of for column values read without loading the task."""
+        if last_completed_on and last_completed_on >= day - timedelta(days=1):
+            return current_streak
+        return 0
+
+
+class Habit(BaseTask, CompletionCounters):
     """Represents a user habit, either good or bad."""
 
     type = models.CharField(
         max_length=15,
         choices=HabitType.choices,
-        db_index=True,
     )
     status = models.CharField(
         max_length=15,
         choices=TasksStatus.choices,
         default=TasksStatus.ACTIVE,
-        db_index=True,
     )
 
+    class Meta(BaseTask.Meta):
+        # Every list query filters by user first, then optionally by status,
+        # and orders by (created_at DESC, id DESC) for keyset pagination.
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-id"], name="habit_user_created_idx"),
+            models.Index(
+                fields=["user", "status", "-created_at", "-id"], name="habit_user_status_idx"
+            ),
+            GinIndex(fields=["search_vector"], name="habit_search_idx"),
+            models.Index(fields=["user", "updated_at"], name="habit_user_updated_idx"),
+            # Good/bad badge counts (tasks/counts.py) as an index-only scan
+            models.Index(fields=["user", "type"], name="habit_user_type_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
 
-class Daily(BaseTask):
+class Daily(BaseTask, CompletionCounters):
     """Represents a recurring daily task."""
 
     repeats = models.CharField(
         max_length=15,
         choices=TasksRepeats.choices,
         default=TasksRepeats.DAILY,
-        db_index=True,
     )
     repeat_on = models.CharField(
         max_length=15,
         choices=TasksRepeatOn.choices,
         default=TasksRepeatOn.EVERYDAY,
-        db_index=True,
     )
     repeat_interval = models.IntegerField(default=1)
     repeat_unit = models.CharField(
@@ -69,9 +140,18 @@ class Daily(BaseTask):
         max_length=15,
         choices=TasksStatus.choices,
         default=TasksStatus.ACTIVE,
-        db_index=True,
     )
 
+    class Meta(BaseTask.Meta):
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-id"], name="daily_user_created_idx"),
+            models.Index(
+                fields=["user", "status", "-created_at", "-id"], name="daily_user_status_idx"
+            ),
+            GinIndex(fields=["search_vector"], name="daily_search_idx"),
+            models.Index(fields=["user", "updated_at"], name="daily_user_updated_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -81,11 +161,145 @@ class Todo(BaseTask):
 
     due_date = models.DateField()
     is_completed = models.BooleanField(default=False)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta(BaseTask.Meta):
+        # Lists order by (due_date, created_at DESC, id DESC); the active/planned/completed
+        # filters add is_completed (and a due_date range) after the user.
+        indexes = [
+            models.Index(
+                fields=["user", "due_date", "-created_at", "-id"], name="todo_user_due_created_idx"
+            ),
+            models.Index(
+                fields=["user", "is_completed", "due_date", "-created_at", "-id"],
+                name="todo_user_completed_due_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="todo_search_idx"),
+            models.Index(fields=["user", "updated_at"], name="todo_user_updated_idx"),
+            # Archival picks the oldest completed todos first
+            models.Index(
+                fields=["completed_at", "id"],
+                condition=models.Q(is_completed=True),
+                name="todo_completed_at_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.sync_completed_at()
+        super().save(*args, **kwargs)
+
+    def sync_completed_at(self):
+        """Keep completed_at in step with is_completed."""
+        if not self.is_completed:
+            self.completed_at = None
+        elif self.completed_at is None:
+            self.completed_at = timezone.now()
+
     def clean(self):
         super().clean()
         if self.due_date < timezone.now().date():
             raise ValidationError("Due date cannot be in the past.")
+
+
+class ArchivedTodo(BaseTask):
+    """
+    Cold storage for todos completed long ago, moved out of the Todo table by the
+    archive_completed_todos job. Rows keep their original id. Read-only for users.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    # Copied from the todo; auto_now_add would stamp the archive time instead
+    created_at = models.DateTimeField()
+    due_date = models.DateField()
+    is_completed = models.BooleanField(default=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta(BaseTask.Meta):
+        indexes = [
+            models.Index(
+                fields=["user", "due_date", "-created_at", "-id"],
+                name="archivedtodo_user_due_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="archivedtodo_search_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class ScheduledJobRun(models.Model):
+    """
+    Progress marker for chunked maintenance jobs (e.g. the daily reset).
+    One row per job and calendar day makes reruns idempotent and lets an
+    interrupted run resume from the last processed user id.
+    """
+
+    name = models.CharField(max_length=50)
+    run_date = models.DateField()
+    last_user_id = models.BigIntegerField(default=0)
+    rows_affected = models.PositiveIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["name", "run_date"], name="unique_job_run_per_day"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.run_date})"
+
+
+class TaskCompletion(models.Model):
+    """
+    Append-only log of task completions, one row per completed habit/daily/todo.
+    Task ids are stored without a foreign key so history survives task deletion.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False)
+    task_type = models.CharField(max_length=5, choices=TaskType.choices)
+    task_id = models.BigIntegerField()
+    completed_at = models.DateTimeField(default=timezone.now)
+    exp_delta = models.SmallIntegerField(default=0)
+    hp_delta = models.SmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-completed_at"]
+        indexes = [
+            models.Index(fields=["user", "completed_at"], name="taskcompletion_user_time_idx"),
+            models.Index(
+                fields=["user", "task_type", "task_id", "completed_at"],
+                name="taskcompletion_task_time_idx",
+            ),
+            # Rows are appended in time order, so a tiny BRIN index covers time-range scans
+            BrinIndex(fields=["completed_at"], name="taskcompletion_time_brin"),
+        ]
+
+    def __str__(self):
+        return f"{self.task_type} #{self.task_id} completed at {self.completed_at}"
+
+
+class TaskTombstone(models.Model):
+    """
+    Marker left behind when a habit, daily or todo is deleted (or archived), so the
+    delta sync endpoint can tell clients to drop it. Pruned after
+    TASK_SYNC_TOMBSTONE_DAYS days; older sync tokens get a full snapshot instead.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False)
+    task_type = models.CharField(max_length=5, choices=TaskType.choices)
+    task_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "deleted_at"], name="tasktombstone_user_time_idx"),
+            BrinIndex(fields=["deleted_at"], name="tasktombstone_time_brin"),
+        ]
+
+    def __str__(self):
+        return f"{self.task_type} #{self.task_id} deleted at {self.deleted_at}"
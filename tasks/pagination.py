@@ -0,0 +1,166 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over the view's full ordering.
+
+    The cursor stores the ordering values of the last (or first) row of a page, and
+    the next page is fetched with a seek condition on those columns, so page N
+    costs the same as page 1 when a matching composite index exists. The primary key
+    is appended to the ordering as a tie-breaker. No COUNT(*) is ever issued.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.annotations = set(queryset.query.annotations)
+        self.fields = [self._ordering_field(queryset, name) for name in self.ordering]
+
+        position, reverse = self.decode_cursor(request)
+        ordering = [self._invert(name) for name in self.ordering] if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._seek(ordering, position))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Ordering applied by the filter backends (OrderingFilter, or rank ordering from
+        TaskSearchFilter), else the view default, plus a pk tie-breaker.
+        """
+        ordering = [name for name in queryset.query.order_by if isinstance(name, str)]
+        ordering = list(ordering or getattr(view, "ordering", None) or ["-pk"])
+
+        pk_name = queryset.model._meta.pk.name
+        ordering = [
+            name[: -len("pk")] + pk_name if name.lstrip("-") == "pk" else name for name in ordering
+        ]
+        if pk_name not in {name.lstrip("-") for name in ordering}:
+            ordering.append(f"-{pk_name}" if ordering[0].startswith("-") else pk_name)
+        return ordering
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, obj, reverse):
+        if isinstance(obj, dict):
+            obj = SimpleNamespace(**obj)  # a values() row
+        position = [
+            getattr(obj, name) if name in self.annotations else field.value_to_string(obj)
+            for name, field in zip(self._columns(), self.fields)
+        ]
+        payload = json.dumps({"p": position, "r": int(reverse)}, separators=(",", ":"))
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        """Return (position values, reverse) from the request, or (None, False)."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            values = payload["p"]
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [field.to_python(value) for field, value in zip(self.fields, values)]
+            return position, bool(payload.get("r"))
+        except (binascii.Error, KeyError, TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _columns(self):
+        return [name.lstrip("-") for name in self.ordering]
+
+    @staticmethod
+    def _ordering_field(queryset, name):
+        """Model field for `name`, or the output field of an annotation such as a rank."""
+        name = name.lstrip("-")
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        return queryset.model._meta.get_field(name)
+
+    @staticmethod
+    def _invert(name):
+        return name[1:] if name.startswith("-") else f"-{name}"
+
+    @staticmethod
+    def _seek(ordering, position):
+        """
+        Rows strictly after `position` in `ordering`:
+        (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z) ...
+        The redundant leading bound (a >= x) lets the planner start an index range scan.
+        """
+        condition = Q()
+        equal = {}
+        for name, value in zip(ordering, position):
+            field = name.lstrip("-")
+            lookup = "lt" if name.startswith("-") else "gt"
+            condition |= Q(**equal, **{f"{field}__{lookup}": value})
+            equal[field] = value
+        first = ordering[0]
+        bound = {f"{first.lstrip('-')}__{'lte' if first.startswith('-') else 'gte'}": position[0]}
+        return Q(**bound) & condition
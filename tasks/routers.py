@@ -0,0 +1,8 @@
+from rest_framework.routers import DefaultRouter
+
+
+class BulkRouter(DefaultRouter):
+    """DefaultRouter that also routes PATCH on the list URL to `bulk_partial_update`."""
+
+    routes = list(DefaultRouter.routes)
+    routes[0] = routes[0]._replace(mapping={**routes[0].mapping, "patch": "bulk_partial_update"})
@@ -0,0 +1,67 @@
+import re
+from functools import cache
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connections
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+SEARCH_CONFIG = "simple"
+RANK_ANNOTATION = "search_rank"
+
+
+@cache
+def trigram_available(alias):
+    """Whether the pg_trgm extension (and the name trigram indexes) exist on `alias`."""
+    with connections[alias].cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def build_search_query(text):
+    """
+    Prefix tsquery matching every word of `text`, e.g. "drink wat" -> 'drink:* & wat:*',
+    so partially typed words still hit the index. Returns None if `text` has no words.
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    raw = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(raw, search_type="raw", config=SEARCH_CONFIG)
+
+
+class TaskSearchFilter(SearchFilter):
+    """
+    `?search=` over the task `search_vector` GIN index instead of ILIKE '%term%'.
+
+    Matches are annotated with `search_rank` (name hits weigh more than notes) and,
+    unless `?ordering=` is given, ordered by rank so the keyset pagination pages
+    through ranked results. When pg_trgm is installed, names that merely resemble
+    the text (typos, infixes) are matched too. Other database backends fall back to
+    the stock SearchFilter.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms or connections[queryset.db].vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        text = " ".join(terms)
+        query = build_search_query(text)
+        if query is None:
+            return super().filter_queryset(request, queryset, view)
+
+        condition = Q(search_vector=query)
+        rank = SearchRank(F("search_vector"), query)
+        if trigram_available(queryset.db):
+            condition |= Q(name__trigram_word_similar=text)
+            rank = rank + TrigramWordSimilarity(text, "name")
+
+        # ts_rank() is a real; as a double it survives the round trip through the cursor
+        rank = Cast(rank, FloatField())
+        queryset = queryset.filter(condition).annotate(**{RANK_ANNOTATION: rank})
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by(f"-{RANK_ANNOTATION}", "-id")
+        return queryset
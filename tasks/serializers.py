@@ -1,9 +1,35 @@
+from django.utils import timezone
 from rest_framework import serializers
 
-from .models import Daily, Habit, Todo
+from habit_tracker_rpg.sparse_fields import SparseFieldsetMixin
 
+from .enums import TaskType
+from .models import ArchivedTodo, CompletionCounters, Daily, Habit, Todo
 
-class HabitSerializer(serializers.ModelSerializer):
+MAX_BATCH_SIZE = 500
+COUNTER_FIELDS = ["current_streak", "best_streak", "total_completions", "last_completed_on"]
+# Columns read by CompletionCountersMixin.get_current_streak
+STREAK_SOURCES = {"current_streak": ["current_streak", "last_completed_on"]}
+
+
+class CompletionCountersMixin(serializers.Serializer):
+    """Read-only streak counters stored on the task row (no extra queries)"""
+
+    current_streak = serializers.SerializerMethodField()
+
+    def get_current_streak(self, obj):
+        """A streak is only current if the task was completed today or yesterday"""
+        return obj.streak_as_of(timezone.localdate())
+
+    def get_current_streak_converter(self):
+        """get_current_streak over STREAK_SOURCES values, for the values() fast list path"""
+        today = timezone.localdate()
+        return lambda streak, last_completed_on: CompletionCounters.streak_from(
+            streak, last_completed_on, today
+        )
+
+
+class HabitSerializer(SparseFieldsetMixin, CompletionCountersMixin, serializers.ModelSerializer):
     """Serializer for Habit model"""
 
     class Meta:
@@ -16,12 +42,14 @@ class HabitSerializer(serializers.ModelSerializer):
             "type",
             "status",
             "strength",
+            *COUNTER_FIELDS,
             "created_at",
         ]
-        read_only_fields = ["id", "created_at", "user"]
+        read_only_fields = ["id", "created_at", "user", *COUNTER_FIELDS]
+        field_sources = STREAK_SOURCES
 
 
-class DailySerializer(serializers.ModelSerializer):
+class DailySerializer(SparseFieldsetMixin, CompletionCountersMixin, serializers.ModelSerializer):
     """Serializer for Daily model"""
 
     class Meta:
@@ -37,12 +65,14 @@ class DailySerializer(serializers.ModelSerializer):
             "repeat_on",
             "repeat_interval",
             "repeat_unit",
+            *COUNTER_FIELDS,
             "created_at",
         ]
-        read_only_fields = ["id", "created_at", "user"]
+        read_only_fields = ["id", "created_at", "user", *COUNTER_FIELDS]
+        field_sources = STREAK_SOURCES
 
 
-class TodoSerializer(serializers.ModelSerializer):
+class TodoSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for Todo model"""
 
     class Meta:
@@ -55,14 +85,35 @@ class TodoSerializer(serializers.ModelSerializer):
             "strength",
             "due_date",
             "is_completed",
+            "completed_at",
             "created_at",
         ]
-        read_only_fields = ["id", "created_at", "user"]
+        read_only_fields = ["id", "created_at", "completed_at", "user"]
 
     def validate_due_date(self, value):
         """Ensure due_date is not in the past"""
-        from django.utils import timezone
-
         if value < timezone.now().date():
             raise serializers.ValidationError("Due date cannot be in the past.")
         return value
+
+
+class ArchivedTodoSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """Read-only serializer for archived todos, same shape as TodoSerializer"""
+
+    class Meta:
+        model = ArchivedTodo
+        fields = TodoSerializer.Meta.fields
+        read_only_fields = fields
+
+
+class TaskCompletionEntrySerializer(serializers.Serializer):
+    """A single (type, id) entry of a batch completion request"""
+
+    type = serializers.ChoiceField(choices=TaskType.choices)
+    id = serializers.IntegerField(min_value=1)
+
+
+class TaskBatchCompleteSerializer(serializers.Serializer):
+    """Serializer for completing several tasks of mixed types in one request"""
+
+    tasks = TaskCompletionEntrySerializer(many=True, allow_empty=False, max_length=MAX_BATCH_SIZE)
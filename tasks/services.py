@@ -0,0 +1,190 @@
+from django.db import transaction
+from django.utils import timezone
+
+from tasks.enums import HabitType, TasksStatus, TaskType
+from tasks.history import record_completion
+from tasks.models import CompletionCounters, Daily, Habit, Todo
+from tasks.strength import strengthen, weaken
+from users.data_version import bump_data_version
+from users.models import Character
+
+GOOD_HABIT_EXP = 10
+BAD_HABIT_HP = 5
+MISSED_DAILY_HP = 5
+DAILY_EXP = 15
+TODO_EXP = 20
+
+TASK_MODELS = {
+    TaskType.HABIT: Habit,
+    TaskType.DAILY: Daily,
+    TaskType.TODO: Todo,
+}
+
+
+def _complete_habit(habit):
+    """Apply a habit completion in memory. Returns (exp, hp_lost, detail)."""
+    if habit.type == HabitType.GOOD:
+        habit.strength = strengthen(habit.strength)
+        return GOOD_HABIT_EXP, 0, f"Good habit completed! +{GOOD_HABIT_EXP} EXP"
+    if habit.type == HabitType.BAD:
+        habit.strength = weaken(habit.strength)
+        return 0, BAD_HABIT_HP, f"Bad habit recorded. -{BAD_HABIT_HP} HP"
+    return None
+
+
+def _complete_daily(daily):
+    """Apply a daily completion in memory. Returns (exp, hp_lost, detail)."""
+    if daily.status == TasksStatus.COMPLETED:
+        return None
+    daily.strength = strengthen(daily.strength)
+    daily.status = TasksStatus.COMPLETED
+    return DAILY_EXP, 0, f"Daily task completed! +{DAILY_EXP} EXP"
+
+
+def _complete_todo(todo):
+    """Apply a todo completion in memory. Returns (exp, hp_lost, detail)."""
+    if todo.is_completed:
+        return None
+    todo.strength = strengthen(todo.strength)
+    todo.is_completed = True
+    todo.completed_at = timezone.now()
+    return TODO_EXP, 0, f"Todo completed! +{TODO_EXP} EXP"
+
+
+COMPLETION_HANDLERS = {
+    TaskType.HABIT: (
+        _complete_habit,
+        "Invalid habit type.",
+        ["strength", "updated_at", *CompletionCounters.COUNTER_FIELDS],
+    ),
+    TaskType.DAILY: (
+        _complete_daily,
+        "Daily task already completed for today.",
+        ["strength", "status", "updated_at", *CompletionCounters.COUNTER_FIELDS],
+    ),
+    TaskType.TODO: (
+        _complete_todo,
+        "Todo already completed.",
+        ["strength", "is_completed", "completed_at", "updated_at"],
+    ),
+}
+
+
+def _apply_completion(task_type, task, day):
+    """Run the completion handler and bump streak counters. Returns the outcome or None."""
+    handler, _, _ = COMPLETION_HANDLERS[task_type]
+    outcome = handler(task)
+    if outcome is not None:
+        task.updated_at = timezone.now()
+        if isinstance(task, CompletionCounters):
+            task.register_completion(day)
+    return outcome
+
+
+def apply_rewards(user, exp_gained, hp_lost):
+    """
+    Apply an EXP gain and an HP loss to the user's character and return it.
+    The character row is not locked; Character.apply_rewards writes F() deltas.
+    """
+    character, _ = Character.objects.get_or_create(user=user)
+    character.apply_rewards(exp=exp_gained, hp=-hp_lost)
+    return character
+
+
+@transaction.atomic
+def complete_task(user, task_type, task):
+    """
+    Complete a single task for `user` and apply its reward or penalty.
+    The task row is re-read under a lock so concurrent completions can't lose
+    counter updates. Returns (detail, task, character). Raises ValueError if the
+    task cannot be completed.
+    """
+    _, error_detail, fields = COMPLETION_HANDLERS[task_type]
+    task = TASK_MODELS[task_type].objects.select_for_update().get(pk=task.pk)
+    outcome = _apply_completion(task_type, task, timezone.localdate())
+    if outcome is None:
+        raise ValueError(error_detail)
+
+    exp, hp, detail = outcome
+    task.save(update_fields=fields)
+    character = apply_rewards(user, exp, hp)
+    record_completion(user.pk, task_type, task.pk, exp_delta=exp, hp_delta=-hp)
+    return detail, task, character
+
+
+@transaction.atomic
+def complete_batch(user, entries):
+    """
+    Complete a mixed list of habits, dailies and todos for one user.
+
+    `entries` is an ordered list of {"type": TaskType, "id": int} dicts, e.g. an
+    offline queue replayed by a mobile client. Every task type is loaded with one
+    locked SELECT and written back with one bulk UPDATE, and all EXP/HP deltas are
+    folded into a single character update, so the query count does not grow with
+    the number of entries. Entries that cannot be applied (unknown id, already
+    completed) are reported per item and do not abort the batch.
+    """
+    ids_by_type = {task_type: set() for task_type in TASK_MODELS}
+    for entry in entries:
+        ids_by_type[entry["type"]].add(entry["id"])
+
+    tasks_by_type = {}
+    for task_type, ids in ids_by_type.items():
+        if not ids:
+            tasks_by_type[task_type] = {}
+            continue
+        model = TASK_MODELS[task_type]
+        tasks_by_type[task_type] = model.objects.select_for_update().filter(user=user).in_bulk(ids)
+
+    today = timezone.localdate()
+    exp_gained = 0
+    hp_lost = 0
+    results = []
+    changed = {task_type: {} for task_type in TASK_MODELS}
+
+    for entry in entries:
+        task_type, task_id = entry["type"], entry["id"]
+        task = tasks_by_type[task_type].get(task_id)
+        if task is None:
+            results.append(
+                {"type": task_type, "id": task_id, "completed": False, "detail": "Not found."}
+            )
+            continue
+
+        outcome = _apply_completion(task_type, task, today)
+        if outcome is None:
+            _, error_detail, _ = COMPLETION_HANDLERS[task_type]
+            results.append(
+                {"type": task_type, "id": task_id, "completed": False, "detail": error_detail}
+            )
+            continue
+
+        exp, hp, detail = outcome
+        exp_gained += exp
+        hp_lost += hp
+        changed[task_type][task_id] = task
+        record_completion(user.pk, task_type, task_id, exp_delta=exp, hp_delta=-hp)
+        results.append(
+            {
+                "type": task_type,
+                "id": task_id,
+                "completed": True,
+                "detail": detail,
+                "strength": task.strength,
+            }
+        )
+
+    for task_type, tasks in changed.items():
+        if tasks:
+            _, _, fields = COMPLETION_HANDLERS[task_type]
+            TASK_MODELS[task_type].objects.bulk_update(tasks.values(), fields)
+            bump_data_version(user.pk)
+
+    character = apply_rewards(user, exp_gained, hp_lost)
+
+    return {
+        "results": results,
+        "exp_gained": exp_gained,
+        "hp_lost": hp_lost,
+        "character": character,
+    }
@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from tasks.calendar import CALENDAR_FIELDS, invalidate_calendar
+from tasks.models import Daily, Habit, Todo
+from users.data_version import bump_data_version
+
+
+# Signal: drop the cached daily calendar when a daily's schedule changes
+@receiver(post_save, sender=Daily)
+def invalidate_calendar_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or CALENDAR_FIELDS & set(update_fields):
+        invalidate_calendar(instance.user_id)
+
+
+@receiver(post_delete, sender=Daily)
+def invalidate_calendar_on_delete(sender, instance, **kwargs):
+    invalidate_calendar(instance.user_id)
+
+
+# Signal: invalidate the owner's ETags on every task save (deletes go through
+# tasks.sync.record_deletions, which does the same)
+@receiver(post_save, sender=Habit)
+@receiver(post_save, sender=Daily)
+@receiver(post_save, sender=Todo)
+def bump_data_version_on_task_save(sender, instance, **kwargs):
+    bump_data_version(instance.user_id)
@@ -0,0 +1,44 @@
+from django.db.models import Case, F, Value, When
+
+from tasks.enums import TasksStrength
+
+# Weakest to strongest.
+STRENGTH_LADDER = [
+    TasksStrength.FRAGILE,
+    TasksStrength.WEAK,
+    TasksStrength.STABLE,
+    TasksStrength.STRONG,
+    TasksStrength.UNBREAKABLE,
+]
+
+# Precomputed one-step transitions, clamped at both ends of the ladder.
+STRENGTHEN = {
+    current: STRENGTH_LADDER[min(index + 1, len(STRENGTH_LADDER) - 1)]
+    for index, current in enumerate(STRENGTH_LADDER)
+}
+WEAKEN = {
+    current: STRENGTH_LADDER[max(index - 1, 0)] for index, current in enumerate(STRENGTH_LADDER)
+}
+
+
+def strengthen(strength):
+    """One step up the ladder; unknown values are left as they are."""
+    return STRENGTHEN.get(strength, strength)
+
+
+def weaken(strength):
+    """One step down the ladder; unknown values are left as they are."""
+    return WEAKEN.get(strength, strength)
+
+
+def transition_case(transitions, field="strength"):
+    """
+    SQL CASE applying a transition table to `field` in an UPDATE, e.g.
+    CASE WHEN strength = 'weak' THEN 'fragile' ... ELSE strength END.
+    """
+    whens = [
+        When(**{field: current}, then=Value(new))
+        for current, new in transitions.items()
+        if current != new
+    ]
+    return Case(*whens, default=F(field))
@@ -0,0 +1,102 @@
+import base64
+import binascii
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from tasks.enums import TaskType
+from tasks.models import Daily, Habit, TaskTombstone, Todo
+from tasks.serializers import DailySerializer, HabitSerializer, TodoSerializer
+from users.data_version import bump_data_version
+from users.models import Character
+
+# Tokens point this far back, so rows written by transactions that were still open
+# while the sync ran are sent again next time rather than missed.
+SYNC_OVERLAP = timedelta(seconds=5)
+
+# task type -> (response key, model, serializer)
+SYNC_SOURCES = {
+    TaskType.HABIT: ("habits", Habit, HabitSerializer),
+    TaskType.DAILY: ("dailies", Daily, DailySerializer),
+    TaskType.TODO: ("todos", Todo, TodoSerializer),
+}
+TASK_TYPES = {model: task_type for task_type, (_, model, _) in SYNC_SOURCES.items()}
+
+
+def encode_token(moment):
+    return base64.urlsafe_b64encode(moment.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_token(token):
+    """The moment a sync token points to. Raises ValueError if it is malformed."""
+    try:
+        text = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        moment = datetime.fromisoformat(text)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid sync token.")
+    if timezone.is_naive(moment):
+        raise ValueError("Invalid sync token.")
+    return moment
+
+
+def record_deletions(model, tasks):
+    """
+    Leave tombstones for deleted (or archived) tasks, given as (user_id, task_id)
+    pairs, and invalidate the owners' ETags.
+    """
+    task_type = TASK_TYPES[model]
+    TaskTombstone.objects.bulk_create(
+        [TaskTombstone(user_id=user_id, task_type=task_type, task_id=pk) for user_id, pk in tasks]
+    )
+    bump_data_version(*(user_id for user_id, _ in tasks))
+
+
+class TombstoneMixin:
+    """Task viewset mixin that leaves a tombstone for every deleted task."""
+
+    def perform_destroy(self, instance):
+        pk = instance.pk  # delete() clears it
+        super().perform_destroy(instance)
+        record_deletions(type(instance), [(instance.user_id, pk)])
+
+
+def tombstone_retention():
+    return timedelta(days=getattr(settings, "TASK_SYNC_TOMBSTONE_DAYS", 30))
+
+
+def build_sync(user, since=None):
+    """
+    Tasks of `user` created or updated since the `since` token, tombstones of the
+    ones deleted since then, and the character stats if they changed.
+
+    Without a token, or with one older than the tombstone retention, the response
+    is a full snapshot (`"full": true`) that replaces everything on the client.
+    Each task type is one index range scan on (user, updated_at).
+    """
+    now = timezone.now()
+    full = since is None or since < now - tombstone_retention()
+
+    data = {"token": encode_token(now - SYNC_OVERLAP), "full": full}
+    for key, model, serializer_class in SYNC_SOURCES.values():
+        tasks = model.objects.filter(user=user)
+        if not full:
+            tasks = tasks.filter(updated_at__gte=since)
+        data[key] = serializer_class(tasks.order_by("updated_at"), many=True).data
+
+    deleted = []
+    if not full:
+        tombstones = TaskTombstone.objects.filter(user=user, deleted_at__gte=since)
+        deleted = [
+            {"type": task_type, "id": task_id}
+            for task_type, task_id in tombstones.order_by("deleted_at").values_list(
+                "task_type", "task_id"
+            )
+        ]
+    data["deleted"] = deleted
+
+    characters = Character.objects.filter(user=user)
+    if not full:
+        characters = characters.filter(updated_at__gte=since)
+    data["character"] = characters.first()
+    return data
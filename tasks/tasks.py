@@ -0,0 +1,304 @@
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Count,
+    DateField,
+    DurationField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import (
+    Cast,
+    ExtractDay,
+    ExtractMonth,
+    ExtractYear,
+    Greatest,
+    Mod,
+    TruncDate,
+)
+from django.utils import timezone
+
+from tasks.enums import HabitType, RepeatUnit, TasksRepeatOn, TasksRepeats, TasksStatus
+from tasks.models import ArchivedTodo, Daily, Habit, ScheduledJobRun, TaskTombstone, Todo
+from tasks.services import MISSED_DAILY_HP
+from tasks.strength import STRENGTH_LADDER, WEAKEN, transition_case
+from tasks.sync import record_deletions
+from users.data_version import bump_global_data_version
+from users.models import Character
+
+RESET_DAILIES_JOB = "reset_dailies"
+DECAY_HABITS_JOB = "decay_habit_strength"
+MISSED_DAILIES_JOB = "charge_missed_dailies"
+DEFAULT_ARCHIVE_BATCH = 1000
+ARCHIVED_TODO_FIELDS = [
+    "id",
+    "user_id",
+    "name",
+    "notes",
+    "strength",
+    "due_date",
+    "is_completed",
+    "completed_at",
+    "created_at",
+]
+DEFAULT_USER_CHUNK = 1000
+
+WEEKDAYS = [
+    TasksRepeatOn.MONDAY,
+    TasksRepeatOn.TUESDAY,
+    TasksRepeatOn.WEDNESDAY,
+    TasksRepeatOn.THURSDAY,
+    TasksRepeatOn.FRIDAY,
+    TasksRepeatOn.SATURDAY,
+    TasksRepeatOn.SUNDAY,
+]
+
+
+def run_chunked_job(name, run_date, queryset, apply_chunk, chunk_size=DEFAULT_USER_CHUNK):
+    """
+    Call `apply_chunk(first_user_id, last_user_id)` over consecutive user-id ranges
+    covering `queryset`, at most once per (name, run_date).
+
+    Each chunk runs in its own transaction together with the progress update on the
+    ScheduledJobRun marker, so a retried run skips finished days and resumes an
+    interrupted one right after the last committed chunk. Chunks that changed rows
+    invalidate every user's ETags. Returns the number of rows reported by
+    `apply_chunk` during this call.
+    """
+    run, _ = ScheduledJobRun.objects.get_or_create(name=name, run_date=run_date)
+    if run.finished_at:
+        return 0
+
+    bounds = queryset.aggregate(first=Min("user_id"), last=Max("user_id"))
+    affected = 0
+    if bounds["first"] is not None:
+        start = max(bounds["first"], run.last_user_id + 1)
+        while start <= bounds["last"]:
+            end = start + chunk_size - 1
+            with transaction.atomic():
+                run = ScheduledJobRun.objects.select_for_update().get(pk=run.pk)
+                if run.finished_at:
+                    break
+                if run.last_user_id >= end:
+                    start = run.last_user_id + 1
+                    continue
+                rows = apply_chunk(start, end)
+                run.last_user_id = end
+                run.rows_affected += rows
+                run.save(update_fields=["last_user_id", "rows_affected"])
+            affected += rows
+            if rows:
+                bump_global_data_version()
+            start = end + 1
+
+    ScheduledJobRun.objects.filter(pk=run.pk, finished_at__isnull=True).update(
+        finished_at=timezone.now()
+    )
+    return affected
+
+
+def _due_on(day):
+    """Q matching dailies whose schedule (repeats/repeat_on) starts a new period on `day`."""
+    weekday = WEEKDAYS[day.weekday()]
+    due = Q(repeats=TasksRepeats.DAILY) & Q(repeat_on__in=[TasksRepeatOn.EVERYDAY, weekday])
+
+    # Weekly dailies reset on their weekday; "everyday" means the start of the week.
+    weekly_on = [weekday, TasksRepeatOn.EVERYDAY] if day.weekday() == 0 else [weekday]
+    due |= Q(repeats=TasksRepeats.WEEKLY) & Q(repeat_on__in=weekly_on)
+
+    if day.day == 1:
+        due |= Q(repeats=TasksRepeats.MONTHLY)
+        if day.month == 1:
+            due |= Q(repeats=TasksRepeats.YEARLY)
+    return due
+
+
+def _interval_aliases(day):
+    """
+    SQL expressions for `repeat_interval`, counted in `repeat_unit` since the daily was
+    created: a daily with interval N only resets every N-th day/week/month.
+    """
+    interval = Greatest(F("repeat_interval"), 1)
+    days_since = Cast(
+        ExtractDay(
+            ExpressionWrapper(
+                Value(day, output_field=DateField()) - TruncDate("created_at"),
+                output_field=DurationField(),
+            )
+        ),
+        IntegerField(),
+    )
+    months_since = Value(day.year * 12 + day.month) - (
+        ExtractYear("created_at") * 12 + ExtractMonth("created_at")
+    )
+    return {
+        "days_offset": Mod(days_since, interval),
+        "weeks_offset": Mod(days_since / 7, interval),
+        "months_offset": Mod(months_since, interval),
+    }
+
+
+def _on_interval():
+    return (
+        Q(repeat_interval__lte=1)
+        | Q(repeat_unit=RepeatUnit.DAYS, days_offset=0)
+        | Q(repeat_unit=RepeatUnit.WEEKS, weeks_offset=0)
+        | Q(repeat_unit=RepeatUnit.MONTHS, months_offset=0)
+    )
+
+
+@shared_task
+def charge_missed_dailies(day=None, chunk_size=DEFAULT_USER_CHUNK):
+    """
+    Charge MISSED_DAILY_HP per daily left incomplete when its period ended on `day`
+    (default: yesterday), i.e. active dailies whose schedule starts a new period on
+    the following day. Dailies created on `day` itself get a grace period.
+
+    Missed dailies are counted per user in a correlated subquery and applied with one
+    Character UPDATE per chunk of user ids, clamped at 0 HP. The per-day
+    ScheduledJobRun marker makes retries safe: a day is never charged twice.
+    Returns the number of characters damaged.
+    """
+    day = day or timezone.localdate() - timedelta(days=1)
+    next_day = day + timedelta(days=1)
+    missed = (
+        Daily.objects.filter(status=TasksStatus.ACTIVE, created_at__date__lt=day)
+        .alias(**_interval_aliases(next_day))
+        .filter(_due_on(next_day), _on_interval())
+    )
+    missed_per_user = (
+        missed.filter(user_id=OuterRef("user_id"))
+        .order_by()
+        .values("user_id")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+
+    def charge_chunk(first_user_id, last_user_id):
+        return (
+            Character.objects.filter(user_id__gte=first_user_id, user_id__lte=last_user_id)
+            .filter(Exists(missed.filter(user_id=OuterRef("user_id"))))
+            .update(
+                current_hp=Greatest(
+                    F("current_hp") - Subquery(missed_per_user) * MISSED_DAILY_HP, 0
+                ),
+                updated_at=timezone.now(),
+            )
+        )
+
+    return run_chunked_job(MISSED_DAILIES_JOB, day, missed, charge_chunk, chunk_size)
+
+
+@shared_task
+def reset_dailies(day=None, chunk_size=DEFAULT_USER_CHUNK):
+    """
+    Reset completed dailies back to active when their schedule starts a new period.
+
+    Missed dailies of the previous day are charged first, while their status still
+    shows them as incomplete. Runs as one set-based UPDATE per chunk of user ids
+    (no Daily objects are loaded) and at most once per calendar day. Returns the
+    number of dailies reset.
+    """
+    day = day or timezone.localdate()
+    charge_missed_dailies(day - timedelta(days=1), chunk_size)
+    completed = Daily.objects.filter(status=TasksStatus.COMPLETED)
+    due = completed.alias(**_interval_aliases(day)).filter(_due_on(day), _on_interval())
+
+    def reset_chunk(first_user_id, last_user_id):
+        return due.filter(user_id__gte=first_user_id, user_id__lte=last_user_id).update(
+            status=TasksStatus.ACTIVE, updated_at=timezone.now()
+        )
+
+    return run_chunked_job(RESET_DAILIES_JOB, day, completed, reset_chunk, chunk_size)
+
+
+@shared_task
+def decay_habit_strength(day=None, after_days=None, chunk_size=DEFAULT_USER_CHUNK):
+    """
+    Lower the strength of active good habits not completed in the last `after_days`
+    days (never-completed habits count from their creation) by one step.
+
+    Each chunk of users is one UPDATE with a CASE built from the shared WEAKEN
+    transition table; habits already at the bottom of the ladder are not touched.
+    Runs at most once per calendar day. Returns the number of habits weakened.
+    """
+    day = day or timezone.localdate()
+    if after_days is None:
+        after_days = getattr(settings, "HABIT_DECAY_AFTER_DAYS", 3)
+    cutoff = day - timedelta(days=after_days)
+
+    stale = (
+        Habit.objects.filter(type=HabitType.GOOD, status=TasksStatus.ACTIVE)
+        .exclude(strength=STRENGTH_LADDER[0])
+        .filter(
+            Q(last_completed_on__lte=cutoff)
+            | Q(last_completed_on__isnull=True, created_at__date__lte=cutoff)
+        )
+    )
+    weakened = transition_case(WEAKEN)
+
+    def decay_chunk(first_user_id, last_user_id):
+        return stale.filter(user_id__gte=first_user_id, user_id__lte=last_user_id).update(
+            strength=weakened, updated_at=timezone.now()
+        )
+
+    return run_chunked_job(DECAY_HABITS_JOB, day, stale, decay_chunk, chunk_size)
+
+
+@shared_task
+def archive_completed_todos(after_days=None, batch_size=DEFAULT_ARCHIVE_BATCH):
+    """
+    Move todos completed more than `after_days` days ago (TODO_ARCHIVE_AFTER_DAYS)
+    from Todo into ArchivedTodo, oldest completions first.
+
+    Each batch is copied with one bulk_create and removed with one DELETE in the same
+    transaction, leaving tombstones so synced clients drop them from the todo list.
+    Rows being edited are skipped (SKIP LOCKED) and picked up by the next run, and a
+    rerun simply finds fewer rows. Returns the number of todos moved.
+    """
+    if after_days is None:
+        after_days = getattr(settings, "TODO_ARCHIVE_AFTER_DAYS", 30)
+    cutoff = timezone.now() - timedelta(days=after_days)
+    stale = Todo.objects.filter(is_completed=True, completed_at__lt=cutoff).order_by(
+        "completed_at", "id"
+    )
+
+    moved = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                stale.select_for_update(skip_locked=True).values(*ARCHIVED_TODO_FIELDS)[:batch_size]
+            )
+            if not rows:
+                return moved
+            ArchivedTodo.objects.bulk_create(
+                [ArchivedTodo(**row) for row in rows], ignore_conflicts=True
+            )
+            Todo.objects.filter(pk__in=[row["id"] for row in rows]).delete()
+            record_deletions(Todo, [(row["user_id"], row["id"]) for row in rows])
+        moved += len(rows)
+
+
+@shared_task
+def prune_task_tombstones(older_than_days=None):
+    """
+    Delete tombstones older than TASK_SYNC_TOMBSTONE_DAYS. Sync tokens that old are
+    answered with a full snapshot, so these rows are no longer needed. Returns the
+    number of tombstones deleted.
+    """
+    if older_than_days is None:
+        older_than_days = getattr(settings, "TASK_SYNC_TOMBSTONE_DAYS", 30)
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    deleted, _ = TaskTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
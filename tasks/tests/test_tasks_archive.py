@@ -0,0 +1,98 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from tasks.models import ArchivedTodo, Todo
+from tasks.tasks import archive_completed_todos
+
+TOMORROW = datetime.date.today() + datetime.timedelta(days=1)
+
+
+def _todo(user, completed_days_ago=None, **kwargs):
+    todo = Todo.objects.create(
+        user=user,
+        name=kwargs.pop("name", "Todo"),
+        due_date=TOMORROW,
+        is_completed=completed_days_ago is not None,
+        **kwargs,
+    )
+    if completed_days_ago is not None:
+        completed_at = timezone.now() - datetime.timedelta(days=completed_days_ago)
+        Todo.objects.filter(pk=todo.pk).update(completed_at=completed_at)
+    return todo
+
+
+@pytest.mark.django_db
+def test_completed_at_follows_is_completed(user):
+    todo = _todo(user)
+    assert todo.completed_at is None
+
+    todo.is_completed = True
+    todo.save()
+    assert todo.completed_at is not None
+
+    todo.is_completed = False
+    todo.save()
+    assert todo.completed_at is None
+
+
+@pytest.mark.django_db
+def test_archive_moves_old_completed_todos_in_batches(user, other_user):
+    old = [_todo(user, completed_days_ago=40, name=f"Old {i}") for i in range(5)]
+    old.append(_todo(other_user, completed_days_ago=31))
+    recent = _todo(user, completed_days_ago=5)
+    open_todo = _todo(user)
+
+    created_at = timezone.now() - datetime.timedelta(days=100)
+    Todo.objects.filter(pk=old[0].pk).update(created_at=created_at)
+    old[0].refresh_from_db()
+
+    assert archive_completed_todos(after_days=30, batch_size=2) == 6
+
+    assert set(Todo.objects.values_list("id", flat=True)) == {recent.id, open_todo.id}
+    archived = ArchivedTodo.objects.get(pk=old[0].pk)
+    assert (archived.user_id, archived.name, archived.is_completed) == (user.id, "Old 0", True)
+    assert archived.completed_at is not None
+    assert archived.created_at == old[0].created_at
+    assert archive_completed_todos(after_days=30) == 0
+
+
+@pytest.mark.django_db
+def test_completed_filter_continues_into_archive(authenticated_client, user):
+    archived = [_todo(user, completed_days_ago=60, name=f"Archived {i}") for i in range(3)]
+    archive_completed_todos(after_days=30)
+    recent = _todo(user, completed_days_ago=1, name="Recent")
+    _todo(user, name="Open")
+    url = reverse("todo-list")
+
+    response = authenticated_client.get(url, {"filter": "completed", "page_size": 2})
+    assert [item["name"] for item in response.data["results"]] == ["Recent"]
+    assert "archived=1" in response.data["next"]
+
+    ids = []
+    response = authenticated_client.get(response.data["next"])
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        ids += [item["id"] for item in response.data["results"]]
+        if not response.data["next"]:
+            break
+        response = authenticated_client.get(response.data["next"])
+
+    assert sorted(ids) == sorted(todo.id for todo in archived)
+    assert recent.id not in ids
+    assert response.data["results"][0]["is_completed"] is True
+
+
+@pytest.mark.django_db
+def test_archive_is_per_user(authenticated_client, other_user):
+    _todo(other_user, completed_days_ago=60)
+    archive_completed_todos(after_days=30)
+
+    response = authenticated_client.get(
+        reverse("todo-list"), {"filter": "completed", "archived": "1"}
+    )
+
+    assert response.data["results"] == []
@@ -0,0 +1,167 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.bulk import MAX_BULK_SIZE
+from tasks.calendar import build_calendar
+from tasks.enums import HabitType, TasksRepeatOn, TasksStatus, TasksStrength
+from tasks.models import Daily, Habit, Todo
+
+TOMORROW = (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+LAST_WEEK = (datetime.date.today() - datetime.timedelta(days=7)).isoformat()
+
+
+@pytest.mark.django_db
+def test_bulk_create_reports_per_item_errors(authenticated_client, user):
+    payload = [
+        {"name": "Drink Water", "type": HabitType.GOOD},
+        {"name": "Broken", "type": "neutral"},
+        {"name": "Snack", "type": HabitType.BAD, "strength": TasksStrength.WEAK},
+    ]
+
+    response = authenticated_client.post(reverse("habit-list"), payload, format="json")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [item["name"] for item in response.data["results"]] == ["Drink Water", "Snack"]
+    assert all(item["id"] for item in response.data["results"])
+    assert [error["index"] for error in response.data["errors"]] == [1]
+    assert "type" in response.data["errors"][0]["errors"]
+    assert set(Habit.objects.filter(user=user).values_list("name", flat=True)) == {
+        "Drink Water",
+        "Snack",
+    }
+
+
+@pytest.mark.django_db
+def test_bulk_create_of_1000_todos_takes_a_handful_of_queries(
+    authenticated_client, user, django_assert_max_num_queries
+):
+    payload = [{"name": f"Todo {i}", "due_date": TOMORROW} for i in range(MAX_BULK_SIZE)]
+
+    with django_assert_max_num_queries(5):
+        response = authenticated_client.post(reverse("todo-list"), payload, format="json")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(response.data["results"]) == MAX_BULK_SIZE
+    assert Todo.objects.filter(user=user).count() == MAX_BULK_SIZE
+
+
+@pytest.mark.django_db
+def test_bulk_create_with_only_invalid_items_returns_400(authenticated_client):
+    payload = [{"name": "Late", "due_date": LAST_WEEK}]
+
+    response = authenticated_client.post(reverse("todo-list"), payload, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["results"] == []
+    assert response.data["errors"][0]["index"] == 0
+
+
+@pytest.mark.django_db
+def test_bulk_payload_size_is_limited(authenticated_client):
+    payload = [{"name": "x", "type": HabitType.GOOD}] * (MAX_BULK_SIZE + 1)
+
+    response = authenticated_client.post(reverse("habit-list"), payload, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not Habit.objects.exists()
+
+
+@pytest.mark.django_db
+def test_single_create_still_works(authenticated_client):
+    response = authenticated_client.post(
+        reverse("habit-list"), {"name": "Single", "type": HabitType.GOOD}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["name"] == "Single"
+
+
+@pytest.mark.django_db
+def test_bulk_patch_updates_own_tasks_and_reports_errors(
+    authenticated_client, user, other_user, django_assert_max_num_queries
+):
+    mine = Habit.objects.bulk_create(
+        [Habit(user=user, name=f"Habit {i}", type=HabitType.GOOD) for i in range(3)]
+    )
+    foreign = Habit.objects.create(user=other_user, name="Foreign", type=HabitType.GOOD)
+    payload = [
+        {"id": mine[0].id, "name": "Renamed"},
+        {"id": mine[1].id, "status": TasksStatus.INACTIVE},
+        {"id": foreign.id, "name": "Hijacked"},
+        {"id": mine[2].id, "type": "neutral"},
+        {"name": "No id"},
+        {"id": mine[0].id, "name": "Twice"},
+    ]
+
+    with django_assert_max_num_queries(4):
+        response = authenticated_client.patch(reverse("habit-list"), payload, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.data["results"]] == [mine[0].id, mine[1].id]
+    assert [error["index"] for error in response.data["errors"]] == [2, 3, 4, 5]
+    assert list(Habit.objects.filter(user=user).order_by("id").values_list("name", "status")) == [
+        ("Renamed", TasksStatus.ACTIVE),
+        ("Habit 1", TasksStatus.INACTIVE),
+        ("Habit 2", TasksStatus.ACTIVE),
+    ]
+    foreign.refresh_from_db()
+    assert foreign.name == "Foreign"
+
+
+@pytest.mark.django_db
+def test_bulk_patch_keeps_todo_completed_at_in_step(authenticated_client, user):
+    todos = Todo.objects.bulk_create(
+        [Todo(user=user, name=f"Todo {i}", due_date=TOMORROW) for i in range(2)]
+    )
+    payload = [{"id": todo.id, "is_completed": True} for todo in todos]
+
+    response = authenticated_client.patch(reverse("todo-list"), payload, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert all(item["completed_at"] for item in response.data["results"])
+    assert not Todo.objects.filter(user=user, completed_at__isnull=True).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_writes_invalidate_daily_calendar(authenticated_client, user):
+    cache.clear()
+    start = datetime.date.today()
+    assert build_calendar(user, start, start)["dailies"] == []
+
+    response = authenticated_client.post(
+        reverse("daily-list"), [{"name": "Stretch"}], format="json"
+    )
+    assert [d["name"] for d in build_calendar(user, start, start)["dailies"]] == ["Stretch"]
+
+    daily_id = response.data["results"][0]["id"]
+    authenticated_client.patch(
+        reverse("daily-list"),
+        [{"id": daily_id, "repeat_on": TasksRepeatOn.EVERYDAY, "name": "Yoga"}],
+        format="json",
+    )
+    assert [d["name"] for d in build_calendar(user, start, start)["dailies"]] == ["Yoga"]
+    assert Daily.objects.get(pk=daily_id).name == "Yoga"
+
+    authenticated_client.patch(
+        reverse("daily-list"), [{"id": daily_id, "status": TasksStatus.INACTIVE}], format="json"
+    )
+    assert build_calendar(user, start, start)["dailies"] == []
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_failed_bulk_write_leaves_nothing_behind(authenticated_client, user, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("hook failed after the insert")
+
+    monkeypatch.setattr("tasks.bulk.bump_data_version", fail)
+    payload = [{"name": f"Todo {i}", "due_date": TOMORROW} for i in range(3)]
+
+    with pytest.raises(RuntimeError):
+        authenticated_client.post(reverse("todo-list"), payload, format="json")
+
+    assert not Todo.objects.filter(user=user).exists()
@@ -0,0 +1,168 @@
+import datetime
+import time
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from tasks.calendar import build_calendar, expand_schedules
+from tasks.enums import RepeatUnit, TasksRepeatOn, TasksRepeats, TasksStatus
+from tasks.models import Daily
+from tasks.tasks import _due_on, _interval_aliases, _on_interval
+
+START = datetime.date(2025, 11, 1)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _daily(user, created=datetime.date(2025, 10, 20), **kwargs):
+    daily = Daily.objects.create(user=user, name=kwargs.pop("name", "Daily"), **kwargs)
+    created_at = timezone.make_aware(datetime.datetime.combine(created, datetime.time(12)))
+    Daily.objects.filter(pk=daily.pk).update(created_at=created_at)
+    daily.refresh_from_db()
+    return daily
+
+
+@pytest.mark.django_db
+def test_expansion_matches_reset_job_schedule(user):
+    variants = [
+        {},
+        {"repeat_on": TasksRepeatOn.WEDNESDAY},
+        {"repeats": TasksRepeats.WEEKLY},
+        {"repeats": TasksRepeats.WEEKLY, "repeat_on": TasksRepeatOn.FRIDAY},
+        {"repeats": TasksRepeats.MONTHLY},
+        {"repeats": TasksRepeats.YEARLY},
+        {"repeat_interval": 3},
+        {"repeat_interval": 2, "repeat_unit": RepeatUnit.WEEKS},
+        {"repeats": TasksRepeats.MONTHLY, "repeat_interval": 2, "repeat_unit": RepeatUnit.MONTHS},
+    ]
+    for variant in variants:
+        _daily(user, **variant)
+    end = START + datetime.timedelta(days=120)
+
+    days = build_calendar(user, START, end)["days"]
+
+    day = START
+    while day <= end:
+        expected = (
+            Daily.objects.alias(**_interval_aliases(day))
+            .filter(_due_on(day), _on_interval())
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        assert days[day.isoformat()] == list(expected), day
+        day += datetime.timedelta(days=1)
+
+
+def test_expansion_skips_days_before_creation():
+    created = START + datetime.timedelta(days=5)
+    schedules = [(TasksRepeats.DAILY, TasksRepeatOn.EVERYDAY, 1, RepeatUnit.DAYS, created)]
+
+    due = expand_schedules(schedules, START, START + datetime.timedelta(days=9))
+
+    assert due.tolist() == [[False] * 5 + [True] * 5]
+
+
+def test_year_view_for_500_dailies_is_fast():
+    schedules = [
+        (TasksRepeats.DAILY, TasksRepeatOn.EVERYDAY, i % 4 + 1, RepeatUnit.DAYS, START)
+        for i in range(500)
+    ]
+
+    started = time.perf_counter()
+    due = expand_schedules(schedules, START, START + datetime.timedelta(days=364))
+    elapsed = time.perf_counter() - started
+
+    assert due.shape == (500, 365)
+    assert elapsed < 0.5
+
+
+@pytest.mark.django_db
+def test_calendar_endpoint_lists_due_dailies(authenticated_client, user, other_user):
+    daily = _daily(user, name="Stretch", repeat_on=TasksRepeatOn.MONDAY)
+    _daily(user, status=TasksStatus.INACTIVE)
+    _daily(other_user)
+
+    response = authenticated_client.get(
+        reverse("daily-calendar"), {"from": "2025-11-01", "to": "2025-11-10"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["dailies"] == [{"id": daily.id, "name": "Stretch"}]
+    assert len(response.data["days"]) == 10
+    assert [day for day, ids in response.data["days"].items() if ids] == [
+        "2025-11-03",
+        "2025-11-10",
+    ]
+
+
+@pytest.mark.django_db
+def test_calendar_defaults_to_next_30_days(authenticated_client):
+    response = authenticated_client.get(reverse("daily-calendar"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["from"] == timezone.localdate().isoformat()
+    assert len(response.data["days"]) == 30
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"from": "tomorrow"},
+        {"from": "2025-11-10", "to": "2025-11-01"},
+        {"from": "2025-01-01", "to": "2026-01-02"},
+    ],
+)
+def test_calendar_rejects_invalid_ranges(authenticated_client, params):
+    response = authenticated_client.get(reverse("daily-calendar"), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "detail" in response.data
+
+
+@pytest.mark.django_db
+def test_calendar_is_cached_until_a_daily_changes(user, django_assert_num_queries):
+    daily = _daily(user)
+    end = START + datetime.timedelta(days=6)
+    build_calendar(user, START, end)
+
+    with django_assert_num_queries(0):
+        build_calendar(user, START, end)
+
+    daily.current_streak = 3
+    daily.save(update_fields=["strength", "current_streak"])
+    with django_assert_num_queries(0):
+        build_calendar(user, START, end)
+
+    daily.status = TasksStatus.INACTIVE
+    daily.save(update_fields=["status"])
+    assert build_calendar(user, START, end)["dailies"] == []
+    daily.status = TasksStatus.ACTIVE
+    daily.save(update_fields=["status"])
+
+    daily.repeat_on = TasksRepeatOn.SUNDAY
+    daily.save()
+    assert sum(map(len, build_calendar(user, START, end)["days"].values())) == 1
+
+    daily.delete()
+    assert build_calendar(user, START, end)["dailies"] == []
+
+
+@pytest.mark.django_db
+def test_evicted_version_does_not_revive_old_entries(user):
+    daily = _daily(user)
+    end = START + datetime.timedelta(days=6)
+    build_calendar(user, START, end)
+
+    cache.delete(f"tasks:daily-calendar-version:{user.pk}")
+    Daily.objects.filter(pk=daily.pk).update(name="Renamed")  # no signal, as if evicted first
+
+    assert build_calendar(user, START, end)["dailies"][0]["name"] == "Renamed"
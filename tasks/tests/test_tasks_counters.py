@@ -0,0 +1,82 @@
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.enums import TaskType
+from tasks.models import Habit, TaskCompletion
+
+
+def _completed_at(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time(9)))
+
+
+def test_register_completion_tracks_streaks():
+    habit = Habit()
+    day = datetime.date(2025, 11, 3)
+
+    habit.register_completion(day)
+    habit.register_completion(day)
+    habit.register_completion(day + datetime.timedelta(days=1))
+    assert (habit.current_streak, habit.best_streak, habit.total_completions) == (2, 2, 3)
+
+    habit.register_completion(day + datetime.timedelta(days=5))
+    assert (habit.current_streak, habit.best_streak, habit.total_completions) == (1, 2, 4)
+    assert habit.streak_as_of(day + datetime.timedelta(days=6)) == 1
+    assert habit.streak_as_of(day + datetime.timedelta(days=7)) == 0
+
+
+@pytest.mark.django_db
+def test_complete_updates_counters(authenticated_client, habit):
+    url = reverse("habit-complete-habit", args=[habit.id])
+    authenticated_client.post(url)
+    response = authenticated_client.post(url)
+
+    assert response.data["habit"]["total_completions"] == 2
+    assert response.data["habit"]["current_streak"] == 1
+    habit.refresh_from_db()
+    assert habit.last_completed_on == timezone.localdate()
+
+
+@pytest.mark.django_db
+def test_habit_list_exposes_counters_without_extra_queries(
+    authenticated_client, user, django_assert_max_num_queries
+):
+    Habit.objects.bulk_create(
+        [Habit(user=user, name=f"Habit {i}", type="good", total_completions=i) for i in range(20)]
+    )
+    with django_assert_max_num_queries(3):
+        response = authenticated_client.get(reverse("habit-list"))
+    assert {"current_streak", "best_streak", "total_completions"} <= set(
+        response.data["results"][0]
+    )
+
+
+@pytest.mark.django_db
+def test_rebuild_task_counters_from_history(user, habit, daily):
+    today = timezone.localdate()
+    days = [today - datetime.timedelta(days=n) for n in (6, 5, 4, 1, 0, 0)]
+    TaskCompletion.objects.bulk_create(
+        [
+            TaskCompletion(
+                user=user, task_type=TaskType.HABIT, task_id=habit.id, completed_at=_completed_at(d)
+            )
+            for d in days
+        ]
+        + [TaskCompletion(user=user, task_type=TaskType.HABIT, task_id=999999)]
+    )
+    Habit.objects.filter(pk=habit.pk).update(total_completions=42, best_streak=42)
+    daily.total_completions = 3
+    daily.save()
+
+    call_command("rebuild_task_counters", batch_size=1)
+
+    habit.refresh_from_db()
+    daily.refresh_from_db()
+    assert habit.total_completions == 6
+    assert habit.best_streak == 3
+    assert habit.current_streak == 2
+    assert habit.last_completed_on == today
+    assert daily.total_completions == 0
@@ -0,0 +1,69 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.enums import HabitType, TasksStatus
+from tasks.models import Daily, Habit, Todo
+
+TODAY = datetime.date.today()
+
+
+def _task_queries(context):
+    return [q for q in context.captured_queries if '"tasks_' in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_counts_per_status(authenticated_client, user, other_user, habit, bad_habit, daily):
+    Daily.objects.create(user=user, name="Done", status=TasksStatus.COMPLETED)
+    Todo.objects.create(user=user, name="Planned", due_date=TODAY + datetime.timedelta(days=3))
+    Todo.objects.create(user=user, name="Today", due_date=TODAY)
+    Todo.objects.bulk_create(
+        [Todo(user=user, name="Late", due_date=TODAY - datetime.timedelta(days=2))]
+    )
+    Todo.objects.create(user=user, name="Done", due_date=TODAY, is_completed=True)
+    Habit.objects.create(user=other_user, name="Other", type=HabitType.GOOD)
+
+    with CaptureQueriesContext(connection) as context:
+        response = authenticated_client.get(reverse("task-counts"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {
+        "habits": {"total": 2, "good": 1, "bad": 1},
+        "dailies": {"total": 2, "active": 1, "completed": 1, "inactive": 0},
+        "todos": {"total": 4, "active": 3, "planned": 1, "completed": 1, "overdue": 1},
+    }
+    assert len(_task_queries(context)) == 3
+
+
+@pytest.mark.django_db
+def test_counts_are_cached_until_a_write(authenticated_client, user, habit):
+    url = reverse("task-counts")
+    authenticated_client.get(url)
+
+    with CaptureQueriesContext(connection) as context:
+        cached = authenticated_client.get(url)
+    assert cached.data["habits"]["total"] == 1
+    assert _task_queries(context) == []
+
+    Habit.objects.create(user=user, name="Meditate", type=HabitType.GOOD)
+
+    assert authenticated_client.get(url).data["habits"]["total"] == 2
+
+
+@pytest.mark.django_db
+def test_counts_etag(authenticated_client, habit):
+    url = reverse("task-counts")
+    etag = authenticated_client.get(url)["ETag"]
+
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_counts_require_auth(api_client):
+    assert api_client.get(reverse("task-counts")).status_code == status.HTTP_401_UNAUTHORIZED
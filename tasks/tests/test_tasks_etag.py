@@ -0,0 +1,96 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.enums import TaskType
+from tasks.models import Habit
+from tasks.tasks import decay_habit_strength
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _etag(client, url):
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    return response["ETag"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["habit-list", "daily-list", "todo-list"])
+def test_unchanged_list_is_304_without_running_the_query(
+    authenticated_client, habit, daily, todo, url_name, django_assert_num_queries
+):
+    url = reverse(url_name)
+    etag = _etag(authenticated_client, url)
+
+    with django_assert_num_queries(0):
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert not response.content
+
+
+@pytest.mark.django_db
+def test_detail_supports_if_none_match(authenticated_client, habit):
+    url = reverse("habit-detail", args=[habit.id])
+    etag = _etag(authenticated_client, url)
+
+    assert authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+
+@pytest.mark.django_db
+def test_task_writes_change_the_etag(authenticated_client, user, habit, daily):
+    url = reverse("habit-list")
+    etags = [_etag(authenticated_client, url)]
+
+    authenticated_client.patch(
+        reverse("habit-detail", args=[habit.id]), {"name": "Renamed"}, format="json"
+    )
+    etags.append(_etag(authenticated_client, url))
+
+    authenticated_client.post(
+        reverse("habit-list"), [{"name": "Bulk", "type": "good"}], format="json"
+    )
+    etags.append(_etag(authenticated_client, url))
+
+    authenticated_client.post(
+        reverse("task-complete-batch"),
+        {"tasks": [{"type": TaskType.DAILY, "id": daily.id}]},
+        format="json",
+    )
+    etags.append(_etag(authenticated_client, url))
+
+    authenticated_client.delete(reverse("habit-detail", args=[habit.id]))
+    etags.append(_etag(authenticated_client, url))
+
+    assert len(set(etags)) == len(etags)
+
+
+@pytest.mark.django_db
+def test_jobs_change_every_users_etag(authenticated_client, user):
+    habit = Habit.objects.create(user=user, name="Stale", type="good", strength="strong")
+    Habit.objects.filter(pk=habit.pk).update(created_at=habit.created_at.replace(year=2020))
+    url = reverse("habit-list")
+    etag = _etag(authenticated_client, url)
+
+    assert decay_habit_strength() == 1
+
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"][0]["strength"] != "strong"
+
+
+@pytest.mark.django_db
+def test_etags_are_per_user(authenticated_client, api_client, other_user):
+    url = reverse("habit-list")
+    etag = _etag(authenticated_client, url)
+    api_client.force_authenticate(user=other_user)
+
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
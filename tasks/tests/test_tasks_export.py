@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from tasks.enums import TaskType
+from tasks.export import EXPORT_COLUMNS, export_rows
+from tasks.models import ArchivedTodo, Habit
+
+
+def _content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.fixture
+def archived_todo(user):
+    return ArchivedTodo.objects.create(
+        id=10_000,
+        user=user,
+        name="Old Todo",
+        due_date=timezone.localdate(),
+        created_at=timezone.now(),
+    )
+
+
+@pytest.mark.django_db
+def test_export_ndjson_streams_every_task(
+    authenticated_client, habit, daily, todo, archived_todo, other_user
+):
+    Habit.objects.create(user=other_user, name="Not mine", type="good")
+
+    response = authenticated_client.get(reverse("task-export"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson; charset=utf-8"
+    assert 'filename="tasks-' in response["Content-Disposition"]
+    rows = [json.loads(line) for line in _content(response).splitlines()]
+    assert [(row["task_type"], row["id"]) for row in rows] == [
+        (TaskType.HABIT, habit.id),
+        (TaskType.DAILY, daily.id),
+        (TaskType.TODO, todo.id),
+        (TaskType.TODO, archived_todo.id),
+    ]
+    assert rows[0]["type"] == habit.type
+    assert rows[1]["repeats"] == daily.repeats
+    assert rows[2]["due_date"] == todo.due_date.isoformat()
+    assert [rows[2]["archived"], rows[3]["archived"]] == [False, True]
+
+
+@pytest.mark.django_db
+def test_export_csv_has_header_and_one_row_per_task(authenticated_client, habit, todo):
+    response = authenticated_client.get(reverse("task-export"), {"format": "csv"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+    rows = list(csv.DictReader(io.StringIO(_content(response))))
+    assert list(rows[0]) == EXPORT_COLUMNS
+    assert [(row["task_type"], row["name"]) for row in rows] == [
+        (TaskType.HABIT, habit.name),
+        (TaskType.TODO, todo.name),
+    ]
+    assert rows[0]["due_date"] == ""
+    assert rows[1]["due_date"] == todo.due_date.isoformat()
+
+
+@pytest.mark.django_db
+def test_export_unknown_format_is_not_found(authenticated_client):
+    response = authenticated_client.get(reverse("task-export"), {"format": "xml"})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_export_requires_authentication(api_client):
+    response = api_client.get(reverse("task-export"))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_export_rows_runs_one_query_per_table(user, django_assert_num_queries):
+    Habit.objects.bulk_create([Habit(user=user, name=f"Habit {i}", type="good") for i in range(25)])
+
+    with django_assert_num_queries(4):
+        rows = list(export_rows(user, chunk_size=10))
+
+    assert len(rows) == 25
@@ -0,0 +1,138 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from habit_tracker_rpg.fast_list import compile_row_builder, fast_list_data
+from inventory.models import Item, UserItem
+from inventory.serializers import CharacterSerializer, ItemSerializer, UserItemSerializer
+from tasks.models import ArchivedTodo, Daily, Habit, Todo
+from tasks.serializers import (
+    ArchivedTodoSerializer,
+    DailySerializer,
+    HabitSerializer,
+    TodoSerializer,
+)
+
+
+def _as_json(data):
+    """Rendered form, so OrderedDicts and dicts compare equal"""
+    return [dict(row) for row in data]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model, serializer_class",
+    [(Habit, HabitSerializer), (Daily, DailySerializer), (Todo, TodoSerializer)],
+)
+def test_fast_path_matches_serializer(
+    model, serializer_class, habit, bad_habit, daily, todo, completed_todo
+):
+    today = timezone.localdate()
+    Habit.objects.filter(pk=habit.pk).update(current_streak=4, last_completed_on=today)
+    Daily.objects.filter(pk=daily.pk).update(
+        current_streak=2, last_completed_on=today - timedelta(days=5), repeat_on=["mon", "fri"]
+    )
+    queryset = model.objects.order_by("id")
+
+    assert fast_list_data(serializer_class(), queryset) == _as_json(
+        serializer_class(queryset, many=True).data
+    )
+
+
+@pytest.mark.django_db
+def test_fast_path_matches_serializer_for_items(user):
+    sword = Item.objects.create(
+        name="Sword", description="Sharp", value="12.50", bonuses={"strength": 2}
+    )
+    Item.objects.create(name="Potion", description="Heals", value=3, consumable=True)
+    UserItem.objects.create(user=user, item=sword, quantity=2, is_equipped=True)
+
+    items = Item.objects.order_by("id")
+    owned = UserItem.objects.order_by("id")
+
+    assert fast_list_data(ItemSerializer(), items) == _as_json(
+        ItemSerializer(items, many=True).data
+    )
+    assert fast_list_data(UserItemSerializer(), owned) == [
+        {**row, "item": dict(row["item"])} for row in UserItemSerializer(owned, many=True).data
+    ]
+
+
+@pytest.mark.django_db
+def test_uncompilable_serializer_falls_back():
+    # reverse many relation (items) and a nested one-to-one reverse (equipment)
+    assert compile_row_builder(CharacterSerializer()) is None
+
+
+@pytest.mark.django_db
+def test_list_endpoint_reads_values_and_keeps_pagination(authenticated_client, user):
+    for i in range(3):
+        Todo.objects.create(user=user, name=f"Todo {i}", due_date=f"2099-01-0{i + 1}")
+    url = reverse("todo-list")
+
+    with CaptureQueriesContext(connection) as context:
+        first = authenticated_client.get(url, {"page_size": 2})
+    (sql,) = [q["sql"] for q in context.captured_queries if '"tasks_todo"' in q["sql"]]
+    assert '"tasks_todo"."search_vector"' not in sql  # only serialized columns are read
+
+    second = authenticated_client.get(first.data["next"])
+    previous = authenticated_client.get(second.data["previous"])
+
+    expected = _as_json(TodoSerializer(Todo.objects.order_by("due_date"), many=True).data)
+    assert first.data["results"] == expected[:2]
+    assert second.data["results"] == expected[2:]
+    assert previous.data["results"] == expected[:2]
+
+
+@pytest.mark.django_db
+def test_list_endpoint_with_sparse_fields_and_search(authenticated_client, user):
+    Habit.objects.create(user=user, name="Read a book", notes="fiction")
+    Habit.objects.create(user=user, name="Read news", notes="book reviews")
+    Habit.objects.create(user=user, name="Run")
+
+    response = authenticated_client.get(
+        reverse("habit-list"), {"search": "book", "fields": "name,current_streak"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(row["name"] for row in response.data["results"]) == [
+        "Read a book",
+        "Read news",
+    ]
+    assert all(set(row) == {"name", "current_streak"} for row in response.data["results"])
+
+
+@pytest.mark.django_db
+def test_archive_list_matches_serializer(authenticated_client, user, completed_todo):
+    archived = ArchivedTodo.objects.create(
+        id=completed_todo.id + 1000,
+        user=user,
+        name="Old",
+        due_date=completed_todo.due_date,
+        created_at=completed_todo.created_at,
+    )
+
+    response = authenticated_client.get(
+        reverse("todo-list"), {"filter": "completed", "archived": "1"}
+    )
+
+    assert response.data["results"] == _as_json(ArchivedTodoSerializer([archived], many=True).data)
+
+
+@pytest.mark.django_db
+def test_user_item_list_endpoint(authenticated_client, user, other_user):
+    sword = Item.objects.create(name="Sword", description="Sharp", value=10)
+    mine = UserItem.objects.create(user=user, item=sword)
+    UserItem.objects.create(user=other_user, item=sword)
+
+    response = authenticated_client.get(reverse("user-items-list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [
+        {**UserItemSerializer(mine).data, "item": dict(ItemSerializer(sword).data)}
+    ]
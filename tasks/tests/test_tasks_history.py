@@ -0,0 +1,164 @@
+import time
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.enums import TaskType
+from tasks.history import CompletionBuffer, completion_buffer, record_completion
+from tasks.models import TaskCompletion
+from users.models import Character
+
+
+@pytest.fixture(autouse=True)
+def empty_buffer():
+    """Make sure no rows leak between tests through the module-level buffer"""
+    completion_buffer.flush()
+    yield
+    completion_buffer._rows.clear()
+    completion_buffer._failures = 0
+
+
+def _failing_bulk_create(*args, **kwargs):
+    raise RuntimeError("database unavailable")
+
+
+@pytest.mark.django_db
+def test_buffer_flushes_with_bulk_create_when_full(user, django_assert_num_queries):
+    # In the test transaction the flush adds a SAVEPOINT/RELEASE around its one INSERT
+    buffer = CompletionBuffer(max_size=3, max_age=60)
+    rows = [TaskCompletion(user=user, task_type=TaskType.HABIT, task_id=i) for i in range(3)]
+
+    buffer.add(rows[0])
+    buffer.add(rows[1])
+    assert TaskCompletion.objects.count() == 0
+    assert len(buffer) == 2
+
+    with django_assert_num_queries(3) as captured:
+        buffer.add(rows[2])
+
+    assert sum(query["sql"].startswith("INSERT") for query in captured.captured_queries) == 1
+
+    assert len(buffer) == 0
+    assert TaskCompletion.objects.filter(user=user).count() == 3
+
+
+@pytest.mark.django_db
+def test_buffer_flushes_stale_rows(user):
+    buffer = CompletionBuffer(max_size=100, max_age=0)
+    buffer.add(TaskCompletion(user=user, task_type=TaskType.TODO, task_id=1))
+    assert TaskCompletion.objects.filter(user=user).count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_quiet_buffer_is_flushed_by_timer(user):
+    buffer = CompletionBuffer(max_size=100, max_age=0.1)
+    buffer.add(TaskCompletion(user=user, task_type=TaskType.TODO, task_id=1))
+    assert len(buffer) == 1
+
+    deadline = time.monotonic() + 5
+    while len(buffer) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    time.sleep(0.1)  # let the timer's bulk_create finish
+
+    assert TaskCompletion.objects.filter(user=user).count() == 1
+
+
+@pytest.mark.django_db
+def test_failed_flush_keeps_rows_for_retry(user, monkeypatch):
+    buffer = CompletionBuffer(max_size=100, max_age=60, max_retries=2)
+    buffer.add(TaskCompletion(user=user, task_type=TaskType.HABIT, task_id=1))
+
+    with monkeypatch.context() as patch:
+        patch.setattr(TaskCompletion.objects, "bulk_create", _failing_bulk_create)
+        assert buffer.flush() == 0
+    assert len(buffer) == 1
+
+    assert buffer.flush() == 1
+    assert TaskCompletion.objects.filter(user=user).count() == 1
+
+
+@pytest.mark.django_db
+def test_rows_are_dropped_after_max_retries(user, monkeypatch):
+    buffer = CompletionBuffer(max_size=100, max_age=60, max_retries=2)
+    buffer.add(TaskCompletion(user=user, task_type=TaskType.HABIT, task_id=1))
+    monkeypatch.setattr(TaskCompletion.objects, "bulk_create", _failing_bulk_create)
+
+    buffer.flush()
+    assert len(buffer) == 1
+    buffer.flush()
+    assert len(buffer) == 0
+
+
+@pytest.mark.django_db
+def test_history_failure_does_not_fail_idempotent_completion(
+    authenticated_client, user, habit, monkeypatch, django_capture_on_commit_callbacks
+):
+    cache.clear()
+    monkeypatch.setattr(completion_buffer, "max_size", 1)
+    monkeypatch.setattr(TaskCompletion.objects, "bulk_create", _failing_bulk_create)
+    url = reverse("habit-complete-habit", args=[habit.id])
+
+    for _ in range(2):
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.post(url, HTTP_IDEMPOTENCY_KEY="history-down")
+        assert response.status_code == status.HTTP_200_OK
+
+    assert response["Idempotent-Replayed"] == "true"
+    assert Character.objects.get(user=user).current_exp == 10
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_record_completion_waits_for_commit(user, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        record_completion(user.pk, TaskType.DAILY, 42, exp_delta=15)
+    assert len(completion_buffer) == 0
+
+    callbacks[0]()
+    completion_buffer.flush()
+    completion = TaskCompletion.objects.get(user=user)
+    assert (completion.task_type, completion.task_id, completion.exp_delta) == ("daily", 42, 15)
+
+
+@pytest.mark.django_db
+def test_complete_actions_append_history(
+    authenticated_client, user, habit, bad_habit, daily, todo, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        for url in [
+            reverse("habit-complete-habit", args=[habit.id]),
+            reverse("habit-complete-habit", args=[bad_habit.id]),
+            reverse("daily-complete-daily", args=[daily.id]),
+            reverse("todo-complete-todo", args=[todo.id]),
+        ]:
+            assert authenticated_client.post(url).status_code == status.HTTP_200_OK
+    completion_buffer.flush()
+
+    history = TaskCompletion.objects.filter(user=user).order_by("completed_at")
+    assert [(c.task_type, c.task_id, c.exp_delta, c.hp_delta) for c in history] == [
+        ("habit", habit.id, 10, 0),
+        ("habit", bad_habit.id, 0, -5),
+        ("daily", daily.id, 15, 0),
+        ("todo", todo.id, 20, 0),
+    ]
+
+
+@pytest.mark.django_db
+def test_complete_batch_appends_history(
+    authenticated_client, user, habit, daily, django_capture_on_commit_callbacks
+):
+    data = {
+        "tasks": [
+            {"type": "habit", "id": habit.id},
+            {"type": "daily", "id": daily.id},
+            {"type": "daily", "id": daily.id},
+        ]
+    }
+    with django_capture_on_commit_callbacks(execute=True):
+        authenticated_client.post(reverse("task-complete-batch"), data, format="json")
+    completion_buffer.flush()
+
+    # The rejected second daily entry must not be recorded
+    assert TaskCompletion.objects.filter(user=user).count() == 2
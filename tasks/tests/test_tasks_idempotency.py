@@ -0,0 +1,137 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.checks import check_idempotency_cache
+from tasks.enums import TasksStatus
+from tasks.idempotency import IN_PROGRESS, _cache_key
+from users.models import Character
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _complete(client, url, key, **kwargs):
+    return client.post(url, HTTP_IDEMPOTENCY_KEY=key, **kwargs)
+
+
+@pytest.mark.django_db
+def test_retry_replays_response_without_queries(
+    authenticated_client, user, habit, django_assert_num_queries
+):
+    url = reverse("habit-complete-habit", args=[habit.id])
+    first = _complete(authenticated_client, url, "retry-1")
+
+    with django_assert_num_queries(0):
+        retry = _complete(authenticated_client, url, "retry-1")
+
+    assert first.status_code == retry.status_code == status.HTTP_200_OK
+    assert retry.data == first.data
+    assert retry["Idempotent-Replayed"] == "true"
+    assert Character.objects.get(user=user).current_exp == 10
+
+
+@pytest.mark.django_db
+def test_new_key_completes_again(authenticated_client, user, habit):
+    url = reverse("habit-complete-habit", args=[habit.id])
+
+    _complete(authenticated_client, url, "a")
+    response = _complete(authenticated_client, url, "b")
+
+    assert "Idempotent-Replayed" not in response
+    assert Character.objects.get(user=user).current_exp == 20
+
+
+@pytest.mark.django_db
+def test_error_responses_are_replayed(authenticated_client, daily):
+    daily.status = TasksStatus.COMPLETED
+    daily.save()
+    url = reverse("daily-complete-daily", args=[daily.id])
+
+    first = _complete(authenticated_client, url, "done")
+    retry = _complete(authenticated_client, url, "done")
+
+    assert first.status_code == retry.status_code == status.HTTP_400_BAD_REQUEST
+    assert retry["Idempotent-Replayed"] == "true"
+
+
+@pytest.mark.django_db
+def test_keys_are_scoped_per_user(api_client, user, other_user, habit):
+    other_habit = habit.__class__.objects.create(user=other_user, name="Walk", type="good")
+    api_client.force_authenticate(user=user)
+    _complete(api_client, reverse("habit-complete-habit", args=[habit.id]), "shared")
+
+    api_client.force_authenticate(user=other_user)
+    response = _complete(
+        api_client, reverse("habit-complete-habit", args=[other_habit.id]), "shared"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "Idempotent-Replayed" not in response
+    assert Character.objects.get(user=other_user).current_exp == 10
+
+
+@pytest.mark.django_db
+def test_request_in_progress_returns_conflict(authenticated_client, user, todo, rf):
+    url = reverse("todo-complete-todo", args=[todo.id])
+    request = rf.post(url)
+    request.user = user
+    cache.set(_cache_key(request, "slow"), IN_PROGRESS)
+
+    response = _complete(authenticated_client, url, "slow")
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    todo.refresh_from_db()
+    assert not todo.is_completed
+
+
+@pytest.mark.django_db
+def test_batch_completion_is_idempotent(authenticated_client, user, todo):
+    url = reverse("task-complete-batch")
+    payload = {"tasks": [{"type": "todo", "id": todo.id}]}
+
+    first = _complete(authenticated_client, url, "batch", data=payload, format="json")
+    retry = _complete(authenticated_client, url, "batch", data=payload, format="json")
+
+    assert retry.data == first.data
+    assert retry["Idempotent-Replayed"] == "true"
+    assert Character.objects.get(user=user).current_exp == 20
+
+
+@pytest.mark.django_db
+def test_overlong_key_is_rejected(authenticated_client, habit):
+    url = reverse("habit-complete-habit", args=[habit.id])
+
+    response = _complete(authenticated_client, url, "k" * 256)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_requests_without_key_are_not_deduplicated(authenticated_client, user, habit):
+    url = reverse("habit-complete-habit", args=[habit.id])
+
+    authenticated_client.post(url)
+    authenticated_client.post(url)
+
+    assert Character.objects.get(user=user).current_exp == 20
+
+
+@pytest.mark.parametrize(
+    "backend, warned",
+    [
+        ("django.core.cache.backends.locmem.LocMemCache", True),
+        ("django.core.cache.backends.dummy.DummyCache", True),
+        ("django.core.cache.backends.redis.RedisCache", False),
+    ],
+)
+def test_process_local_cache_is_reported(settings, backend, warned):
+    settings.DEBUG = False
+    settings.CACHES = {"default": {"BACKEND": backend, "LOCATION": "redis://localhost:6379"}}
+
+    assert [w.id for w in check_idempotency_cache(None)] == (["tasks.W001"] if warned else [])
@@ -0,0 +1,91 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.models import Habit, Todo
+
+
+def _collect(client, url, params=None):
+    """Follow `next` links and return all pages"""
+    pages = []
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data)
+        if not response.data["next"]:
+            return pages
+        response = client.get(response.data["next"])
+
+
+@pytest.mark.django_db
+def test_habit_list_is_keyset_paginated(authenticated_client, user):
+    habits = Habit.objects.bulk_create(
+        [Habit(user=user, name=f"Habit {i}", type="good") for i in range(7)]
+    )
+
+    pages = _collect(authenticated_client, reverse("habit-list"), {"page_size": 3})
+
+    assert [len(page["results"]) for page in pages] == [3, 3, 1]
+    assert "count" not in pages[0]
+    assert pages[0]["previous"] is None
+    ids = [item["id"] for page in pages for item in page["results"]]
+    assert ids == sorted((h.id for h in habits), reverse=True)
+
+
+@pytest.mark.django_db
+def test_previous_link_returns_previous_page(authenticated_client, user):
+    Habit.objects.bulk_create([Habit(user=user, name=f"Habit {i}", type="good") for i in range(5)])
+    first = authenticated_client.get(reverse("habit-list"), {"page_size": 2}).data
+    second = authenticated_client.get(first["next"]).data
+
+    back = authenticated_client.get(second["previous"]).data
+
+    assert [item["id"] for item in back["results"]] == [item["id"] for item in first["results"]]
+    assert back["previous"] is None
+
+
+@pytest.mark.django_db
+def test_todo_pagination_orders_by_due_date(authenticated_client, user):
+    today = datetime.date.today()
+    Todo.objects.bulk_create(
+        [
+            Todo(user=user, name=f"Todo {i}", due_date=today + datetime.timedelta(days=i % 3))
+            for i in range(6)
+        ]
+    )
+
+    pages = _collect(authenticated_client, reverse("todo-list"), {"page_size": 4})
+
+    due_dates = [item["due_date"] for page in pages for item in page["results"]]
+    assert len(due_dates) == 6
+    assert due_dates == sorted(due_dates)
+
+
+@pytest.mark.django_db
+def test_pagination_respects_ordering_param(authenticated_client, user):
+    for name in ["b", "a", "c", "a"]:
+        Habit.objects.create(user=user, name=name, type="good")
+
+    pages = _collect(
+        authenticated_client, reverse("habit-list"), {"ordering": "name", "page_size": 1}
+    )
+
+    assert [page["results"][0]["name"] for page in pages] == ["a", "a", "b", "c"]
+
+
+@pytest.mark.django_db
+def test_page_query_does_not_count(authenticated_client, user, django_assert_max_num_queries):
+    Habit.objects.bulk_create([Habit(user=user, name=f"Habit {i}", type="good") for i in range(5)])
+    first = authenticated_client.get(reverse("habit-list"), {"page_size": 2}).data
+
+    with django_assert_max_num_queries(1) as ctx:
+        authenticated_client.get(first["next"])
+    assert not any("COUNT(" in query["sql"] for query in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_returns_404(authenticated_client):
+    response = authenticated_client.get(reverse("habit-list"), {"cursor": "garbage"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
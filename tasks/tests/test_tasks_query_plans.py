@@ -0,0 +1,165 @@
+"""
+Query-plan regression tests for the task and inventory list endpoints.
+
+Every list/filter combination is requested against a seeded dataset, each SELECT it
+issues is run through EXPLAIN, and the test fails if a plan contains a sequential
+scan or an explicit sort. Seq scans and sorts are disabled for the EXPLAIN, so the
+planner only falls back to them when no index matches the query shape; the result
+does not depend on how many rows the test database happens to hold.
+"""
+
+import datetime
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from inventory.models import Item, UserItem
+from tasks.enums import HabitType, TasksRepeats, TasksStatus, TasksStrength
+from tasks.models import Daily, Habit, Todo
+from tasks.sync import encode_token
+
+User = get_user_model()
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Query plans are checked on PostgreSQL only"
+)
+
+SEEDED_USERS = 12
+FORBIDDEN_NODES = {"Seq Scan", "Sort", "Incremental Sort"}
+
+LIST_CASES = [
+    ("habit-list", {}),
+    ("habit-list", {"type": HabitType.GOOD}),
+    ("habit-list", {"status": TasksStatus.ACTIVE}),
+    ("habit-list", {"strength": TasksStrength.STRONG}),
+    ("habit-list", {"type": HabitType.BAD, "status": TasksStatus.ACTIVE}),
+    ("daily-list", {}),
+    ("daily-list", {"status": TasksStatus.COMPLETED}),
+    ("daily-list", {"repeats": TasksRepeats.WEEKLY}),
+    ("daily-list", {"status": TasksStatus.ACTIVE, "repeats": TasksRepeats.DAILY}),
+    ("todo-list", {}),
+    ("todo-list", {"filter": "active"}),
+    ("todo-list", {"filter": "completed"}),
+    ("todo-list", {"filter": "planned"}),
+    ("todo-list", {"is_completed": "false"}),
+    ("todo-list", {"is_completed": "true"}),
+    ("todo-list", {"filter": "completed", "archived": "1"}),
+    ("task-sync", {}),
+    ("task-sync", {"since": encode_token(timezone.now() - datetime.timedelta(hours=1))}),
+    ("task-counts", {}),
+    ("user-items-list", {}),
+]
+
+
+@pytest.fixture
+def seeded_user(db):
+    """Several users with a realistic mix of tasks and items; returns one in the middle."""
+    today = datetime.date.today()
+    users = [
+        User.objects.create_user(username=f"planuser{i}", email=f"plan{i}@example.com")
+        for i in range(SEEDED_USERS)
+    ]
+    strengths = list(TasksStrength.values)
+    habits, dailies, todos = [], [], []
+    for user in users:
+        for i in range(40):
+            habits.append(
+                Habit(
+                    user=user,
+                    name=f"Habit {i}",
+                    type=HabitType.GOOD if i % 3 else HabitType.BAD,
+                    status=TasksStatus.ACTIVE if i % 4 else TasksStatus.COMPLETED,
+                    strength=strengths[i % len(strengths)],
+                )
+            )
+            dailies.append(
+                Daily(
+                    user=user,
+                    name=f"Daily {i}",
+                    status=TasksStatus.COMPLETED if i % 2 else TasksStatus.ACTIVE,
+                    repeats=TasksRepeats.WEEKLY if i % 5 == 0 else TasksRepeats.DAILY,
+                )
+            )
+        for i in range(60):
+            todos.append(
+                Todo(
+                    user=user,
+                    name=f"Todo {i}",
+                    due_date=today + datetime.timedelta(days=i % 30 - 10),
+                    is_completed=i % 3 == 0,
+                )
+            )
+    Habit.objects.bulk_create(habits)
+    Daily.objects.bulk_create(dailies)
+    Todo.objects.bulk_create(todos)
+
+    items = Item.objects.bulk_create(
+        [Item(name=f"Item {i}", description="", value=i) for i in range(30)]
+    )
+    UserItem.objects.bulk_create(
+        [UserItem(user=user, item=item) for user in users for item in items[::3]]
+    )
+
+    with connection.cursor() as cursor:
+        for model in (Habit, Daily, Todo, Item, UserItem):
+            cursor.execute(f"ANALYZE {model._meta.db_table}")
+    return users[SEEDED_USERS // 2]
+
+
+def _plan_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _explain(sql):
+    """Return the JSON plan of `sql` with seq scans and sorts disabled."""
+    with connection.cursor() as cursor:
+        cursor.execute("SET enable_seqscan = off")
+        cursor.execute("SET enable_sort = off")
+        try:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+        finally:
+            cursor.execute("RESET enable_seqscan")
+            cursor.execute("RESET enable_sort")
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def _list_queries(client, url, params):
+    """SQL of every SELECT issued for the first page and, if there is one, the next page."""
+    queries = []
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, {**params, "page_size": 5})
+    assert response.status_code == 200
+    queries.extend(context.captured_queries)
+
+    next_url = response.data.get("next") if isinstance(response.data, dict) else None
+    if next_url:
+        with CaptureQueriesContext(connection) as context:
+            assert client.get(next_url).status_code == 200
+        queries.extend(context.captured_queries)
+    return [query["sql"] for query in queries if query["sql"].lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, params", LIST_CASES, ids=[f"{name}-{params}" for name, params in LIST_CASES]
+)
+def test_list_plans_use_indexes(api_client, seeded_user, url_name, params):
+    api_client.force_authenticate(user=seeded_user)
+
+    queries = _list_queries(api_client, reverse(url_name), params)
+
+    assert queries
+    for sql in queries:
+        plan = _explain(sql)
+        bad = sorted({node["Node Type"] for node in _plan_nodes(plan)} & FORBIDDEN_NODES)
+        assert not bad, f"{', '.join(bad)} in plan for:\n{sql}\n{json.dumps(plan, indent=2)}"
@@ -0,0 +1,104 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.enums import HabitType
+from tasks.models import Daily, Habit, Todo
+from tasks.search import build_search_query
+
+
+def _names(response):
+    assert response.status_code == status.HTTP_200_OK
+    return [item["name"] for item in response.data["results"]]
+
+
+@pytest.mark.django_db
+def test_build_search_query_requires_every_word_prefix(user):
+    habit = Habit.objects.create(user=user, name="Drink Water", type=HabitType.GOOD)
+    Habit.objects.create(user=user, name="Drink Tea", type=HabitType.GOOD)
+
+    assert build_search_query(" !? ") is None
+    assert list(Habit.objects.filter(search_vector=build_search_query("dri wat!"))) == [habit]
+
+
+@pytest.mark.django_db
+def test_search_vector_is_maintained_by_database(user):
+    habit = Habit.objects.create(user=user, name="Morning run", type=HabitType.GOOD)
+
+    Habit.objects.filter(pk=habit.pk).update(notes="Around the park")
+
+    assert Habit.objects.filter(search_vector=build_search_query("park")).get() == habit
+
+
+@pytest.mark.django_db
+def test_search_matches_partial_words(authenticated_client, user):
+    Habit.objects.create(user=user, name="Drink Water", type=HabitType.GOOD)
+    Habit.objects.create(user=user, name="Exercise Daily", type=HabitType.GOOD)
+
+    response = authenticated_client.get(reverse("habit-list"), {"search": "wat"})
+
+    assert _names(response) == ["Drink Water"]
+
+
+@pytest.mark.django_db
+def test_search_ranks_name_matches_above_notes(authenticated_client, user):
+    Todo.objects.create(
+        user=user, name="Call mom", notes="Ask about the garden", due_date="2030-01-01"
+    )
+    Todo.objects.create(user=user, name="Garden work", due_date="2030-01-02")
+
+    response = authenticated_client.get(reverse("todo-list"), {"search": "garden"})
+
+    assert _names(response) == ["Garden work", "Call mom"]
+
+
+@pytest.mark.django_db
+def test_search_results_are_paginated_by_rank(authenticated_client, user):
+    Daily.objects.bulk_create(
+        [Daily(user=user, name=f"Stretch {i}", notes="stretch " * (i % 3)) for i in range(7)]
+    )
+    url = reverse("daily-list")
+
+    response = authenticated_client.get(url, {"search": "stretch", "page_size": 3})
+    ids = [item["id"] for item in response.data["results"]]
+    while response.data["next"]:
+        response = authenticated_client.get(response.data["next"])
+        ids += [item["id"] for item in response.data["results"]]
+
+    assert sorted(ids) == sorted(Daily.objects.values_list("id", flat=True))
+    assert len(ids) == len(set(ids))
+
+
+@pytest.mark.django_db
+def test_search_keeps_explicit_ordering(authenticated_client, user):
+    Habit.objects.create(user=user, name="Read book", notes="read read read", type=HabitType.GOOD)
+    Habit.objects.create(user=user, name="Aloud reading", type=HabitType.GOOD)
+
+    response = authenticated_client.get(
+        reverse("habit-list"), {"search": "read", "ordering": "name"}
+    )
+
+    assert _names(response) == ["Aloud reading", "Read book"]
+
+
+@pytest.mark.django_db
+def test_search_only_returns_own_tasks(authenticated_client, user, other_user):
+    Habit.objects.create(user=other_user, name="Drink Water", type=HabitType.GOOD)
+
+    response = authenticated_client.get(reverse("habit-list"), {"search": "water"})
+
+    assert _names(response) == []
+
+
+@pytest.mark.django_db
+def test_search_uses_full_text_index(authenticated_client, user):
+    Habit.objects.create(user=user, name="Drink Water", type=HabitType.GOOD)
+
+    with CaptureQueriesContext(connection) as context:
+        authenticated_client.get(reverse("habit-list"), {"search": "water"})
+
+    sql = context.captured_queries[-1]["sql"]
+    assert "@@" in sql
+    assert "ILIKE" not in sql.upper()
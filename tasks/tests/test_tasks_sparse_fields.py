@@ -0,0 +1,98 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from estate.models import Estate
+from inventory.models import Item, UserItem
+from tasks.models import Todo
+
+
+def _selects(context, table):
+    return [
+        q["sql"]
+        for q in context.captured_queries
+        if q["sql"].startswith("SELECT") and table in q["sql"]
+    ]
+
+
+@pytest.mark.django_db
+def test_fields_trims_task_list_and_skips_unused_columns(authenticated_client, habit):
+    with CaptureQueriesContext(connection) as context:
+        response = authenticated_client.get(reverse("habit-list"), {"fields": "id,name"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"] == [{"id": habit.id, "name": habit.name}]
+    (sql,) = _selects(context, '"tasks_habit"')
+    assert '"tasks_habit"."notes"' not in sql
+    assert '"tasks_habit"."search_vector"' not in sql
+
+
+@pytest.mark.django_db
+def test_method_fields_load_their_sources(authenticated_client, daily):
+    response = authenticated_client.get(
+        reverse("daily-list"), {"fields": "id,current_streak,strength"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"] == [
+        {"id": daily.id, "current_streak": 0, "strength": daily.strength}
+    ]
+
+
+@pytest.mark.django_db
+def test_fields_keeps_keyset_pagination_working(authenticated_client, user):
+    for i in range(3):
+        Todo.objects.create(user=user, name=f"Todo {i}", due_date="2099-01-0%d" % (i + 1))
+    url = reverse("todo-list")
+
+    with CaptureQueriesContext(connection) as context:
+        first = authenticated_client.get(url, {"fields": "name", "page_size": 2})
+        second = authenticated_client.get(first.data["next"])
+
+    assert [t["name"] for t in first.data["results"]] == ["Todo 0", "Todo 1"]
+    assert [t["name"] for t in second.data["results"]] == ["Todo 2"]
+    assert len(_selects(context, '"tasks_todo"')) == 2  # no deferred-field lookups
+
+
+@pytest.mark.django_db
+def test_unknown_fields_are_rejected(authenticated_client, habit):
+    response = authenticated_client.get(reverse("habit-list"), {"fields": "id,secret"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "secret" in str(response.data["fields"])
+
+
+@pytest.mark.django_db
+def test_fields_is_ignored_on_writes(authenticated_client, habit):
+    response = authenticated_client.patch(
+        reverse("habit-detail", args=[habit.id]) + "?fields=id", {"name": "New"}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["name"] == "New"
+
+
+@pytest.mark.django_db
+def test_item_fields_skip_description(authenticated_client, user):
+    item = Item.objects.create(name="Sword", description="x" * 1000, value=10)
+    UserItem.objects.create(user=user, item=item)
+
+    with CaptureQueriesContext(connection) as context:
+        items = authenticated_client.get(reverse("items-list"), {"fields": "id,name"})
+        owned = authenticated_client.get(reverse("user-items-list"), {"fields": "id,quantity"})
+
+    assert items.data == [{"id": item.id, "name": "Sword"}]
+    assert owned.data == [{"id": owned.data[0]["id"], "quantity": 1}]
+    assert not any('"description"' in sql for sql in _selects(context, "inventory_"))
+
+
+@pytest.mark.django_db
+def test_estate_fields(authenticated_client, user):
+    estate = Estate.objects.create(user=user)
+
+    response = authenticated_client.get(reverse("estate-list"), {"fields": "id,wood"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [{"id": estate.id, "wood": estate.wood}]
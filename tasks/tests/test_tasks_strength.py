@@ -0,0 +1,22 @@
+from tasks.enums import TasksStrength
+from tasks.models import Habit
+from tasks.strength import STRENGTHEN, WEAKEN, strengthen, transition_case, weaken
+
+
+def test_transitions_move_one_step_and_clamp():
+    assert strengthen(TasksStrength.FRAGILE) == TasksStrength.WEAK
+    assert strengthen(TasksStrength.UNBREAKABLE) == TasksStrength.UNBREAKABLE
+    assert weaken(TasksStrength.STRONG) == TasksStrength.STABLE
+    assert weaken(TasksStrength.FRAGILE) == TasksStrength.FRAGILE
+    assert weaken("unknown") == "unknown"
+
+
+def test_transition_tables_are_inverse_inside_the_ladder():
+    for current, new in STRENGTHEN.items():
+        if current != new:
+            assert WEAKEN[new] == current
+
+
+def test_transition_case_skips_fixed_points():
+    sql = str(Habit.objects.annotate(new=transition_case(WEAKEN)).query)
+    assert sql.count("WHEN") == len(WEAKEN) - 1
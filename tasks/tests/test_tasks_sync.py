@@ -0,0 +1,159 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from tasks.enums import TasksStatus, TaskType
+from tasks.models import Daily, Habit, TaskTombstone, Todo
+from tasks.sync import SYNC_OVERLAP, decode_token, encode_token
+from tasks.tasks import archive_completed_todos, prune_task_tombstones, reset_dailies
+
+
+def _sync(client, token=None):
+    params = {"since": token} if token else {}
+    response = client.get(reverse("task-sync"), params)
+    assert response.status_code == status.HTTP_200_OK
+    return response.data
+
+
+def _age(model, *objects, seconds=60):
+    """Move updated_at into the past, as if the objects were written a while ago."""
+    past = timezone.now() - timedelta(seconds=seconds)
+    model.objects.filter(pk__in=[obj.pk for obj in objects]).update(updated_at=past)
+
+
+def _token_for_now():
+    return encode_token(timezone.now() - SYNC_OVERLAP)
+
+
+@pytest.mark.django_db
+def test_first_sync_is_a_full_snapshot(authenticated_client, habit, daily, todo):
+    data = _sync(authenticated_client)
+
+    assert data["full"] is True
+    assert [h["id"] for h in data["habits"]] == [habit.id]
+    assert [d["id"] for d in data["dailies"]] == [daily.id]
+    assert [t["id"] for t in data["todos"]] == [todo.id]
+    assert data["deleted"] == []
+    assert decode_token(data["token"]) <= timezone.now() - SYNC_OVERLAP
+
+
+@pytest.mark.django_db
+def test_sync_returns_only_changes_since_token(
+    authenticated_client, user, habit, bad_habit, daily, todo
+):
+    _age(Habit, habit, bad_habit)
+    _age(Daily, daily)
+    _age(Todo, todo)
+    token = _token_for_now()
+
+    assert _sync(authenticated_client, token)["habits"] == []
+
+    authenticated_client.patch(
+        reverse("habit-detail", args=[habit.id]), {"name": "Renamed"}, format="json"
+    )
+    new_todo = Todo.objects.create(
+        user=user, name="New", due_date=timezone.localdate() + timedelta(days=1)
+    )
+    authenticated_client.delete(reverse("daily-detail", args=[daily.id]))
+
+    data = _sync(authenticated_client, token)
+
+    assert data["full"] is False
+    assert [(h["id"], h["name"]) for h in data["habits"]] == [(habit.id, "Renamed")]
+    assert data["dailies"] == []
+    assert [t["id"] for t in data["todos"]] == [new_todo.id]
+    assert data["deleted"] == [{"type": TaskType.DAILY, "id": daily.id}]
+
+
+@pytest.mark.django_db
+def test_completions_and_jobs_bump_updated_at(authenticated_client, user, habit, daily, todo):
+    _age(Habit, habit)
+    _age(Daily, daily)
+    _age(Todo, todo)
+    token = _token_for_now()
+
+    authenticated_client.post(reverse("habit-complete-habit", args=[habit.id]))
+    authenticated_client.post(
+        reverse("task-complete-batch"),
+        {"tasks": [{"type": TaskType.TODO, "id": todo.id}]},
+        format="json",
+    )
+    Daily.objects.filter(pk=daily.pk).update(status=TasksStatus.COMPLETED)
+    _age(Daily, daily)
+    reset_dailies(day=timezone.localdate() + timedelta(days=1))
+
+    data = _sync(authenticated_client, token)
+
+    assert [h["id"] for h in data["habits"]] == [habit.id]
+    assert [t["id"] for t in data["todos"]] == [todo.id]
+    assert [d["id"] for d in data["dailies"]] == [daily.id]
+    assert data["user"]["current_exp"] > 0
+
+
+@pytest.mark.django_db
+def test_bulk_patch_bumps_updated_at(authenticated_client, habit):
+    _age(Habit, habit)
+    token = _token_for_now()
+
+    authenticated_client.patch(
+        reverse("habit-list"), [{"id": habit.id, "notes": "bulk"}], format="json"
+    )
+
+    assert [h["id"] for h in _sync(authenticated_client, token)["habits"]] == [habit.id]
+
+
+@pytest.mark.django_db
+def test_archived_todos_leave_tombstones(authenticated_client, completed_todo):
+    Todo.objects.filter(pk=completed_todo.pk).update(
+        completed_at=timezone.now() - timedelta(days=60)
+    )
+    token = _token_for_now()
+
+    assert archive_completed_todos(after_days=30) == 1
+
+    data = _sync(authenticated_client, token)
+    assert data["deleted"] == [{"type": TaskType.TODO, "id": completed_todo.id}]
+
+
+@pytest.mark.django_db
+def test_expired_token_gets_full_snapshot(authenticated_client, habit, settings):
+    settings.TASK_SYNC_TOMBSTONE_DAYS = 30
+    token = encode_token(timezone.now() - timedelta(days=31))
+
+    data = _sync(authenticated_client, token)
+
+    assert data["full"] is True
+    assert [h["id"] for h in data["habits"]] == [habit.id]
+
+
+@pytest.mark.django_db
+def test_invalid_token_returns_400(authenticated_client):
+    response = authenticated_client.get(reverse("task-sync"), {"since": "not-a-token"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["detail"] == "Invalid sync token."
+
+
+@pytest.mark.django_db
+def test_sync_is_scoped_to_the_user(authenticated_client, other_user):
+    Habit.objects.create(user=other_user, name="Not mine", type="good")
+
+    assert _sync(authenticated_client)["habits"] == []
+
+
+@pytest.mark.django_db
+def test_prune_task_tombstones(user):
+    old = TaskTombstone.objects.create(
+        user=user,
+        task_type=TaskType.HABIT,
+        task_id=1,
+        deleted_at=timezone.now() - timedelta(days=31),
+    )
+    recent = TaskTombstone.objects.create(user=user, task_type=TaskType.HABIT, task_id=2)
+
+    assert prune_task_tombstones(older_than_days=30) == 1
+    assert list(TaskTombstone.objects.values_list("pk", flat=True)) == [recent.pk]
+    assert not TaskTombstone.objects.filter(pk=old.pk).exists()
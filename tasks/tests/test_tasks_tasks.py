@@ -0,0 +1,225 @@
+import datetime
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from tasks.enums import (
+    HabitType,
+    RepeatUnit,
+    TasksRepeatOn,
+    TasksRepeats,
+    TasksStatus,
+    TasksStrength,
+)
+from tasks.models import Daily, Habit, ScheduledJobRun
+from tasks.services import MISSED_DAILY_HP
+from tasks.tasks import (
+    DECAY_HABITS_JOB,
+    MISSED_DAILIES_JOB,
+    RESET_DAILIES_JOB,
+    charge_missed_dailies,
+    decay_habit_strength,
+    reset_dailies,
+)
+from users.models import Character
+
+User = get_user_model()
+
+# 2025-11-03 is a Monday, 2025-12-01 is the first day of a month
+MONDAY = datetime.date(2025, 11, 3)
+TUESDAY = datetime.date(2025, 11, 4)
+FIRST_OF_MONTH = datetime.date(2025, 12, 1)
+
+
+def _completed_daily(user, created=None, **kwargs):
+    daily = Daily.objects.create(user=user, name="Daily", status=TasksStatus.COMPLETED, **kwargs)
+    if created:
+        created_at = timezone.make_aware(datetime.datetime.combine(created, datetime.time(12)))
+        Daily.objects.filter(pk=daily.pk).update(created_at=created_at)
+    return daily
+
+
+def _status(daily):
+    daily.refresh_from_db()
+    return daily.status
+
+
+@pytest.mark.django_db
+def test_reset_dailies_respects_repeats_and_repeat_on(user):
+    every_day = _completed_daily(user)
+    on_tuesday = _completed_daily(user, repeat_on=TasksRepeatOn.TUESDAY)
+    weekly = _completed_daily(user, repeats=TasksRepeats.WEEKLY)
+    monthly = _completed_daily(user, repeats=TasksRepeats.MONTHLY)
+
+    assert reset_dailies(MONDAY) == 2
+
+    assert _status(every_day) == TasksStatus.ACTIVE
+    assert _status(weekly) == TasksStatus.ACTIVE
+    assert _status(on_tuesday) == TasksStatus.COMPLETED
+    assert _status(monthly) == TasksStatus.COMPLETED
+
+
+@pytest.mark.django_db
+def test_reset_dailies_respects_repeat_interval(user):
+    every_other_day = _completed_daily(
+        user, created=MONDAY - datetime.timedelta(days=3), repeat_interval=2
+    )
+    every_second_day = _completed_daily(
+        user, created=MONDAY - datetime.timedelta(days=4), repeat_interval=2
+    )
+    every_two_months = _completed_daily(
+        user,
+        created=datetime.date(2025, 11, 1),
+        repeats=TasksRepeats.MONTHLY,
+        repeat_interval=2,
+        repeat_unit=RepeatUnit.MONTHS,
+    )
+
+    reset_dailies(MONDAY)
+    assert _status(every_other_day) == TasksStatus.COMPLETED
+    assert _status(every_second_day) == TasksStatus.ACTIVE
+
+    reset_dailies(FIRST_OF_MONTH)
+    assert _status(every_two_months) == TasksStatus.COMPLETED
+
+
+@pytest.mark.django_db
+def test_reset_dailies_is_idempotent_per_day(user):
+    daily = _completed_daily(user)
+
+    assert reset_dailies(TUESDAY) == 1
+    Daily.objects.filter(pk=daily.pk).update(status=TasksStatus.COMPLETED)
+
+    # A retried run on the same day must not reopen dailies completed after the reset
+    assert reset_dailies(TUESDAY) == 0
+    assert _status(daily) == TasksStatus.COMPLETED
+    assert ScheduledJobRun.objects.get(name=RESET_DAILIES_JOB, run_date=TUESDAY).finished_at
+
+
+@pytest.mark.django_db
+def test_reset_dailies_chunks_and_resumes(user, other_user):
+    first = _completed_daily(user)
+    second = _completed_daily(other_user)
+    low, high = sorted([user.pk, other_user.pk])
+    # Simulate an interrupted run that already processed the lower user id
+    ScheduledJobRun.objects.create(name=RESET_DAILIES_JOB, run_date=TUESDAY, last_user_id=low)
+
+    assert reset_dailies(TUESDAY, chunk_size=1) == 1
+
+    resumed = first if first.user_id == high else second
+    skipped = second if resumed is first else first
+    assert _status(resumed) == TasksStatus.ACTIVE
+    assert _status(skipped) == TasksStatus.COMPLETED
+
+
+def _active_daily(
+    user, created=MONDAY - datetime.timedelta(days=7), status=TasksStatus.ACTIVE, **kwargs
+):
+    daily = _completed_daily(user, created=created, **kwargs)
+    Daily.objects.filter(pk=daily.pk).update(status=status)
+    return daily
+
+
+def _hp(user):
+    return Character.objects.get(user=user).current_hp
+
+
+@pytest.mark.django_db
+def test_charge_missed_dailies_counts_missed_per_user(user, other_user):
+    Character.objects.create(user=user, current_hp=50, max_hp=50)
+    Character.objects.create(user=other_user, current_hp=50, max_hp=50)
+    _active_daily(user)
+    _active_daily(user, repeat_on=TasksRepeatOn.TUESDAY)  # its period ends on Monday
+    _active_daily(user, repeat_on=TasksRepeatOn.FRIDAY)  # still has days left
+    _active_daily(user, created=MONDAY)  # created today: grace period
+    _completed_daily(user, created=MONDAY - datetime.timedelta(days=7))
+    _active_daily(other_user, status=TasksStatus.INACTIVE)
+
+    assert charge_missed_dailies(MONDAY) == 1
+
+    assert _hp(user) == 50 - 2 * MISSED_DAILY_HP
+    assert _hp(other_user) == 50
+
+
+@pytest.mark.django_db
+def test_charge_missed_dailies_clamps_at_zero_and_runs_once(user):
+    Character.objects.create(user=user, current_hp=3)
+    _active_daily(user)
+
+    assert charge_missed_dailies(MONDAY) == 1
+    assert charge_missed_dailies(MONDAY) == 0
+
+    assert _hp(user) == 0
+    assert ScheduledJobRun.objects.get(name=MISSED_DAILIES_JOB, run_date=MONDAY).finished_at
+
+
+@pytest.mark.django_db
+def test_reset_dailies_charges_previous_day_before_reopening(user):
+    Character.objects.create(user=user, current_hp=50, max_hp=50)
+    _active_daily(user)
+    _completed_daily(user, created=MONDAY - datetime.timedelta(days=7))
+
+    assert reset_dailies(TUESDAY) == 1
+
+    assert _hp(user) == 50 - MISSED_DAILY_HP
+    assert ScheduledJobRun.objects.filter(name=MISSED_DAILIES_JOB, run_date=MONDAY).exists()
+
+
+def _habit(user, last_completed_on=None, created=MONDAY - datetime.timedelta(days=30), **kwargs):
+    kwargs.setdefault("type", HabitType.GOOD)
+    habit = Habit.objects.create(
+        user=user, name="Habit", last_completed_on=last_completed_on, **kwargs
+    )
+    created_at = timezone.make_aware(datetime.datetime.combine(created, datetime.time(12)))
+    Habit.objects.filter(pk=habit.pk).update(created_at=created_at)
+    return habit
+
+
+def _strength(habit):
+    habit.refresh_from_db()
+    return habit.strength
+
+
+@pytest.mark.django_db
+def test_decay_weakens_neglected_habits_one_step(user):
+    stale = _habit(user, last_completed_on=MONDAY - datetime.timedelta(days=3))
+    strong = _habit(user, strength=TasksStrength.UNBREAKABLE)
+    recent = _habit(user, last_completed_on=MONDAY - datetime.timedelta(days=2))
+    new = _habit(user, created=MONDAY)
+
+    assert decay_habit_strength(MONDAY, after_days=3) == 2
+
+    assert _strength(stale) == TasksStrength.WEAK
+    assert _strength(strong) == TasksStrength.STRONG
+    assert _strength(recent) == TasksStrength.STABLE
+    assert _strength(new) == TasksStrength.STABLE
+
+
+@pytest.mark.django_db
+def test_decay_skips_fragile_bad_and_inactive_habits(user):
+    fragile = _habit(user, strength=TasksStrength.FRAGILE)
+    bad = _habit(user, type=HabitType.BAD)
+    inactive = _habit(user, status=TasksStatus.INACTIVE)
+
+    assert decay_habit_strength(MONDAY, after_days=3) == 0
+
+    assert _strength(fragile) == TasksStrength.FRAGILE
+    assert _strength(bad) == TasksStrength.STABLE
+    assert _strength(inactive) == TasksStrength.STABLE
+
+
+@pytest.mark.django_db
+def test_decay_runs_once_per_day_in_chunks(user, other_user):
+    habits = [_habit(user), _habit(other_user)]
+
+    assert decay_habit_strength(MONDAY, after_days=3, chunk_size=1) == 2
+    assert decay_habit_strength(MONDAY, after_days=3, chunk_size=1) == 0
+    assert [_strength(habit) for habit in habits] == [TasksStrength.WEAK] * 2
+
+    run = ScheduledJobRun.objects.get(name=DECAY_HABITS_JOB, run_date=MONDAY)
+    assert run.rows_affected == 2
+    assert run.finished_at is not None
+
+    assert decay_habit_strength(TUESDAY, after_days=3) == 2
+    assert [_strength(habit) for habit in habits] == [TasksStrength.FRAGILE] * 2
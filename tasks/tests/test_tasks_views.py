@@ -8,6 +8,7 @@ from rest_framework.test import APIClient
 
 from tasks.enums import HabitType, TasksStatus, TasksStrength
 from tasks.models import Daily, Habit, Todo
+from users.models import Character
 
 User = get_user_model()
 
@@ -92,8 +93,8 @@ def test_habit_list_returns_user_habits_only(authenticated_client, user, habit):
     url = reverse("habit-list")
     response = authenticated_client.get(url)
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["name"] == "Drink Water"
+    assert len(response.data["results"]) == 1
+    assert response.data["results"][0]["name"] == "Drink Water"
 
 
 @pytest.mark.django_db
@@ -147,7 +148,7 @@ def test_habit_delete(authenticated_client, habit):
 @pytest.mark.django_db
 def test_habit_complete_good_habit(authenticated_client, user, habit):
     """Test completing a good habit rewards EXP and increases strength"""
-    initial_exp = user.current_exp
+    initial_exp = Character.objects.get_or_create(user=user)[0].current_exp
     initial_strength = habit.strength
 
     url = reverse("habit-complete-habit", args=[habit.id])
@@ -156,6 +157,7 @@ def test_habit_complete_good_habit(authenticated_client, user, habit):
     assert response.status_code == status.HTTP_200_OK
     assert "Good habit completed" in response.data["detail"]
     assert response.data["user"]["current_exp"] == initial_exp + 10
+    assert Character.objects.get(user=user).current_exp == initial_exp + 10
 
     habit.refresh_from_db()
     assert habit.strength != initial_strength  # Strength increased
@@ -170,7 +172,7 @@ def test_habit_complete_bad_habit(authenticated_client, user):
         type=HabitType.BAD,
         strength=TasksStrength.STABLE,
     )
-    initial_hp = user.current_hp
+    initial_hp = Character.objects.get_or_create(user=user)[0].current_hp
 
     url = reverse("habit-complete-habit", args=[bad_habit.id])
     response = authenticated_client.post(url)
@@ -178,6 +180,7 @@ def test_habit_complete_bad_habit(authenticated_client, user):
     assert response.status_code == status.HTTP_200_OK
     assert "Bad habit recorded" in response.data["detail"]
     assert response.data["user"]["current_hp"] == initial_hp - 5
+    assert Character.objects.get(user=user).current_hp == initial_hp - 5
 
 
 @pytest.mark.django_db
@@ -190,7 +193,7 @@ def test_habit_filter_by_type(authenticated_client, user):
     url = reverse("habit-list")
     response = authenticated_client.get(url, {"type": HabitType.GOOD})
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 2
+    assert len(response.data["results"]) == 2
 
 
 @pytest.mark.django_db
@@ -204,8 +207,8 @@ def test_habit_filter_by_status(authenticated_client, user):
     url = reverse("habit-list")
     response = authenticated_client.get(url, {"status": TasksStatus.ACTIVE})
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["name"] == "Active"
+    assert len(response.data["results"]) == 1
+    assert response.data["results"][0]["name"] == "Active"
 
 
 @pytest.mark.django_db
@@ -217,8 +220,8 @@ def test_habit_search(authenticated_client, user):
     url = reverse("habit-list")
     response = authenticated_client.get(url, {"search": "water"})
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert "Water" in response.data[0]["name"]
+    assert len(response.data["results"]) == 1
+    assert "Water" in response.data["results"][0]["name"]
 
 
 # -----------------------
@@ -243,8 +246,8 @@ def test_daily_list_returns_user_dailies_only(authenticated_client, user, daily)
     url = reverse("daily-list")
     response = authenticated_client.get(url)
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["name"] == "Morning Exercise"
+    assert len(response.data["results"]) == 1
+    assert response.data["results"][0]["name"] == "Morning Exercise"
 
 
 @pytest.mark.django_db
@@ -295,7 +298,7 @@ def test_daily_delete(authenticated_client, daily):
 @pytest.mark.django_db
 def test_daily_complete(authenticated_client, user, daily):
     """Test completing a daily task rewards EXP and increases strength"""
-    initial_exp = user.current_exp
+    initial_exp = Character.objects.get_or_create(user=user)[0].current_exp
     initial_strength = daily.strength
 
     url = reverse("daily-complete-daily", args=[daily.id])
@@ -304,6 +307,7 @@ def test_daily_complete(authenticated_client, user, daily):
     assert response.status_code == status.HTTP_200_OK
     assert "Daily task completed" in response.data["detail"]
     assert response.data["user"]["current_exp"] == initial_exp + 15
+    assert Character.objects.get(user=user).current_exp == initial_exp + 15
 
     daily.refresh_from_db()
     assert daily.status == TasksStatus.COMPLETED
@@ -334,8 +338,8 @@ def test_daily_filter_by_status(authenticated_client, user):
     url = reverse("daily-list")
     response = authenticated_client.get(url, {"status": TasksStatus.ACTIVE})
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["name"] == "Active Daily"
+    assert len(response.data["results"]) == 1
+    assert response.data["results"][0]["name"] == "Active Daily"
 
 
 # -----------------------
@@ -361,8 +365,8 @@ def test_todo_list_returns_user_todos_only(authenticated_client, user, todo):
     url = reverse("todo-list")
     response = authenticated_client.get(url)
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["name"] == "Complete project"
+    assert len(response.data["results"]) == 1
+    assert response.data["results"][0]["name"] == "Complete project"
 
 
 @pytest.mark.django_db
@@ -428,7 +432,7 @@ def test_todo_delete(authenticated_client, todo):
 @pytest.mark.django_db
 def test_todo_complete(authenticated_client, user, todo):
     """Test completing a todo rewards EXP and marks as completed"""
-    initial_exp = user.current_exp
+    initial_exp = Character.objects.get_or_create(user=user)[0].current_exp
 
     url = reverse("todo-complete-todo", args=[todo.id])
     response = authenticated_client.post(url)
@@ -436,6 +440,7 @@ def test_todo_complete(authenticated_client, user, todo):
     assert response.status_code == status.HTTP_200_OK
     assert "Todo completed" in response.data["detail"]
     assert response.data["user"]["current_exp"] == initial_exp + 20
+    assert Character.objects.get(user=user).current_exp == initial_exp + 20
 
     todo.refresh_from_db()
     assert todo.is_completed is True
@@ -464,7 +469,7 @@ def test_todo_filter_by_completed(authenticated_client, user):
     url = reverse("todo-list")
     response = authenticated_client.get(url, {"is_completed": "false"})
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1  # Only the Active Todo we created
+    assert len(response.data["results"]) == 1  # Only the Active Todo we created
 
 
 @pytest.mark.django_db
@@ -478,7 +483,7 @@ def test_todo_filter_active(authenticated_client, user):
     response = authenticated_client.get(url, {"filter": "active"})
     assert response.status_code == status.HTTP_200_OK
     # Should return only incomplete todos
-    for item in response.data:
+    for item in response.data["results"]:
         assert item["is_completed"] is False
 
 
@@ -493,5 +498,117 @@ def test_todo_filter_completed(authenticated_client, user):
     response = authenticated_client.get(url, {"filter": "completed"})
     assert response.status_code == status.HTTP_200_OK
     # Should return only completed todos
-    for item in response.data:
+    for item in response.data["results"]:
         assert item["is_completed"] is True
+
+
+# -----------------------
+# Batch Completion Tests
+# -----------------------
+@pytest.mark.django_db
+def test_complete_batch_requires_auth(api_client):
+    """Test that batch completion requires authentication"""
+    url = reverse("task-complete-batch")
+    response = api_client.post(url, {"tasks": []}, format="json")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_complete_batch_mixed_types(authenticated_client, user, habit, daily, todo):
+    """Test completing habits, dailies and todos in one request"""
+    bad_habit = Habit.objects.create(
+        user=user, name="Smoking", type=HabitType.BAD, strength=TasksStrength.STABLE
+    )
+    Character.objects.create(user=user, current_hp=10, max_hp=10)
+
+    url = reverse("task-complete-batch")
+    data = {
+        "tasks": [
+            {"type": "habit", "id": habit.id},
+            {"type": "habit", "id": habit.id},
+            {"type": "habit", "id": bad_habit.id},
+            {"type": "daily", "id": daily.id},
+            {"type": "todo", "id": todo.id},
+        ]
+    }
+    response = authenticated_client.post(url, data, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["exp_gained"] == 10 + 10 + 15 + 20
+    assert response.data["hp_lost"] == 5
+    assert response.data["user"]["current_hp"] == 5
+    assert all(item["completed"] for item in response.data["results"])
+
+    habit.refresh_from_db()
+    bad_habit.refresh_from_db()
+    daily.refresh_from_db()
+    todo.refresh_from_db()
+    assert habit.strength == TasksStrength.UNBREAKABLE
+    assert bad_habit.strength == TasksStrength.WEAK
+    assert daily.status == TasksStatus.COMPLETED
+    assert todo.is_completed is True
+
+
+@pytest.mark.django_db
+def test_complete_batch_reports_per_item_errors(authenticated_client, user, daily):
+    """Test that unknown, foreign and already completed tasks don't fail the batch"""
+    other_user = User.objects.create_user(
+        username="otheruser", email="other@example.com", password="Pass123!"
+    )
+    foreign = Habit.objects.create(user=other_user, name="Other's Habit", type=HabitType.GOOD)
+
+    url = reverse("task-complete-batch")
+    data = {
+        "tasks": [
+            {"type": "daily", "id": daily.id},
+            {"type": "daily", "id": daily.id},
+            {"type": "habit", "id": foreign.id},
+            {"type": "todo", "id": 999999},
+        ]
+    }
+    response = authenticated_client.post(url, data, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["completed"] for item in response.data["results"]] == [True, False, False, False]
+    assert "already completed" in response.data["results"][1]["detail"].lower()
+    assert response.data["exp_gained"] == 15
+    foreign.refresh_from_db()
+    assert foreign.strength == TasksStrength.STABLE
+
+
+@pytest.mark.django_db
+def test_complete_batch_rejects_invalid_payload(authenticated_client):
+    """Test that malformed entries are rejected as a whole"""
+    url = reverse("task-complete-batch")
+    response = authenticated_client.post(
+        url, {"tasks": [{"type": "quest", "id": 1}]}, format="json"
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = authenticated_client.post(url, {"tasks": []}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_complete_batch_query_count_is_constant(
+    authenticated_client, user, django_assert_max_num_queries
+):
+    """Test that the number of queries does not grow with the batch size"""
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    Character.objects.create(user=user)
+    habits = Habit.objects.bulk_create(
+        [Habit(user=user, name=f"Habit {i}", type=HabitType.GOOD) for i in range(50)]
+    )
+    todos = Todo.objects.bulk_create(
+        [Todo(user=user, name=f"Todo {i}", due_date=tomorrow) for i in range(50)]
+    )
+    tasks = [{"type": "habit", "id": h.id} for h in habits]
+    tasks += [{"type": "todo", "id": t.id} for t in todos]
+
+    url = reverse("task-complete-batch")
+    with django_assert_max_num_queries(12):
+        response = authenticated_client.post(url, {"tasks": tasks}, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["exp_gained"] == 50 * 10 + 50 * 20
+    assert Todo.objects.filter(user=user, is_completed=True).count() == 50
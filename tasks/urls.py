@@ -1,13 +1,25 @@
 from django.urls import include, path
-from rest_framework.routers import DefaultRouter
 
-from tasks.views import DailyViewSet, HabitViewSet, TodoViewSet
+from tasks.routers import BulkRouter
+from tasks.views import (
+    DailyViewSet,
+    HabitViewSet,
+    TaskBatchCompleteView,
+    TaskCountsView,
+    TaskExportView,
+    TaskSyncView,
+    TodoViewSet,
+)
 
-router = DefaultRouter()
+router = BulkRouter()
 router.register(r"habits", HabitViewSet, basename="habit")
 router.register(r"dailies", DailyViewSet, basename="daily")
 router.register(r"todos", TodoViewSet, basename="todo")
 
 urlpatterns = [
+    path("complete-batch/", TaskBatchCompleteView.as_view(), name="task-complete-batch"),
+    path("counts/", TaskCountsView.as_view(), name="task-counts"),
+    path("export/", TaskExportView.as_view(), name="task-export"),
+    path("sync/", TaskSyncView.as_view(), name="task-sync"),
     path("", include(router.urls)),
 ]
@@ -1,16 +1,78 @@
+from datetime import timedelta
+
 from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-
-from tasks.enums import HabitType, TasksStatus, TasksStrength
-from tasks.models import Daily, Habit, Todo
-from tasks.serializers import DailySerializer, HabitSerializer, TodoSerializer
-
-
-class HabitViewSet(viewsets.ModelViewSet):
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
+
+from habit_tracker_rpg.fast_list import FastListMixin
+from habit_tracker_rpg.sparse_fields import SparseFieldsetViewMixin
+from tasks.bulk import BulkCreateUpdateMixin
+from tasks.calendar import (
+    CALENDAR_FIELDS,
+    DEFAULT_RANGE_DAYS,
+    MAX_RANGE_DAYS,
+    build_calendar,
+    invalidate_calendar,
+)
+from tasks.counts import get_task_counts
+from tasks.enums import TaskType
+from tasks.export import CSVRenderer, NDJSONRenderer, export_rows
+from tasks.idempotency import idempotent
+from tasks.models import ArchivedTodo, Daily, Habit, Todo
+from tasks.pagination import KeysetPagination
+from tasks.search import TaskSearchFilter
+from tasks.serializers import (
+    ArchivedTodoSerializer,
+    DailySerializer,
+    HabitSerializer,
+    TaskBatchCompleteSerializer,
+    TodoSerializer,
+)
+from tasks.services import complete_batch, complete_task
+from tasks.sync import TombstoneMixin, build_sync, decode_token
+from users.data_version import DataVersionETagMixin, data_version_etag
+
+
+def _query_date(request, name, default):
+    """Parse an ISO date query parameter. Raises ValueError if it is malformed."""
+    value = request.query_params.get(name)
+    if not value:
+        return default
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValueError(f"'{name}' must be a date in YYYY-MM-DD format.")
+    return parsed
+
+
+def _character_stats(character):
+    """Character stats returned by the completion endpoints"""
+    return {
+        "current_hp": character.current_hp,
+        "max_hp": character.max_hp,
+        "current_exp": character.current_exp,
+        "current_level": character.current_level,
+    }
+
+
+class HabitViewSet(
+    DataVersionETagMixin,
+    FastListMixin,
+    SparseFieldsetViewMixin,
+    TombstoneMixin,
+    BulkCreateUpdateMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for managing user habits (good or bad).
     Supports filtering by type, status, and strength.
@@ -21,12 +83,13 @@ class HabitViewSet(viewsets.ModelViewSet):
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
-        filters.SearchFilter,
+        TaskSearchFilter,
     ]
     filterset_fields = ["type", "status", "strength"]
     search_fields = ["name", "notes"]
     ordering_fields = ["created_at", "name", "strength"]
-    ordering = ["-created_at"]
+    ordering = ["-created_at", "-id"]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         """Return habits for the authenticated user only"""
@@ -37,6 +100,7 @@ class HabitViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
     @action(detail=True, methods=["post"], url_path="complete")
+    @idempotent
     @transaction.atomic
     def complete_habit(self, request, pk=None):
         """
@@ -46,72 +110,29 @@ class HabitViewSet(viewsets.ModelViewSet):
         """
         habit = self.get_object()
 
-        if habit.type == HabitType.GOOD:
-            # Reward for completing a good habit
-            request.user.gain_exp(10)
-            habit.strength = self._increase_strength(habit.strength)
-            message = "Good habit completed! +10 EXP"
-        elif habit.type == HabitType.BAD:
-            # Penalty for doing a bad habit
-            request.user.current_hp = max(0, request.user.current_hp - 5)
-            request.user.save()
-            habit.strength = self._decrease_strength(habit.strength)
-            message = "Bad habit recorded. -5 HP"
-        else:
-            return Response({"detail": "Invalid habit type."}, status=status.HTTP_400_BAD_REQUEST)
-
-        habit.save()
+        try:
+            message, habit, character = complete_task(request.user, TaskType.HABIT, habit)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(
             {
                 "detail": message,
                 "habit": HabitSerializer(habit).data,
-                "user": {
-                    "current_hp": request.user.current_hp,
-                    "max_hp": request.user.max_hp,
-                    "current_exp": request.user.current_exp,
-                    "current_level": request.user.current_level,
-                },
+                "user": _character_stats(character),
             },
             status=status.HTTP_200_OK,
         )
 
-    def _increase_strength(self, current_strength):
-        """Increase habit strength by one level"""
-        strength_order = [
-            TasksStrength.FRAGILE,
-            TasksStrength.WEAK,
-            TasksStrength.STABLE,
-            TasksStrength.STRONG,
-            TasksStrength.UNBREAKABLE,
-        ]
-        try:
-            current_index = strength_order.index(current_strength)
-            if current_index < len(strength_order) - 1:
-                return strength_order[current_index + 1]
-        except (ValueError, IndexError):
-            pass
-        return current_strength
-
-    def _decrease_strength(self, current_strength):
-        """Decrease habit strength by one level"""
-        strength_order = [
-            TasksStrength.FRAGILE,
-            TasksStrength.WEAK,
-            TasksStrength.STABLE,
-            TasksStrength.STRONG,
-            TasksStrength.UNBREAKABLE,
-        ]
-        try:
-            current_index = strength_order.index(current_strength)
-            if current_index > 0:
-                return strength_order[current_index - 1]
-        except (ValueError, IndexError):
-            pass
-        return current_strength
-
 
-class DailyViewSet(viewsets.ModelViewSet):
+class DailyViewSet(
+    DataVersionETagMixin,
+    FastListMixin,
+    SparseFieldsetViewMixin,
+    TombstoneMixin,
+    BulkCreateUpdateMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for managing daily recurring tasks.
     Supports filtering by status, repeats pattern, and active/inactive state.
@@ -122,12 +143,13 @@ class DailyViewSet(viewsets.ModelViewSet):
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
-        filters.SearchFilter,
+        TaskSearchFilter,
     ]
     filterset_fields = ["status", "repeats", "repeat_on"]
     search_fields = ["name", "notes"]
     ordering_fields = ["created_at", "name"]
-    ordering = ["-created_at"]
+    ordering = ["-created_at", "-id"]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         """Return daily tasks for the authenticated user only"""
@@ -137,7 +159,43 @@ class DailyViewSet(viewsets.ModelViewSet):
         """Automatically assign the daily task to the current user"""
         serializer.save(user=self.request.user)
 
+    def perform_bulk_create(self, instances):
+        """bulk_create sends no post_save signals, so drop the cached calendar here"""
+        instances = super().perform_bulk_create(instances)
+        invalidate_calendar(self.request.user.pk)
+        return instances
+
+    def perform_bulk_update(self, instances, fields):
+        super().perform_bulk_update(instances, fields)
+        if CALENDAR_FIELDS & set(fields):
+            invalidate_calendar(self.request.user.pk)
+
+    @action(detail=False, methods=["get"], url_path="calendar")
+    def calendar(self, request):
+        """
+        Dailies due on each day of ?from=&to= (ISO dates, inclusive).
+        Defaults to the next 30 days; at most 366 days per request.
+        """
+        try:
+            start = _query_date(request, "from", timezone.localdate())
+            end = _query_date(request, "to", start + timedelta(days=DEFAULT_RANGE_DAYS - 1))
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if end < start:
+            return Response(
+                {"detail": "'to' must not be before 'from'."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if (end - start).days >= MAX_RANGE_DAYS:
+            return Response(
+                {"detail": f"Date range cannot exceed {MAX_RANGE_DAYS} days."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(build_calendar(request.user, start, end), status=status.HTTP_200_OK)
+
     @action(detail=True, methods=["post"], url_path="complete")
+    @idempotent
     @transaction.atomic
     def complete_daily(self, request, pk=None):
         """
@@ -146,54 +204,29 @@ class DailyViewSet(viewsets.ModelViewSet):
         """
         daily = self.get_object()
 
-        # Check if already completed
-        if daily.status == TasksStatus.COMPLETED:
-            return Response(
-                {"detail": "Daily task already completed for today."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Reward user
-        request.user.gain_exp(15)
-
-        # Increase strength
-        daily.strength = self._increase_strength(daily.strength)
-        daily.status = TasksStatus.COMPLETED
-        daily.save()
+        try:
+            message, daily, character = complete_task(request.user, TaskType.DAILY, daily)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(
             {
-                "detail": "Daily task completed! +15 EXP",
+                "detail": message,
                 "daily": DailySerializer(daily).data,
-                "user": {
-                    "current_hp": request.user.current_hp,
-                    "max_hp": request.user.max_hp,
-                    "current_exp": request.user.current_exp,
-                    "current_level": request.user.current_level,
-                },
+                "user": _character_stats(character),
             },
             status=status.HTTP_200_OK,
         )
 
-    def _increase_strength(self, current_strength):
-        """Increase daily strength by one level"""
-        strength_order = [
-            TasksStrength.FRAGILE,
-            TasksStrength.WEAK,
-            TasksStrength.STABLE,
-            TasksStrength.STRONG,
-            TasksStrength.UNBREAKABLE,
-        ]
-        try:
-            current_index = strength_order.index(current_strength)
-            if current_index < len(strength_order) - 1:
-                return strength_order[current_index + 1]
-        except (ValueError, IndexError):
-            pass
-        return current_strength
 
-
-class TodoViewSet(viewsets.ModelViewSet):
+class TodoViewSet(
+    DataVersionETagMixin,
+    FastListMixin,
+    SparseFieldsetViewMixin,
+    TombstoneMixin,
+    BulkCreateUpdateMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for managing one-time todo tasks.
     Supports filtering by completion status and due date.
@@ -204,15 +237,18 @@ class TodoViewSet(viewsets.ModelViewSet):
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
-        filters.SearchFilter,
+        TaskSearchFilter,
     ]
     filterset_fields = ["is_completed"]
     search_fields = ["name", "notes"]
     ordering_fields = ["created_at", "due_date", "name"]
-    ordering = ["due_date", "-created_at"]
+    ordering = ["due_date", "-created_at", "-id"]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         """Return todos for the authenticated user only"""
+        if self._reads_archive():
+            return ArchivedTodo.objects.filter(user=self.request.user)
         queryset = Todo.objects.filter(user=self.request.user)
 
         # Optional filtering for active/planned/completed
@@ -222,17 +258,61 @@ class TodoViewSet(viewsets.ModelViewSet):
         elif filter_type == "completed":
             queryset = queryset.filter(is_completed=True)
         elif filter_type == "planned":
-            from django.utils import timezone
-
             queryset = queryset.filter(is_completed=False, due_date__gt=timezone.now().date())
 
         return queryset
 
+    def _reads_archive(self):
+        """`?filter=completed&archived=1` lists the cold archive of old completed todos"""
+        params = self.request.query_params
+        return (
+            self.action == "list"
+            and params.get("filter") == "completed"
+            and params.get("archived") in ("1", "true")
+        )
+
+    def get_serializer_class(self):
+        if self._reads_archive():
+            return ArchivedTodoSerializer
+        return super().get_serializer_class()
+
+    def list(self, request, *args, **kwargs):
+        """
+        `filter=completed` pages through recently completed todos first; the last
+        page links to the archive (`archived=1`), which has its own cursor.
+        """
+        response = super().list(request, *args, **kwargs)
+        if (
+            response.status_code == status.HTTP_200_OK
+            and request.query_params.get("filter") == "completed"
+            and not self._reads_archive()
+            and response.data["next"] is None
+        ):
+            url = remove_query_param(
+                request.build_absolute_uri(), self.paginator.cursor_query_param
+            )
+            response.data["next"] = replace_query_param(url, "archived", "1")
+        return response
+
     def perform_create(self, serializer):
         """Automatically assign the todo to the current user"""
         serializer.save(user=self.request.user)
 
+    def perform_bulk_create(self, instances):
+        for todo in instances:
+            todo.sync_completed_at()
+        return super().perform_bulk_create(instances)
+
+    def perform_bulk_update(self, instances, fields):
+        """Todo.save() is bypassed, so keep completed_at in step here"""
+        if "is_completed" in fields:
+            for todo in instances:
+                todo.sync_completed_at()
+            fields = [*fields, "completed_at"]
+        super().perform_bulk_update(instances, fields)
+
     @action(detail=True, methods=["post"], url_path="complete")
+    @idempotent
     @transaction.atomic
     def complete_todo(self, request, pk=None):
         """
@@ -241,48 +321,102 @@ class TodoViewSet(viewsets.ModelViewSet):
         """
         todo = self.get_object()
 
-        # Check if already completed
-        if todo.is_completed:
-            return Response(
-                {"detail": "Todo already completed."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        try:
+            message, todo, character = complete_task(request.user, TaskType.TODO, todo)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                "detail": message,
+                "todo": TodoSerializer(todo).data,
+                "user": _character_stats(character),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class TaskBatchCompleteView(APIView):
+    """
+    Complete a mixed list of habits, dailies and todos in one transaction.
+    Used by clients replaying an offline queue of check-ins.
+    """
 
-        # Reward user
-        request.user.gain_exp(20)
+    permission_classes = [IsAuthenticated]
+
+    @idempotent
+    def post(self, request):
+        serializer = TaskBatchCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        # Increase strength and mark as completed
-        todo.strength = self._increase_strength(todo.strength)
-        todo.is_completed = True
-        todo.save()
+        result = complete_batch(request.user, serializer.validated_data["tasks"])
+        character = result["character"]
+        completed = sum(1 for item in result["results"] if item["completed"])
 
         return Response(
             {
-                "detail": "Todo completed! +20 EXP",
-                "todo": TodoSerializer(todo).data,
-                "user": {
-                    "current_hp": request.user.current_hp,
-                    "max_hp": request.user.max_hp,
-                    "current_exp": request.user.current_exp,
-                    "current_level": request.user.current_level,
-                },
+                "detail": f"Completed {completed} of {len(result['results'])} tasks.",
+                "results": result["results"],
+                "exp_gained": result["exp_gained"],
+                "hp_lost": result["hp_lost"],
+                "user": _character_stats(character),
             },
             status=status.HTTP_200_OK,
         )
 
-    def _increase_strength(self, current_strength):
-        """Increase todo strength by one level"""
-        strength_order = [
-            TasksStrength.FRAGILE,
-            TasksStrength.WEAK,
-            TasksStrength.STABLE,
-            TasksStrength.STRONG,
-            TasksStrength.UNBREAKABLE,
-        ]
+
+class TaskExportView(APIView):
+    """
+    Stream all of the user's habits, dailies and todos (archived ones included) as
+    NDJSON (default) or CSV, chosen with `?format=ndjson|csv`. Rows are read from a
+    server-side cursor and written as they arrive, so memory use stays flat no
+    matter how many tasks are exported.
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    def get(self, request):
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(export_rows(request.user)),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        filename = f"tasks-{timezone.localdate().isoformat()}.{renderer.format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class TaskSyncView(APIView):
+    """
+    Delta sync for offline-first clients: `?since=<token>` returns only the tasks
+    created, updated or deleted since the token was issued, plus a new token.
+    Without a token (or with an expired one) it returns a full snapshot.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        token = request.query_params.get("since")
         try:
-            current_index = strength_order.index(current_strength)
-            if current_index < len(strength_order) - 1:
-                return strength_order[current_index + 1]
-        except (ValueError, IndexError):
-            pass
-        return current_strength
+            since = decode_token(token) if token else None
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = build_sync(request.user, since)
+        character = data.pop("character")
+        data["user"] = _character_stats(character) if character else None
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class TaskCountsView(APIView):
+    """
+    Per-status counts of the user's habits, dailies and todos for UI badges,
+    cached per user until one of their tasks changes. Supports If-None-Match.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @data_version_etag
+    def get(self, request):
+        return Response(get_task_counts(request.user), status=status.HTTP_200_OK)
@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.utils.timezone import now
 
 from .models import User, Character
+from .user_cache import invalidate_cached_users
 
 
 # ==============================
@@ -82,7 +83,10 @@ class UserAdmin(admin.ModelAdmin):
     # ==============================
     @admin.action(description="Deactivate selected users")
     def deactivate_users(self, request, queryset):
+        user_ids = list(queryset.values_list("pk", flat=True))
         queryset.update(is_active=False)
+        # update() sends no post_save, so drop the cached rows used for JWT auth here
+        invalidate_cached_users(*user_ids)
 
     @admin.action(description="Reset EXP for linked characters")
     def reset_exp(self, request, queryset):
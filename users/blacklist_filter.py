@@ -0,0 +1,124 @@
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from habit_tracker_rpg.caches import is_shared_cache
+
+
+def filter_enabled():
+    """
+    True if TOKEN_BLACKLIST_FILTER is on and the default cache is shared by all
+    processes. Otherwise a token blacklisted by another process would be accepted
+    here until the next rebuild, so the blacklist is always checked in the database.
+    """
+    if not getattr(settings, "TOKEN_BLACKLIST_FILTER", False):
+        return False
+    return is_shared_cache()
+
+
+def _marker_key(jti):
+    return f"users:blacklisted-jti:{jti}"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter of strings: `in` may return a false positive (at about
+    `error_rate` once `capacity` items were added) but never a false negative.
+
+    The `hash_count` bit positions of an item are derived from one 128-bit blake2b
+    digest with double hashing (h1 + i * h2).
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(int(capacity), 1)
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / capacity * math.log(2)), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item)
+        )
+
+
+class BlacklistFilter:
+    """
+    Per-process Bloom filter of blacklisted refresh token JTIs, so refreshing a token
+    that was never blacklisted skips the `BlacklistedToken` lookup.
+
+    The filter is built from the table on first use and rebuilt every
+    `rebuild_interval` seconds (dropping expired tokens and resizing for growth).
+    A JTI blacklisted by this process is added right away; one blacklisted by
+    another process is seen through a shared-cache marker that outlives the next
+    rebuild of every process. Only "maybe blacklisted" answers go to the database.
+    Used only when filter_enabled().
+    """
+
+    def __init__(self, capacity=100_000, error_rate=0.01, rebuild_interval=300.0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self._filter = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def rebuild(self):
+        """Reload the filter with every unexpired blacklisted JTI."""
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        jtis = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).values_list(
+            "token__jti", flat=True
+        )
+        bloom = BloomFilter(max(self.capacity, 2 * jtis.count()), self.error_rate)
+        for jti in jtis.iterator(chunk_size=5000):
+            bloom.add(jti)
+        self._filter, self._built_at = bloom, time.monotonic()
+        return bloom
+
+    def _current(self):
+        bloom = self._filter
+        if bloom is None or time.monotonic() - self._built_at >= self.rebuild_interval:
+            with self._lock:
+                bloom = self._filter
+                if bloom is None or time.monotonic() - self._built_at >= self.rebuild_interval:
+                    bloom = self.rebuild()
+        return bloom
+
+    def add(self, *jtis):
+        """Record newly blacklisted JTIs locally and for the other processes."""
+        if not filter_enabled():
+            return
+        bloom = self._current()
+        for jti in jtis:
+            bloom.add(jti)
+        cache.set_many({_marker_key(jti): True for jti in jtis}, 2 * self.rebuild_interval)
+
+    def might_contain(self, jti):
+        """False if `jti` is certainly not blacklisted; True means "check the database"."""
+        return jti in self._current() or cache.get(_marker_key(jti)) is not None
+
+    def reset(self):
+        """Drop the filter; the next check rebuilds it from the table."""
+        self._filter = None
+
+
+blacklist_filter = BlacklistFilter(
+    capacity=getattr(settings, "TOKEN_BLACKLIST_FILTER_CAPACITY", 100_000),
+    error_rate=getattr(settings, "TOKEN_BLACKLIST_FILTER_ERROR_RATE", 0.01),
+    rebuild_interval=getattr(settings, "TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL", 300.0),
+)
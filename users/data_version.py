@@ -0,0 +1,105 @@
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+GLOBAL_VERSION_KEY = "users:data-version:global"
+
+
+def _user_key(user_id):
+    return f"users:data-version:{user_id}"
+
+
+def _incr(keys):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            pass  # not read yet; the next read starts a fresh version
+
+
+def _bump(keys):
+    """
+    Increment the version counters now and, inside a transaction, once more after
+    commit: a request that read the first new version before the commit (and so
+    still saw the old rows) must not be able to keep its ETag.
+    """
+    _incr(keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _incr(keys))
+
+
+def bump_data_version(*user_ids):
+    """Invalidate the ETags of these users after a write to their tasks or character."""
+    _bump([_user_key(user_id) for user_id in set(user_ids)])
+
+
+def bump_global_data_version():
+    """Invalidate every user's ETags, e.g. after a set-based job touched many users."""
+    _bump([GLOBAL_VERSION_KEY])
+
+
+def get_data_version(user_id):
+    """
+    Current data version of a user, as a string. Counters start from the current time
+    in nanoseconds, so a counter evicted from the cache never restarts at a value an
+    old ETag could still match.
+    """
+    keys = [GLOBAL_VERSION_KEY, _user_key(user_id)]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return ".".join(str(versions[key]) for key in keys)
+
+
+def data_version_etag(view_method):
+    """
+    Conditional GET for a read-only view method, based on the user's data version.
+
+    The response gets a strong ETag made of the version and the current date
+    (streaks and "planned" todos change at midnight without a write). A request
+    whose If-None-Match matches it is answered with 304 Not Modified straight
+    away: the view, its queries and its serializer don't run at all.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        version = get_data_version(request.user.pk)
+        etag = f'"{version}.{timezone.localdate().isoformat()}"'
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            candidates = {tag.removeprefix("W/") for tag in parse_etags(if_none_match)}
+            if etag in candidates or "*" in candidates:
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+                response["ETag"] = etag
+                patch_vary_headers(response, ["Authorization"])
+                return response
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response["ETag"] = etag
+            patch_vary_headers(response, ["Authorization"])
+        return response
+
+    return wrapper
+
+
+class DataVersionETagMixin:
+    """Adds data_version_etag to the list and retrieve actions of a view."""
+
+    @data_version_etag
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @data_version_etag
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
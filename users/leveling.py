@@ -0,0 +1,54 @@
+from bisect import bisect_right
+
+import numpy as np
+
+# Levels covered by the precomputed tables. Reaching the cap needs ~4e11 EXP,
+# far beyond what a PositiveIntegerField can hold, so it is never hit in practice.
+MAX_LEVEL = 10_000
+
+# Per level-up bonuses (applied by Character.apply_rewards and grant_exp_bulk).
+STAT_POINTS_PER_LEVEL = 3
+MAX_HP_PER_LEVEL = 5
+MAX_MANA_PER_LEVEL = 3
+
+
+def exp_for_level(level: int) -> int:
+    """XP required to advance from `level` to `level + 1`."""
+    return int(100 * (level**1.5))
+
+
+# EXP_TO_NEXT[level] -> EXP needed to go from `level` to `level + 1` (index 0 unused).
+EXP_TO_NEXT = [0] + [exp_for_level(level) for level in range(1, MAX_LEVEL)]
+
+# CUMULATIVE_EXP[level - 1] -> total EXP needed to reach `level` starting from level 1.
+CUMULATIVE_EXP = [0]
+for _level in range(1, MAX_LEVEL):
+    CUMULATIVE_EXP.append(CUMULATIVE_EXP[-1] + EXP_TO_NEXT[_level])
+del _level
+
+CUMULATIVE_EXP_ARRAY = np.array(CUMULATIVE_EXP, dtype=np.int64)
+
+
+def resolve_level(level: int, exp: int, amount: int) -> tuple[int, int]:
+    """
+    Return (new_level, leftover_exp) after granting `amount` EXP to a character
+    at `level` with `exp` progress, using a bisect over the cumulative table.
+    """
+    total = CUMULATIVE_EXP[level - 1] + exp + amount
+    new_level = bisect_right(CUMULATIVE_EXP, total)
+    return new_level, total - CUMULATIVE_EXP[new_level - 1]
+
+
+def resolve_levels(levels, exps, amounts):
+    """
+    Vectorized `resolve_level` for many characters at once.
+    Accepts array-likes of equal length and returns (new_levels, leftover_exps).
+    """
+    levels = np.asarray(levels, dtype=np.int64)
+    totals = (
+        CUMULATIVE_EXP_ARRAY[levels - 1]
+        + np.asarray(exps, dtype=np.int64)
+        + np.asarray(amounts, dtype=np.int64)
+    )
+    new_levels = np.searchsorted(CUMULATIVE_EXP_ARRAY, totals, side="right")
+    return new_levels, totals - CUMULATIVE_EXP_ARRAY[new_levels - 1]
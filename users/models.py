@@ -1,7 +1,20 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models, transaction
-from django.db.models import Index, UniqueConstraint
-from django.db.models.functions import Lower
+from django.db.models import F, Index, UniqueConstraint
+from django.db.models.functions import Greatest, Least, Lower
+from django.utils import timezone
+
+from users.data_version import bump_data_version
+from users.leveling import (
+    EXP_TO_NEXT,
+    MAX_HP_PER_LEVEL,
+    MAX_LEVEL,
+    MAX_MANA_PER_LEVEL,
+    STAT_POINTS_PER_LEVEL,
+    exp_for_level,
+    resolve_level,
+    resolve_levels,
+)
 
 
 # ===================================================
@@ -96,23 +109,121 @@ class Character(models.Model):
 
     def exp_to_next_level(self) -> int:
         """XP required for next level-up."""
-        return int(100 * (self.current_level ** 1.5))
+        if self.current_level < MAX_LEVEL:
+            return EXP_TO_NEXT[self.current_level]
+        return exp_for_level(self.current_level)
+
+    def _apply_level_ups(self, levels_gained: int):
+        """Grant per-level bonuses for `levels_gained` level-ups."""
+        self.unallocated_stat_points += levels_gained * STAT_POINTS_PER_LEVEL
+        self.max_hp += levels_gained * MAX_HP_PER_LEVEL
+        self.max_mana += levels_gained * MAX_MANA_PER_LEVEL
 
-    @transaction.atomic
     def gain_exp(self, amount: int):
-        """Increase EXP and handle level-ups."""
+        """Increase EXP and handle level-ups (O(log n) lookup in the cumulative EXP table)."""
         if amount <= 0:
             return
-        self.current_exp += amount
-
-        while self.current_exp >= self.exp_to_next_level():
-            self.current_exp -= self.exp_to_next_level()
-            self.current_level += 1
-            self.unallocated_stat_points += 3  # or formula
-            self.max_hp += 5
-            self.max_mana += 3
-
-        self.save()
+        self.apply_rewards(exp=amount)
+
+    def apply_rewards(self, exp: int = 0, hp: int = 0, mana: int = 0) -> int:
+        """
+        Apply EXP gain and HP/mana deltas (negative for damage) without locking the row.
+
+        Everything is written with conditional UPDATEs of only the changed columns,
+        computed from the stored values (F() expressions), so concurrent rewards never
+        overwrite each other. HP and mana are clamped to [0, max] in SQL. The common
+        case is a single statement whose WHERE clause doubles as the level-up check:
+        it only matches while the character stays below the next threshold. When it
+        does not match, the EXP is added unconditionally (which holds the row lock for
+        the rest of the transaction) and level-ups are resolved from the table.
+
+        Refreshes the changed fields and returns the number of levels gained.
+        """
+        exp = max(exp, 0)
+        changes = {}
+        if hp:
+            changes["current_hp"] = Greatest(Least(F("current_hp") + hp, F("max_hp")), 0)
+        if mana:
+            changes["current_mana"] = Greatest(Least(F("current_mana") + mana, F("max_mana")), 0)
+        if not exp and not changes:
+            return 0
+
+        fields = list(changes)
+        levels_gained = 0
+        rows = Character.objects.filter(pk=self.pk)
+        with transaction.atomic(savepoint=False):
+            if exp:
+                fields += ["current_exp", "current_level"]
+                changes["current_exp"] = F("current_exp") + exp
+                applied = rows.filter(
+                    current_level=self.current_level,
+                    current_exp__lt=self.exp_to_next_level() - exp,
+                ).update(updated_at=timezone.now(), **changes)
+                if not applied:
+                    rows.update(updated_at=timezone.now(), **changes)
+                    self.refresh_from_db(fields=["current_level", "current_exp"])
+                    new_level, new_exp = resolve_level(self.current_level, self.current_exp, 0)
+                    levels_gained = new_level - self.current_level
+                    if levels_gained:
+                        fields += ["unallocated_stat_points", "max_hp", "max_mana"]
+                        rows.update(
+                            current_level=new_level,
+                            current_exp=new_exp,
+                            unallocated_stat_points=F("unallocated_stat_points")
+                            + levels_gained * STAT_POINTS_PER_LEVEL,
+                            max_hp=F("max_hp") + levels_gained * MAX_HP_PER_LEVEL,
+                            max_mana=F("max_mana") + levels_gained * MAX_MANA_PER_LEVEL,
+                        )
+            else:
+                rows.update(updated_at=timezone.now(), **changes)
+
+        self.refresh_from_db(fields=[*fields, "updated_at"])
+        bump_data_version(self.user_id)
+        return levels_gained
+
+    @classmethod
+    def grant_exp_bulk(cls, grants: dict, batch_size: int = 1000) -> int:
+        """
+        Apply EXP grants to many characters at once, e.g. for batch reward jobs.
+
+        `grants` maps character id -> EXP amount. Level-ups for the whole batch are
+        resolved with one vectorized table lookup and written with bulk_update.
+        Returns the number of characters updated.
+        """
+        grants = {pk: amount for pk, amount in grants.items() if amount > 0}
+        if not grants:
+            return 0
+
+        with transaction.atomic():
+            characters = list(
+                cls.objects.select_for_update()
+                .filter(pk__in=grants)
+                .only(
+                    "user_id",
+                    "current_exp",
+                    "current_level",
+                    "unallocated_stat_points",
+                    "max_hp",
+                    "max_mana",
+                )
+            )
+            new_levels, new_exps = resolve_levels(
+                [c.current_level for c in characters],
+                [c.current_exp for c in characters],
+                [grants[c.pk] for c in characters],
+            )
+            for character, new_level, new_exp in zip(characters, new_levels, new_exps):
+                character._apply_level_ups(int(new_level) - character.current_level)
+                character.current_level = int(new_level)
+                character.current_exp = int(new_exp)
+
+            cls.objects.bulk_update(
+                characters,
+                ["current_exp", "current_level", "unallocated_stat_points", "max_hp", "max_mana"],
+                batch_size=batch_size,
+            )
+        bump_data_version(*(c.user_id for c in characters))
+        return len(characters)
 
     def regen_daily_mana(self):
         """Regenerate 50% of max mana daily."""
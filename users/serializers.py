@@ -1,10 +1,13 @@
 import re
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from habit_tracker_rpg.sparse_fields import SparseFieldsetMixin
 from users.models import User, Character
+from users.tokens import FilteredRefreshToken
 
 
-class UserCreateSerializer(serializers.ModelSerializer):
+class UserCreateSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     username = serializers.CharField(write_only=True, min_length=3, max_length=150)
     password = serializers.CharField(write_only=True, min_length=8)
     email = serializers.EmailField(required=True)
@@ -42,7 +45,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
         return user
 
 
-class CharacterSerializer(serializers.ModelSerializer):
+class CharacterSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Character
         fields = [
@@ -62,7 +65,7 @@ class CharacterSerializer(serializers.ModelSerializer):
         ]
 
 
-class UserReadSerializer(serializers.ModelSerializer):
+class UserReadSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     character = CharacterSerializer(read_only=True)  # nested serializer
 
     class Meta:
@@ -75,7 +78,7 @@ class UserReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+class UserUpdateSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     email = serializers.EmailField(required=False)
 
     class Meta:
@@ -138,3 +141,8 @@ class ChangePasswordSerializer(serializers.Serializer):
         user = self.context.get("request").user
         validate_password(attrs["new_password1"], user=user)
         return attrs
+
+
+class RefreshSerializer(TokenRefreshSerializer):
+    """Token refresh that consults the blacklist filter before the BlacklistedToken table."""
+    token_class = FilteredRefreshToken
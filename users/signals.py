@@ -1,6 +1,13 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from users.blacklist_filter import blacklist_filter
+from users.data_version import bump_data_version
+from users.models import Character
+from users.user_cache import invalidate_cached_users
 
 User = get_user_model()
 
@@ -18,3 +25,29 @@ def update_last_logout(sender, request, user, **kwargs):
     if user is not None:
         user.last_logout = user.last_login or user.last_logout
         user.save(update_fields=["last_logout"])
+
+
+# Signal: invalidate the user's ETags when their profile or character changes
+@receiver(post_save, sender=User)
+def bump_data_version_on_user_save(sender, instance, **kwargs):
+    bump_data_version(instance.pk)
+
+
+@receiver(post_save, sender=Character)
+def bump_data_version_on_character_save(sender, instance, **kwargs):
+    bump_data_version(instance.user_id)
+
+
+# Signal: drop the cached user row used by CachedJWTAuthentication (profile update,
+# password change, deactivation through save(), deletion)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_cached_users(instance.pk)
+
+
+# Signal: add blacklisted refresh tokens (logout, rotation, admin) to the blacklist filter
+@receiver(post_save, sender=BlacklistedToken)
+def add_to_blacklist_filter(sender, instance, created, **kwargs):
+    if created:
+        blacklist_filter.add(instance.token.jti)
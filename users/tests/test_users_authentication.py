@@ -0,0 +1,179 @@
+import pytest
+from django.contrib.admin.sites import site
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.models import User
+from users.user_cache import LocalUserCache, get_cached_user, local_user_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    cache.clear()
+    local_user_cache.clear()
+    yield
+    cache.clear()
+    local_user_cache.clear()
+
+
+def _bearer(api_client, token):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return api_client
+
+
+def _user_selects(context):
+    return [q["sql"] for q in context.captured_queries if 'FROM "users_user"' in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_authenticated_get_skips_user_select(api_client, user_factory):
+    user = user_factory()
+    client = _bearer(api_client, AccessToken.for_user(user))
+    url = reverse("task-counts")
+    assert client.get(url).status_code == 200
+
+    with CaptureQueriesContext(connection) as context:
+        assert client.get(url).status_code == 200
+
+    assert _user_selects(context) == []
+
+
+@pytest.mark.django_db
+def test_each_request_gets_its_own_user_instance(user_factory):
+    user = user_factory()
+
+    first, second = get_cached_user(user.pk), get_cached_user(user.pk)
+
+    assert first == second == user
+    assert first is not second
+    assert get_cached_user(user.pk + 1000) is None
+
+
+@pytest.mark.django_db
+def test_profile_update_and_password_change_invalidate(api_client, user_factory):
+    user = user_factory()
+    client = _bearer(api_client, AccessToken.for_user(user))
+    client.get(reverse("user-me"))
+
+    user.email = "new@example.com"
+    user.save()
+    assert client.get(reverse("user-me")).data["email"] == "new@example.com"
+
+    user.set_password("AnotherPass456!")
+    user.save()
+    assert get_cached_user(user.pk).check_password("AnotherPass456!")
+
+
+def _change_password_in_other_process(user, password):
+    """A password change this process's local cache never hears about (no post_save here)"""
+    User.objects.filter(pk=user.pk).update(password=make_password(password))
+
+
+@pytest.mark.django_db
+def test_profile_update_does_not_write_back_stale_user(api_client, user_factory):
+    user = user_factory()
+    client = _bearer(api_client, AccessToken.for_user(user))
+    client.get(reverse("user-me"))
+
+    _change_password_in_other_process(user, "AnotherPass456!")
+    response = client.patch(
+        reverse("user-update"), {"email": "new@example.com"}, format="multipart"
+    )
+
+    assert response.status_code == 200
+    user.refresh_from_db()
+    assert user.email == "new@example.com"
+    assert user.check_password("AnotherPass456!")
+
+
+@pytest.mark.django_db
+def test_change_password_checks_the_current_password(api_client, user_factory):
+    user = user_factory()
+    client = _bearer(api_client, AccessToken.for_user(user))
+    client.get(reverse("user-me"))
+
+    _change_password_in_other_process(user, "AnotherPass456!")
+    response = client.post(
+        reverse("change-password"),
+        {
+            "old_password": "StrongPass123!",
+            "new_password1": "ThirdPass789!",
+            "new_password2": "ThirdPass789!",
+        },
+        format="json",
+    )
+
+    assert response.status_code == 400
+    user.refresh_from_db()
+    assert user.check_password("AnotherPass456!")
+
+
+@pytest.mark.django_db
+def test_shared_tier_is_skipped_with_process_local_cache(user_factory):
+    user = user_factory()
+
+    get_cached_user(user.pk)
+
+    assert cache.get(f"users:auth-user:{user.pk}") is None
+
+
+@pytest.mark.django_db
+def test_shared_tier_is_used_with_shared_cache(user_factory, settings, tmp_path):
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path / "cache"),
+        }
+    }
+    user = user_factory()
+
+    get_cached_user(user.pk)
+
+    assert cache.get(f"users:auth-user:{user.pk}") is not None
+
+
+@pytest.mark.django_db
+def test_admin_deactivation_invalidates(api_client, user_factory, rf):
+    user = user_factory()
+    client = _bearer(api_client, AccessToken.for_user(user))
+    assert client.get(reverse("user-me")).status_code == 200
+
+    site._registry[User].deactivate_users(rf.post("/"), User.objects.filter(pk=user.pk))
+
+    response = client.get(reverse("user-me"))
+    assert response.status_code == 401
+    assert response.data["code"] == "user_inactive"
+
+
+@pytest.mark.django_db
+def test_deleted_user_is_rejected(api_client, user_factory):
+    user = user_factory()
+    client = _bearer(api_client, AccessToken.for_user(user))
+    client.get(reverse("user-me"))
+
+    user.delete()
+
+    assert client.get(reverse("user-me")).status_code == 401
+
+
+def test_local_cache_evicts_least_recently_used():
+    local = LocalUserCache(max_size=2, ttl=60)
+    local.set(1, "a")
+    local.set(2, "b")
+    local.get(1)
+    local.set(3, "c")
+
+    assert local.get(2) is None
+    assert (local.get(1), local.get(3)) == ("a", "c")
+
+
+def test_local_cache_expires_entries():
+    local = LocalUserCache(ttl=0)
+    local.set(1, "a")
+
+    assert local.get(1) is None
+    assert len(local) == 0
@@ -0,0 +1,156 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.blacklist_filter import BlacklistFilter, BloomFilter, blacklist_filter, filter_enabled
+from users.tokens import revoke_user_tokens
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture(autouse=True)
+def fresh_filter(settings, tmp_path):
+    """The filter on, with a cache that every process shares (files instead of Redis)"""
+    settings.TOKEN_BLACKLIST_FILTER = True
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path / "cache"),
+        }
+    }
+    cache.clear()
+    blacklist_filter.reset()
+    yield
+    cache.clear()
+    blacklist_filter.reset()
+
+
+def _blacklist_checks(context):
+    """BlacklistedToken lookups by JTI (check_blacklist), not the rotation's get_or_create."""
+    return [
+        q["sql"]
+        for q in context.captured_queries
+        if 'FROM "token_blacklist_blacklistedtoken"' in q["sql"]
+        and '"token_blacklist_outstandingtoken"."jti" =' in q["sql"]
+    ]
+
+
+def _refresh(api_client, token):
+    return api_client.post(reverse("token-refresh"), {"refresh": str(token)}, format="json")
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"in-{i}")
+
+    assert all(f"in-{i}" in bloom for i in range(1000))
+    assert sum(f"out-{i}" in bloom for i in range(10_000)) < 300
+
+
+@pytest.mark.django_db
+def test_refresh_of_unknown_token_skips_blacklist_query(api_client, user_factory):
+    token = RefreshToken.for_user(user_factory())
+
+    with CaptureQueriesContext(connection) as context:
+        response = _refresh(api_client, token)
+
+    assert response.status_code == 200
+    assert _blacklist_checks(context) == []
+
+
+@pytest.mark.django_db
+def test_filter_disabled_queries_blacklist(api_client, user_factory):
+    token = RefreshToken.for_user(user_factory())
+
+    with override_settings(TOKEN_BLACKLIST_FILTER=False):
+        with CaptureQueriesContext(connection) as context:
+            assert _refresh(api_client, token).status_code == 200
+
+    assert len(_blacklist_checks(context)) == 1
+
+
+@pytest.mark.django_db
+def test_rotated_and_logged_out_tokens_are_rejected(api_client, user_factory):
+    user = user_factory()
+    token = RefreshToken.for_user(user)
+    rotated = _refresh(api_client, token).data["refresh"]
+
+    assert _refresh(api_client, token).status_code == 401
+
+    api_client.force_authenticate(user=user)
+    response = api_client.post(reverse("token-logout"), {"refresh": rotated}, format="json")
+    assert response.status_code == 205
+    assert _refresh(api_client, rotated).status_code == 401
+
+
+@pytest.mark.django_db
+def test_filter_is_rebuilt_from_table(api_client, user_factory):
+    token = RefreshToken.for_user(user_factory())
+    blacklist_filter.might_contain("warm-up")  # built before the token is blacklisted
+    # written without signals, as another process's bulk insert would look here
+    BlacklistedToken.objects.bulk_create(
+        [BlacklistedToken(token=OutstandingToken.objects.get(jti=token["jti"]))]
+    )
+
+    blacklist_filter.reset()
+
+    assert blacklist_filter.might_contain(token["jti"])
+    assert _refresh(api_client, token).status_code == 401
+
+
+def _blacklist_in_other_process(token):
+    """What this process sees when another worker blacklists `token`: the row and its marker"""
+    other_process = BlacklistFilter()
+    BlacklistedToken.objects.bulk_create(  # no post_save, so this process's filter misses it
+        [BlacklistedToken(token=OutstandingToken.objects.get(jti=token["jti"]))]
+    )
+    other_process.add(token["jti"])
+
+
+@pytest.mark.django_db
+def test_other_process_blacklisting_is_seen_through_shared_cache(api_client, user_factory):
+    token = RefreshToken.for_user(user_factory())
+    blacklist_filter.might_contain("warm-up")  # built before the other process blacklists
+
+    _blacklist_in_other_process(token)
+
+    assert token["jti"] not in blacklist_filter._current()
+    assert _refresh(api_client, token).status_code == 401
+
+
+@pytest.mark.django_db
+def test_process_local_cache_falls_back_to_database(api_client, user_factory, settings):
+    settings.CACHES = LOCMEM
+    token = RefreshToken.for_user(user_factory())
+    blacklist_filter.might_contain("warm-up")
+
+    _blacklist_in_other_process(token)
+    cache.clear()  # the other process's markers never reach this process's LocMem cache
+
+    assert not filter_enabled()
+    with CaptureQueriesContext(connection) as context:
+        assert _refresh(api_client, token).status_code == 401
+    assert len(_blacklist_checks(context)) == 1
+
+
+def test_filter_is_off_by_default(settings):
+    del settings.TOKEN_BLACKLIST_FILTER
+
+    assert not filter_enabled()
+
+
+@pytest.mark.django_db
+def test_revoked_tokens_are_added(api_client, user_factory):
+    user = user_factory()
+    token = RefreshToken.for_user(user)
+
+    revoke_user_tokens(user)
+
+    assert token["jti"] in blacklist_filter._current()
+    assert _refresh(api_client, token).status_code == 401
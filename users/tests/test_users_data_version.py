@@ -0,0 +1,84 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from users.data_version import bump_data_version, bump_global_data_version, get_data_version
+from users.models import Character
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def character_client(api_client, user_factory):
+    user = user_factory()
+    Character.objects.create(user=user)
+    api_client.force_authenticate(user=user)
+    return api_client, user
+
+
+def test_versions_change_on_bumps():
+    first = get_data_version(1)
+    assert get_data_version(1) == first
+
+    bump_data_version(1)
+    second = get_data_version(1)
+    assert second != first
+    assert get_data_version(2) != second
+
+    bump_global_data_version()
+    assert get_data_version(1) != second
+
+
+def test_evicted_version_does_not_restart():
+    first = get_data_version(1)
+    cache.clear()
+
+    assert get_data_version(1) != first
+
+
+@pytest.mark.django_db
+def test_character_list_answers_304_without_queries(character_client, django_assert_num_queries):
+    client, _ = character_client
+    url = reverse("character-list")
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    with django_assert_num_queries(0):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_character_write_changes_etag(character_client):
+    client, user = character_client
+    url = reverse("character-list")
+    etag = client.get(url)["ETag"]
+
+    user.character.apply_rewards(exp=5)
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response.data[0]["current_exp"] == 5
+
+
+@pytest.mark.django_db
+def test_profile_supports_if_none_match(character_client):
+    client, user = character_client
+    url = reverse("user-me")
+    etag = client.get(url)["ETag"]
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    user.email = "changed@example.com"
+    user.save()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
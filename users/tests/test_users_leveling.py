@@ -0,0 +1,70 @@
+import pytest
+
+from users.leveling import resolve_level, resolve_levels
+from users.models import Character, User
+
+
+def _loop_level_up(level, exp, amount):
+    """Reference implementation: the original one-level-at-a-time loop."""
+    exp += amount
+    while exp >= int(100 * (level**1.5)):
+        exp -= int(100 * (level**1.5))
+        level += 1
+    return level, exp
+
+
+@pytest.mark.parametrize(
+    "level,exp,amount",
+    [(1, 0, 10), (1, 95, 5), (1, 99, 1), (1, 0, 100_000), (7, 123, 4567), (50, 0, 10**7)],
+)
+def test_resolve_level_matches_loop(level, exp, amount):
+    assert resolve_level(level, exp, amount) == _loop_level_up(level, exp, amount)
+
+
+def test_resolve_levels_matches_scalar():
+    levels = [1, 1, 3, 12, 40]
+    exps = [0, 90, 10, 500, 0]
+    amounts = [5, 10, 1000, 250_000, 3]
+    new_levels, new_exps = resolve_levels(levels, exps, amounts)
+    expected = [resolve_level(*args) for args in zip(levels, exps, amounts)]
+    assert list(zip(new_levels.tolist(), new_exps.tolist())) == expected
+
+
+def _character(username, **kwargs):
+    user = User.objects.create_user(
+        username=username, email=f"{username}@example.com", password="StrongPass123!"
+    )
+    return Character.objects.create(user=user, **kwargs)
+
+
+@pytest.mark.django_db
+def test_gain_exp_applies_multiple_level_ups_at_once():
+    character = _character("lvlup", current_exp=50, max_hp=10, max_mana=10)
+
+    character.gain_exp(100 + 282 + 519)
+    character.refresh_from_db()
+
+    assert character.current_level == 4
+    assert character.current_exp == 50
+    assert character.unallocated_stat_points == 9
+    assert character.max_hp == 25
+    assert character.max_mana == 19
+
+
+@pytest.mark.django_db
+def test_grant_exp_bulk_updates_many_characters(django_assert_max_num_queries):
+    low = _character("bulk1")
+    high = _character("bulk2", current_level=5, current_exp=10)
+    untouched = _character("bulk3")
+
+    with django_assert_max_num_queries(5):
+        updated = Character.grant_exp_bulk({low.pk: 150, high.pk: 40, untouched.pk: 0})
+
+    assert updated == 2
+    low.refresh_from_db()
+    high.refresh_from_db()
+    untouched.refresh_from_db()
+    assert (low.current_level, low.current_exp) == _loop_level_up(1, 0, 150)
+    assert low.unallocated_stat_points == 3
+    assert (high.current_level, high.current_exp) == (5, 50)
+    assert untouched.current_exp == 0
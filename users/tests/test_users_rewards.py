@@ -0,0 +1,89 @@
+import threading
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from users.models import Character, User
+
+
+def _character(username, **kwargs):
+    user = User.objects.create_user(
+        username=username, email=f"{username}@example.com", password="StrongPass123!"
+    )
+    return Character.objects.create(user=user, **kwargs)
+
+
+@pytest.mark.django_db
+def test_reward_without_level_up_is_one_unlocked_update():
+    character = _character("fast", current_exp=10, current_hp=8, max_hp=10)
+
+    with CaptureQueriesContext(connection) as context:
+        assert character.apply_rewards(exp=20, hp=-3) == 0
+
+    writes = [q["sql"] for q in context.captured_queries if q["sql"].startswith("UPDATE")]
+    assert len(writes) == 1
+    assert '"current_exp"' in writes[0] and '"current_hp"' in writes[0]
+    assert '"strength"' not in writes[0]
+    assert not any("FOR UPDATE" in q["sql"] for q in context.captured_queries)
+    assert (character.current_exp, character.current_hp) == (30, 5)
+
+
+@pytest.mark.django_db
+def test_hp_and_mana_are_clamped_in_sql():
+    character = _character("clamp", current_hp=4, max_hp=10, current_mana=9, max_mana=10)
+
+    character.apply_rewards(hp=-50, mana=5)
+
+    character.refresh_from_db()
+    assert (character.current_hp, character.current_mana) == (0, 10)
+
+
+@pytest.mark.django_db
+def test_reward_crossing_a_threshold_levels_up():
+    character = _character("cross", current_exp=95, max_hp=10, max_mana=10)
+
+    assert character.apply_rewards(exp=10) == 1
+
+    character.refresh_from_db()
+    assert (character.current_level, character.current_exp) == (2, 5)
+    assert (character.unallocated_stat_points, character.max_hp, character.max_mana) == (3, 15, 13)
+
+
+@pytest.mark.django_db
+def test_stale_instances_do_not_lose_rewards():
+    phone = _character("stale", current_exp=0, current_hp=10, max_hp=10)
+    web = Character.objects.get(pk=phone.pk)
+
+    phone.apply_rewards(exp=10)
+    web.apply_rewards(exp=15, hp=-5)
+
+    web.refresh_from_db()
+    assert (web.current_exp, web.current_hp) == (25, 5)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_rewards_are_all_applied():
+    character = _character("race", current_exp=0)
+    errors = []
+
+    def complete_many():
+        try:
+            instance = Character.objects.get(pk=character.pk)
+            for _ in range(10):
+                instance.apply_rewards(exp=15)
+        except Exception as exc:  # pragma: no cover - surfaced by the assertion below
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=complete_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    character.refresh_from_db()
+    # 600 EXP from level 1: 100 + 282 to reach level 3, 218 left
+    assert (character.current_level, character.current_exp) == (3, 218)
@@ -0,0 +1,32 @@
+import pytest
+from django.urls import reverse
+
+from users.models import Character
+
+
+@pytest.fixture
+def client_with_character(api_client, user_factory):
+    user = user_factory()
+    Character.objects.create(user=user, current_hp=7, max_hp=10)
+    api_client.force_authenticate(user=user)
+    return api_client, user
+
+
+@pytest.mark.django_db
+def test_character_fields(client_with_character):
+    client, _ = client_with_character
+
+    response = client.get(reverse("character-list"), {"fields": "current_hp,max_hp"})
+
+    assert response.status_code == 200
+    assert response.data == [{"current_hp": 7, "max_hp": 10}]
+
+
+@pytest.mark.django_db
+def test_profile_fields(client_with_character):
+    client, user = client_with_character
+
+    response = client.get(reverse("user-me"), {"fields": "username"})
+
+    assert response.status_code == 200
+    assert response.data == {"username": user.username}
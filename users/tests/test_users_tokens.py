@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from users.tasks import prune_expired_tokens
+from users.tokens import revoke_user_tokens
+
+
+def _tokens(user, count, expires_in=timedelta(days=1), prefix="t"):
+    expires_at = timezone.now() + expires_in
+    return OutstandingToken.objects.bulk_create(
+        [
+            OutstandingToken(
+                user=user, jti=f"{prefix}{user.pk}-{i}", token="x", expires_at=expires_at
+            )
+            for i in range(count)
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_revoke_blacklists_valid_tokens_in_constant_queries(user_factory):
+    user = user_factory()
+    other = user_factory(username="other", email="other@example.com")
+    valid = _tokens(user, 50)
+    _tokens(user, 5, expires_in=-timedelta(days=1), prefix="old")
+    BlacklistedToken.objects.create(token=valid[0])
+    _tokens(other, 3)
+
+    with CaptureQueriesContext(connection) as context:
+        revoked = revoke_user_tokens(user, batch_size=20)
+
+    assert revoked == 49
+    assert len(context.captured_queries) == 1 + 3  # SELECT + 3 INSERT batches
+    assert set(BlacklistedToken.objects.values_list("token_id", flat=True)) == {
+        token.pk for token in valid
+    }
+
+
+@pytest.mark.django_db
+def test_revoke_is_idempotent(user_factory):
+    user = user_factory()
+    _tokens(user, 3)
+
+    assert revoke_user_tokens(user) == 3
+    assert revoke_user_tokens(user) == 0
+    assert BlacklistedToken.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_prune_deletes_expired_tokens_in_batches(user_factory):
+    user = user_factory()
+    expired = _tokens(user, 7, expires_in=-timedelta(minutes=1), prefix="old")
+    valid = _tokens(user, 2)
+    BlacklistedToken.objects.bulk_create(
+        [BlacklistedToken(token=expired[0]), BlacklistedToken(token=valid[0])]
+    )
+
+    assert prune_expired_tokens(batch_size=3) == 7
+
+    assert set(OutstandingToken.objects.values_list("pk", flat=True)) == {t.pk for t in valid}
+    assert list(BlacklistedToken.objects.values_list("token_id", flat=True)) == [valid[0].pk]
+    assert prune_expired_tokens() == 0
+
+
+@pytest.mark.django_db
+def test_change_password_revokes_all_tokens(api_client, user_factory):
+    user = user_factory()
+    _tokens(user, 4)
+    api_client.force_authenticate(user=user)
+
+    response = api_client.post(
+        reverse("change-password"),
+        {
+            "old_password": "StrongPass123!",
+            "new_password1": "EvenStronger456!",
+            "new_password2": "EvenStronger456!",
+        },
+        format="json",
+    )
+
+    assert response.status_code == 204
+    assert BlacklistedToken.objects.filter(token__user=user).count() == 4
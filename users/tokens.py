@@ -0,0 +1,43 @@
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.blacklist_filter import blacklist_filter, filter_enabled
+
+REVOKE_BATCH_SIZE = 1000
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    RefreshToken whose blacklist check asks the database only when the JTI may be
+    blacklisted according to `blacklist_filter`, if filter_enabled(); otherwise it
+    always asks the database.
+    """
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if not filter_enabled() or blacklist_filter.might_contain(jti):
+            super().check_blacklist()
+
+
+def revoke_user_tokens(user, batch_size=REVOKE_BATCH_SIZE):
+    """
+    Blacklist every refresh token of `user` that is still valid, e.g. after a password
+    change. The tokens to revoke are read with one anti-join query (unexpired and not
+    blacklisted yet) and inserted with bulk_create; ignore_conflicts makes a token
+    blacklisted concurrently (logout, rotation) a no-op instead of an error. Returns
+    the number of tokens revoked.
+    """
+    pending = list(
+        OutstandingToken.objects.filter(
+            user=user, expires_at__gt=timezone.now(), blacklistedtoken__isnull=True
+        )
+        .order_by()
+        .values_list("pk", "jti")
+    )
+    revoked = [BlacklistedToken(token_id=pk) for pk, _ in pending]
+    BlacklistedToken.objects.bulk_create(revoked, batch_size=batch_size, ignore_conflicts=True)
+    # bulk_create sends no post_save, so the filter is updated here
+    blacklist_filter.add(*(jti for _, jti in pending))
+    return len(revoked)
@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from habit_tracker_rpg.caches import is_shared_cache
+
+
+def _shared_key(user_id):
+    return f"users:auth-user:{user_id}"
+
+
+class LocalUserCache:
+    """
+    Per-process LRU of user rows with a TTL.
+
+    Holds at most `max_size` entries; an entry older than `ttl` seconds is treated
+    as missing. The TTL bounds how long another process may keep serving a user
+    after they were changed, since only the local process and the shared cache are
+    invalidated directly.
+    """
+
+    def __init__(self, max_size=1024, ttl=30.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_user_cache = LocalUserCache(
+    max_size=getattr(settings, "AUTH_USER_CACHE_SIZE", 1024),
+    ttl=getattr(settings, "AUTH_USER_CACHE_LOCAL_TTL", 30.0),
+)
+
+
+def _row(user):
+    """Concrete field values of a user, as stored in both cache tiers."""
+    return {field.attname: getattr(user, field.attname) for field in user._meta.concrete_fields}
+
+
+def _build(row):
+    """A new User instance on every call, so requests never share (and mutate) one object."""
+    User = get_user_model()
+    return User.from_db("default", list(row), list(row.values()))
+
+
+def get_cached_user(user_id):
+    """
+    The user with primary key `user_id`, from the process-local LRU, then the shared
+    cache, then the database (filling both tiers on the way back). Returns None if
+    the user does not exist.
+
+    The shared tier is skipped when the cache backend is per-process (LocMem, dummy),
+    since other processes could not invalidate it. The row may be up to the local TTL
+    old: use it to authenticate, and reload the user before writing to it.
+    """
+    User = get_user_model()
+    user_id = User._meta.pk.to_python(user_id)  # tokens carry the id as a string
+    row = local_user_cache.get(user_id)
+    if row is None:
+        shared = is_shared_cache()
+        row = cache.get(_shared_key(user_id)) if shared else None
+        if row is None:
+            user = User.objects.filter(pk=user_id).first()
+            if user is None:
+                return None
+            row = _row(user)
+            if shared:
+                timeout = getattr(settings, "AUTH_USER_CACHE_TTL", 300)
+                cache.set(_shared_key(user_id), row, timeout)
+        local_user_cache.set(user_id, row)
+    return _build(row)
+
+
+def _invalidate(user_ids):
+    local_user_cache.delete(*user_ids)
+    cache.delete_many([_shared_key(user_id) for user_id in user_ids])
+
+
+def invalidate_cached_users(*user_ids):
+    """
+    Drop these users from both cache tiers, e.g. after a password change, a profile
+    update or a deactivation. Inside a transaction they are dropped again after
+    commit, so a request that re-read the old row before the commit can't keep it.
+    """
+    user_ids = set(user_ids)
+    _invalidate(user_ids)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _invalidate(user_ids))
@@ -5,15 +5,16 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
-from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework.generics import RetrieveAPIView, UpdateAPIView
 
 
+from users.data_version import DataVersionETagMixin
 from users.models import User
+from users.tokens import FilteredRefreshToken, revoke_user_tokens
 from users.serializers import (
     ChangePasswordSerializer,
+    RefreshSerializer,
     UserCreateSerializer,
     UserReadSerializer,
     UserUpdateSerializer,
@@ -39,12 +40,13 @@ class LoginView(TokenObtainPairView):
 
 class RefreshView(TokenRefreshView):
     """View for refreshing access token using a refresh token."""
+    serializer_class = RefreshSerializer
     throttle_classes = [ScopedRateThrottle]
     throttle_scope = "refresh"
 
 
-class MeView(RetrieveAPIView):
-    """Returns data for the currently authenticated user."""
+class MeView(DataVersionETagMixin, RetrieveAPIView):
+    """Returns data for the currently authenticated user (supports If-None-Match)."""
     serializer_class = UserReadSerializer
     permission_classes = [IsAuthenticated]
 
@@ -59,7 +61,8 @@ class ProfileUpdateView(UpdateAPIView):
     parser_classes = [MultiPartParser, FormParser]
 
     def get_object(self):
-        return self.request.user
+        # request.user comes from the auth cache and may be stale; save() writes every column
+        return User.objects.get(pk=self.request.user.pk)
 
 
 class ChangePasswordView(APIView):
@@ -72,7 +75,8 @@ class ChangePasswordView(APIView):
         serializer = ChangePasswordSerializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
 
-        user = request.user
+        # Fresh row: the cached request.user may still hold an old password or is_active
+        user = User.objects.get(pk=request.user.pk)
         old_password = serializer.validated_data["old_password"]
 
         # Verify old password
@@ -87,12 +91,7 @@ class ChangePasswordView(APIView):
         user.save()
 
         # Blacklist all active tokens (force logout on all devices)
-        tokens = OutstandingToken.objects.filter(user=user)
-        for token in tokens:
-            try:
-                BlacklistedToken.objects.get_or_create(token=token)
-            except Exception:
-                pass  # Ignore already blacklisted tokens
+        revoke_user_tokens(user)
 
         return Response({"detail": "Password changed successfully."}, status=status.HTTP_204_NO_CONTENT)
 
@@ -114,7 +113,7 @@ class LogoutView(APIView):
 
         # Attempt to blacklist the provided refresh token
         try:
-            token = RefreshToken(refresh_token)
+            token = FilteredRefreshToken(refresh_token)
             token.blacklist()
         except Exception:
             return Response(
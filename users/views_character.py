@@ -4,16 +4,19 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.db import transaction
 
+from habit_tracker_rpg.sparse_fields import SparseFieldsetViewMixin
+from users.data_version import DataVersionETagMixin
 from users.models import Character
 from users.serializers import CharacterSerializer
 
 
-class CharacterViewSet(viewsets.ModelViewSet):
+class CharacterViewSet(DataVersionETagMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     ViewSet handling character operations:
     - CRUD for Character model
     - Manual stat allocation
     - Restore HP/Mana
+    - Conditional GET (ETag / If-None-Match) on list and retrieve
     """
     queryset = Character.objects.all()
     serializer_class = CharacterSerializer